@@ -8,6 +8,8 @@ class Settings:
         
         self.game_config = self._load_json('game_config.json')
         self.graphics_config = self._load_json('graphics.json')
+        # Манифест ресурсов для загрузки при старте: имя файла -> обязателен ли он
+        self.asset_manifest = self._load_json('assets.json')
         
         # Быстрый доступ к настройкам
         self.WIDTH = self.game_config['game']['width']
@@ -0,0 +1,269 @@
+import random
+import zlib
+import numpy as np
+from src.core.minesweeper import EVENT_REVEAL, EVENT_FLAG, EVENT_EXPLODE
+
+# Бесконечное поле для режима "endless". Без pygame, как и MinesweeperCore, и с теми же событиями.
+#
+# Поле хранится кусками CHUNK x CHUNK клеток. Мины куска - чистая функция (зерно мира, cx, cy),
+# поэтому сам кусок создается только когда его касается открытие или камера, а выброшенный
+# кусок без действий игрока просто генерируется заново. Дальние куски, где игрок что-то
+# открыл или пометил, сжимаются (packbits + zlib) и распаковываются при возвращении.
+#
+# Координаты клеток - целые (row, col) без границ, в том числе отрицательные.
+
+CHUNK = 32
+# Заливка открывает не больше MAX_FLOOD клеток за вызов; недоделанная часть остается в flood_stack
+# и продолжается в следующих кадрах (continue_flood). При малой плотности мин пустые области могут
+# быть бесконечными, поэтому один клик открывает сам не больше MAX_CASCADE клеток; дальше заливку
+# продолжает клик по любой открытой пустой клетке
+MAX_FLOOD = 1000 # ~10 мс: заливка идет по кадрам, не задерживая их
+MAX_CASCADE = 200000
+
+class _Chunk:
+    __slots__ = ('mines', 'counts', 'open', 'flagged')
+
+    def __init__(self, mines, counts):
+        self.mines = mines
+        self.counts = counts
+        self.open = np.zeros((CHUNK, CHUNK), dtype=bool)
+        self.flagged = np.zeros((CHUNK, CHUNK), dtype=bool)
+
+    @property
+    def touched(self):
+        return self.open.any() or self.flagged.any()
+
+class EndlessCore:
+    def __init__(self, density=0.15, seed=None):
+        self.density = density
+        self.seed = seed if seed is not None else random.randrange(2**32)
+        # Совместимость с MinesweeperCore: у бесконечного поля нет размеров и числа мин
+        self.rows = None
+        self.cols = None
+        self.total_mines = None
+
+        self.game_over = False
+        self.win = False # Бесконечное поле нельзя пройти, только проиграть
+        self.first_click = True
+        self.flags_placed = 0
+        self.opened = 0
+        self.events = []
+        self.flood_stack = [] # Клетки недоделанной заливки (мировые координаты)
+        self._cascade_left = 0 # Сколько еще клеток заливка может открыть без нового клика
+
+        self.safe_cell = None # Первый клик: вокруг него мин нет
+        self.chunks = {} # (cy, cx) -> _Chunk
+        self.packed = {} # (cy, cx) -> сжатые open/flagged выгруженного куска
+
+    def pop_events(self):
+        events = self.events
+        self.events = []
+        return events
+
+    # --- Куски ---
+
+    def _generate_mines(self, cy, cx):
+        # Детерминированно из зерна мира и координат куска (смещение делает их неотрицательными)
+        rng = np.random.default_rng([self.seed, cy + 2**31, cx + 2**31])
+        mines = rng.random((CHUNK, CHUNK)) < self.density
+        if self.safe_cell is not None:
+            row, col = self.safe_cell
+            r0, c0 = cy * CHUNK, cx * CHUNK
+            sr0, sr1 = max(row - 1 - r0, 0), min(row + 2 - r0, CHUNK)
+            sc0, sc1 = max(col - 1 - c0, 0), min(col + 2 - c0, CHUNK)
+            if sr0 < sr1 and sc0 < sc1:
+                mines[sr0:sr1, sc0:sc1] = False
+        return mines
+
+    def _build_chunk(self, cy, cx):
+        # Цифры считаются по окну 34x34: мины куска и крайние клетки восьми соседей
+        window = np.zeros((CHUNK + 2, CHUNK + 2), dtype=np.uint8)
+        for dy in (-1, 0, 1):
+            for dx in (-1, 0, 1):
+                mines = self._generate_mines(cy + dy, cx + dx)
+                rs = slice(1, CHUNK + 1) if dy == 0 else (slice(0, 1) if dy < 0 else slice(CHUNK + 1, CHUNK + 2))
+                cs = slice(1, CHUNK + 1) if dx == 0 else (slice(0, 1) if dx < 0 else slice(CHUNK + 1, CHUNK + 2))
+                src_r = slice(None) if dy == 0 else (slice(CHUNK - 1, CHUNK) if dy < 0 else slice(0, 1))
+                src_c = slice(None) if dx == 0 else (slice(CHUNK - 1, CHUNK) if dx < 0 else slice(0, 1))
+                window[rs, cs] = mines[src_r, src_c]
+        mines = window[1:-1, 1:-1].astype(bool)
+        counts = np.zeros((CHUNK, CHUNK), dtype=np.uint8)
+        for dr in (0, 1, 2):
+            for dc in (0, 1, 2):
+                if dr == 1 and dc == 1:
+                    continue
+                counts += window[dr:dr + CHUNK, dc:dc + CHUNK]
+        counts[mines] = 0
+        return _Chunk(mines, counts)
+
+    def chunk(self, cy, cx):
+        key = (cy, cx)
+        chunk = self.chunks.get(key)
+        if chunk is None:
+            chunk = self._build_chunk(cy, cx)
+            packed = self.packed.pop(key, None)
+            if packed is not None:
+                state = np.unpackbits(np.frombuffer(zlib.decompress(packed), dtype=np.uint8))
+                state = state[:2 * CHUNK * CHUNK].reshape(2, CHUNK, CHUNK).astype(bool)
+                chunk.open[:] = state[0]
+                chunk.flagged[:] = state[1]
+            self.chunks[key] = chunk
+        return chunk
+
+    @staticmethod
+    def _pack(chunk):
+        return zlib.compress(np.packbits(np.stack((chunk.open, chunk.flagged))).tobytes())
+
+    def export_chunks(self):
+        # Сжатое состояние всех кусков с действиями игрока (для сохранения партии)
+        packed = dict(self.packed)
+        for key, chunk in self.chunks.items():
+            if chunk.touched:
+                packed[key] = self._pack(chunk)
+        return packed
+
+    def import_chunks(self, packed):
+        # Куски распакуются по одному, когда их коснется камера или открытие
+        self.chunks = {}
+        self.packed = dict(packed)
+
+    def trim(self, center_row, center_col, radius):
+        # Куски дальше radius кусков от центра выгружаются: нетронутые - целиком,
+        # с действиями игрока - в сжатом виде
+        cy0, cx0 = center_row // CHUNK, center_col // CHUNK
+        for key in list(self.chunks):
+            cy, cx = key
+            if abs(cy - cy0) <= radius and abs(cx - cx0) <= radius:
+                continue
+            chunk = self.chunks.pop(key)
+            if chunk.touched:
+                self.packed[key] = self._pack(chunk)
+
+    def _cell(self, row, col):
+        chunk = self.chunk(row // CHUNK, col // CHUNK)
+        return chunk, row % CHUNK, col % CHUNK
+
+    # --- Чтение состояния ---
+
+    def tile_ids(self, r0, r1, c0, c1, closed_tile, flag_tile, mine_tile):
+        # Номера плиток атласа для прямоугольника клеток, собранные по кускам
+        ids = np.empty((r1 - r0, c1 - c0), dtype=np.uint8)
+        for cy in range(r0 // CHUNK, (r1 - 1) // CHUNK + 1):
+            for cx in range(c0 // CHUNK, (c1 - 1) // CHUNK + 1):
+                chunk = self.chunk(cy, cx)
+                base_r, base_c = cy * CHUNK, cx * CHUNK
+                lr0, lr1 = max(r0, base_r) - base_r, min(r1, base_r + CHUNK) - base_r
+                lc0, lc1 = max(c0, base_c) - base_c, min(c1, base_c + CHUNK) - base_c
+                window = (slice(lr0, lr1), slice(lc0, lc1))
+                closed = np.where(chunk.flagged[window], flag_tile, closed_tile)
+                opened = np.where(chunk.mines[window], mine_tile, chunk.counts[window])
+                ids[base_r + lr0 - r0:base_r + lr1 - r0, base_c + lc0 - c0:base_c + lc1 - c0] = \
+                    np.where(chunk.open[window], opened, closed)
+        return ids
+
+    def is_open_at(self, row, col):
+        chunk, r, c = self._cell(row, col)
+        return bool(chunk.open[r, c])
+
+    # --- Ходы ---
+
+    def reveal(self, row, col):
+        if self.game_over:
+            return
+        if self.first_click:
+            self.first_click = False
+            self.safe_cell = (row, col)
+            # Уже созданные куски рядом с первым кликом получают мины и цифры без мин вокруг него
+            # (флаги, поставленные до первого клика, сохраняются)
+            cy, cx = row // CHUNK, col // CHUNK
+            for key in [(cy + dy, cx + dx) for dy in (-1, 0, 1) for dx in (-1, 0, 1)]:
+                chunk = self.chunks.get(key)
+                if chunk is not None:
+                    fresh = self._build_chunk(*key)
+                    chunk.mines, chunk.counts = fresh.mines, fresh.counts
+
+        chunk, r, c = self._cell(row, col)
+        if chunk.open[r, c]:
+            if chunk.counts[r, c] == 0 and not chunk.mines[r, c]:
+                # Открытая пустая клетка: продолжаем оборванную заливку (в том числе после загрузки
+                # сохранения, где ее стека уже нет) от этой клетки и от запомненного края
+                self.flood_stack.extend((row + dr, col + dc) for dr in (-1, 0, 1) for dc in (-1, 0, 1)
+                                        if dr or dc)
+                self._cascade_left = MAX_CASCADE
+                self.continue_flood()
+            return
+        if chunk.flagged[r, c]:
+            return
+
+        if chunk.mines[r, c]:
+            chunk.open[r, c] = True
+            self.game_over = True
+            self.flood_stack = []
+            self.events.append((EVENT_EXPLODE, row, col))
+            self.reveal_all_mines()
+        elif chunk.counts[r, c] == 0:
+            self._flood_fill(row, col)
+        else:
+            chunk.open[r, c] = True
+            self.opened += 1
+            self.events.append((EVENT_REVEAL, row, row + 1, col, col + 1, 1))
+
+    def _flood_fill(self, row, col):
+        self.flood_stack.append((row, col))
+        self._cascade_left = MAX_CASCADE
+        self.continue_flood()
+
+    def continue_flood(self):
+        # Итеративная заливка в мировых координатах: границы кусков для нее не существуют.
+        # Открывает не больше MAX_FLOOD клеток; возвращает True, если заливка еще не закончена
+        stack = self.flood_stack
+        if not stack or self._cascade_left <= 0 or self.game_over:
+            return False
+        row, col = stack[-1]
+        r0, r1, c0, c1 = row, row + 1, col, col + 1
+        opened = 0
+        budget = min(MAX_FLOOD, self._cascade_left)
+        while stack and opened < budget:
+            r, c = stack.pop()
+            chunk, lr, lc = self._cell(r, c)
+            if chunk.open[lr, lc] or chunk.flagged[lr, lc]:
+                continue
+            chunk.open[lr, lc] = True
+            opened += 1
+            r0, r1 = min(r0, r), max(r1, r + 1)
+            c0, c1 = min(c0, c), max(c1, c + 1)
+            if chunk.counts[lr, lc] == 0:
+                for nr in (r - 1, r, r + 1):
+                    for nc in (c - 1, c, c + 1):
+                        if nr != r or nc != c:
+                            stack.append((nr, nc))
+        self.opened += opened
+        self._cascade_left -= opened
+        if opened:
+            self.events.append((EVENT_REVEAL, r0, r1, c0, c1, opened))
+        return bool(stack) and self._cascade_left > 0
+
+    def toggle_flag(self, row, col):
+        if self.game_over:
+            return
+        chunk, r, c = self._cell(row, col)
+        if chunk.open[r, c]:
+            return
+        flagged = not chunk.flagged[r, c]
+        chunk.flagged[r, c] = flagged
+        self.flags_placed += 1 if flagged else -1
+        self.events.append((EVENT_FLAG, row, col, flagged))
+
+    def reveal_all_mines(self):
+        # Показываем мины только в загруженных кусках - остальное поле бесконечно
+        if not self.chunks:
+            return
+        for chunk in self.chunks.values():
+            chunk.open |= chunk.mines
+        cys = [cy for cy, _ in self.chunks]
+        cxs = [cx for _, cx in self.chunks]
+        self.events.append((EVENT_REVEAL, min(cys) * CHUNK, (max(cys) + 1) * CHUNK,
+                            min(cxs) * CHUNK, (max(cxs) + 1) * CHUNK, 0))
+
+    def check_win(self):
+        pass
@@ -0,0 +1,265 @@
+import random
+import numpy as np
+
+# Чистая логика сапера: расстановка мин, открытие, флаги, победа и проигрыш.
+# Не зависит от pygame, настроек и ресурсов, поэтому доски можно создавать и
+# проигрывать в рабочих процессах без SDL. Отрисовка и звук - в Board и GameScene,
+# которые читают события из pop_events().
+
+# События ядра (кортежи, первый элемент - тип)
+EVENT_REVEAL = 'reveal'   # ('reveal', r0, r1, c0, c1, opened) - открыт диапазон клеток
+EVENT_FLAG = 'flag'       # ('flag', row, col, flagged)
+EVENT_EXPLODE = 'explode' # ('explode', row, col) - открыта мина
+EVENT_WIN = 'win'         # ('win',)
+
+CAMPAIGN_MAX_LEVEL = 10
+
+def campaign_level(level):
+    # Прогрессия кампании: начинаем с малого, увеличиваем/усложняем
+    rows = 5 + level * 2
+    cols = 5 + level * 2
+    mines = int(rows * cols * 0.15) # 15% мин
+    return rows, cols, mines
+
+def label_regions(mask):
+    # Разметка связных (с диагоналями) областей маски: (метки 1..n, 0 - вне маски; границы областей).
+    # Границы - массив (n + 1, 4): r0, r1, c0, c1 каждой метки (концы не включены).
+    # Работаем с горизонтальными отрезками, а не с клетками: их намного меньше.
+    rows, cols = mask.shape
+    edges = np.diff(np.pad(mask, ((0, 0), (1, 1))).astype(np.int8), axis=1)
+    run_rows, run_starts = np.nonzero(edges == 1)
+    _, run_ends = np.nonzero(edges == -1)
+    n = len(run_rows)
+    if n == 0:
+        return np.zeros((rows, cols), dtype=np.int32), np.zeros((1, 4), dtype=np.int32)
+
+    parent = list(range(n))
+
+    def find(i):
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    # Отрезки соседних строк связаны, если пересекаются с учетом диагонали (концы не включены)
+    starts = run_starts.tolist()
+    ends = run_ends.tolist()
+    row_first = np.searchsorted(run_rows, np.arange(rows + 1)).tolist()
+    for r in range(rows - 1):
+        i, i_end = row_first[r], row_first[r + 1]
+        j, j_end = row_first[r + 1], row_first[r + 2]
+        while i < i_end and j < j_end:
+            if starts[i] <= ends[j] and starts[j] <= ends[i]:
+                a, b = find(i), find(j)
+                if a != b:
+                    parent[b] = a
+            if ends[i] < ends[j]:
+                i += 1
+            else:
+                j += 1
+
+    roots = [find(i) for i in range(n)]
+    _, run_labels = np.unique(roots, return_inverse=True)
+    run_labels = run_labels.astype(np.int32) + 1
+
+    labels = np.zeros((rows, cols), dtype=np.int32)
+    labels[mask] = np.repeat(run_labels, run_ends - run_starts)
+
+    # Границы каждой области: r0, r1, c0, c1 (концы не включены)
+    count = int(run_labels.max()) + 1
+    bounds = np.zeros((count, 4), dtype=np.int32)
+    bounds[:, 0] = rows
+    bounds[:, 2] = cols
+    np.minimum.at(bounds[:, 0], run_labels, run_rows)
+    np.maximum.at(bounds[:, 1], run_labels, run_rows + 1)
+    np.minimum.at(bounds[:, 2], run_labels, run_starts)
+    np.maximum.at(bounds[:, 3], run_labels, run_ends)
+    return labels, bounds
+
+def _grow(mask):
+    # Маска вместе с 8 соседями каждой клетки, в тех же границах
+    h, w = mask.shape
+    padded = np.zeros((h + 2, w + 2), dtype=bool)
+    for dr in (0, 1, 2):
+        for dc in (0, 1, 2):
+            padded[dr:dr + h, dc:dc + w] |= mask
+    return padded[1:-1, 1:-1]
+
+class MinesweeperCore:
+    def __init__(self, rows, cols, mines, seed=None):
+        self.rows = rows
+        self.cols = cols
+        self.total_mines = mines
+        # Зерно расстановки: одна и та же пара (seed, первый клик) дает одну и ту же доску
+        self.seed = seed if seed is not None else random.randrange(2**32)
+
+        self.game_over = False
+        self.win = False
+        self.first_click = True
+        self.flags_placed = 0
+        self.events = []
+
+        # Состояние хранится в компактных сетках
+        shape = (rows, cols)
+        self.is_mine = np.zeros(shape, dtype=bool)
+        self.is_open = np.zeros(shape, dtype=bool)
+        self.is_flagged = np.zeros(shape, dtype=bool)
+        self.neighbor_mines = np.zeros(shape, dtype=np.uint8)
+        # Метки связных областей нулевых клеток (0 - не нулевая клетка)
+        self.zero_labels = np.zeros(shape, dtype=np.int32)
+        self._region_bounds = np.zeros((1, 4), dtype=np.int32)
+        # Счетчики для проверки победы без обхода всей доски
+        self.safe_cells_left = rows * cols - mines
+        self.mine_positions = np.zeros(0, dtype=np.intp) # плоские индексы мин
+        # Первый клик: вместе с зерном полностью задает расстановку мин
+        self.safe_cell = None
+        self._labels_stale = False # Метки нулевых областей нужно пересчитать перед заливкой
+
+    def pop_events(self):
+        events = self.events
+        self.events = []
+        return events
+
+    def place_mines(self, safe_row, safe_col, label=True):
+        # Безопасная стартовая клетка и ее соседи (плоские индексы по возрастанию)
+        safe = np.array([r * self.cols + c
+                         for r in range(max(0, safe_row - 1), min(self.rows, safe_row + 2))
+                         for c in range(max(0, safe_col - 1), min(self.cols, safe_col + 2))], dtype=np.intp)
+        allowed = self.rows * self.cols - len(safe)
+        # Если мин больше, чем свободных клеток, ставим сколько помещается
+        count = min(self.total_mines, allowed)
+
+        # Один проход выборки без повторов среди разрешенных клеток (частичное перемешивание),
+        # затем номера сдвигаются через безопасную зону
+        rng = np.random.default_rng(self.seed)
+        picks = rng.choice(allowed, size=count, replace=False).astype(np.intp)
+        picks += np.searchsorted(safe - np.arange(len(safe)), picks, side='right')
+        picks.sort()
+
+        self.total_mines = count
+        self.is_mine.reshape(-1)[picks] = True
+        self.mine_positions = picks
+        self.safe_cells_left = self.rows * self.cols - len(self.mine_positions)
+        self.first_click = False
+        self.safe_cell = (safe_row, safe_col)
+
+        self._compute_neighbor_counts()
+        if label:
+            self._label_zero_regions()
+        else:
+            self._labels_stale = True
+
+    def load_state(self, is_mine, is_open, is_flagged):
+        # Восстановление сохраненной партии. Метки нулевых областей - самая дорогая часть
+        # подготовки, поэтому они считаются при первой заливке, а не при загрузке.
+        self.is_mine = is_mine
+        self.is_open = is_open
+        self.is_flagged = is_flagged
+        self.mine_positions = np.flatnonzero(is_mine)
+        self.total_mines = len(self.mine_positions)
+        self.flags_placed = int(np.count_nonzero(is_flagged))
+        self.safe_cells_left = self.rows * self.cols - self.total_mines - int(np.count_nonzero(is_open & ~is_mine))
+        self.first_click = False
+        self._compute_neighbor_counts()
+        self._labels_stale = True
+
+    def _compute_neighbor_counts(self):
+        # Подсчет соседей за один векторизованный проход: сумма 8 сдвигов сетки мин
+        padded = np.zeros((self.rows + 2, self.cols + 2), dtype=np.uint8)
+        padded[1:-1, 1:-1] = self.is_mine
+        counts = np.zeros((self.rows, self.cols), dtype=np.uint8)
+        for dr in (0, 1, 2):
+            for dc in (0, 1, 2):
+                if dr == 1 and dc == 1:
+                    continue
+                counts += padded[dr:dr + self.rows, dc:dc + self.cols]
+        counts[self.is_mine] = 0
+        self.neighbor_mines = counts
+
+    def _label_zero_regions(self):
+        # Размечаем связные (с диагоналями) области нулевых клеток один раз после расстановки мин,
+        # чтобы открытие области было одной операцией над маской
+        zero = (self.neighbor_mines == 0) & ~self.is_mine
+        self.zero_labels, self._region_bounds = label_regions(zero)
+
+    def count_neighbors(self, row, col):
+        r0, r1 = max(0, row - 1), min(self.rows, row + 2)
+        c0, c1 = max(0, col - 1), min(self.cols, col + 2)
+        return int(np.count_nonzero(self.is_mine[r0:r1, c0:c1]))
+
+    def reveal(self, row, col):
+        if self.game_over or self.is_open[row, col] or self.is_flagged[row, col]:
+            return
+
+        if self.first_click:
+            self.place_mines(row, col)
+
+        if self.is_mine[row, col]:
+            self.game_over = True
+            self.win = False
+            self.events.append((EVENT_EXPLODE, row, col))
+            self.reveal_all_mines()
+        elif self.neighbor_mines[row, col] == 0:
+            # Заливка (открытие пустых областей)
+            self._open_region(row, col)
+        else:
+            self.is_open[row, col] = True
+            self.safe_cells_left -= 1
+            self.events.append((EVENT_REVEAL, row, row + 1, col, col + 1, 1))
+
+        self.check_win()
+
+    def _open_region(self, row, col):
+        # Открывает размеченную нулевую область вместе с ее границей из цифр
+        if self._labels_stale:
+            self._label_zero_regions()
+            self._labels_stale = False
+        label = self.zero_labels[row, col]
+        r0, r1, c0, c1 = (int(v) for v in self._region_bounds[label])
+        # Окно - область с рамкой в одну клетку, обрезанное по краям доски
+        wr0, wr1 = max(0, r0 - 1), min(self.rows, r1 + 1)
+        wc0, wc1 = max(0, c0 - 1), min(self.cols, c1 + 1)
+        region = self.zero_labels[wr0:wr1, wc0:wc1] == label
+        grown = _grow(region)
+
+        # Флажки не открываются. Флажок на нулевой клетке к тому же останавливает заливку,
+        # как при обходе по клеткам: область без флажков размечается заново, и открывается
+        # только часть, связанная с нажатой клеткой
+        flags = self.is_flagged[wr0:wr1, wc0:wc1]
+        if (grown & flags).any():
+            if (region & flags).any():
+                labels, _ = label_regions(region & ~flags)
+                region = labels == labels[row - wr0, col - wc0]
+                grown = _grow(region)
+            grown &= ~flags
+
+        window = self.is_open[wr0:wr1, wc0:wc1]
+        opened = int(np.count_nonzero(grown & ~window))
+        self.safe_cells_left -= opened
+        window |= grown
+        self.events.append((EVENT_REVEAL, wr0, wr1, wc0, wc1, opened))
+
+    def toggle_flag(self, row, col):
+        if self.game_over or self.is_open[row, col]:
+            return
+        flagged = not self.is_flagged[row, col]
+        self.is_flagged[row, col] = flagged
+        if flagged:
+            self.flags_placed += 1
+        else:
+            self.flags_placed -= 1
+        self.events.append((EVENT_FLAG, row, col, flagged))
+
+    def reveal_all_mines(self):
+        # Открываем только известные позиции мин, без обхода всей сетки
+        self.is_open.reshape(-1)[self.mine_positions] = True
+        self.events.append((EVENT_REVEAL, 0, self.rows, 0, self.cols, len(self.mine_positions)))
+
+    def check_win(self):
+        if self.game_over:
+            return
+
+        if self.safe_cells_left == 0:
+            self.game_over = True
+            self.win = True
+            self.events.append((EVENT_WIN,))
@@ -0,0 +1,304 @@
+import math
+import random
+import time
+import numpy as np
+
+# Автоматический решатель для MinesweeperCore (Board.core).
+# Видит только то, что видит игрок: открытые клетки и их цифры. Мины, найденные решателем,
+# хранятся у него, а не флагами в ядре, чтобы не мешать быстрой заливке областей.
+#
+# Порядок рассуждений на каждом ходе:
+#   1. Одиночные правила: у цифры осталось 0 мин - все закрытые соседи безопасны;
+#      мин осталось столько же, сколько закрытых соседей, - все они мины.
+#   2. Подмножества: для двух пересекающихся ограничений разность множеств дает
+#      новые безопасные клетки и мины.
+#   3. Перебор: точный перебор расстановок в небольших связных частях фронтира
+#      дает вероятность мины для каждой клетки (0 и 1 - тоже выводы, а не догадки).
+#   4. Догадка: открывается клетка с наименьшей вероятностью мины.
+
+MAX_ENUM_CELLS = 24      # Части фронтира крупнее перебираются только локальной оценкой
+MAX_ENUM_NODES = 200000  # Ограничение шагов перебора на одну часть
+
+class Solver:
+    def __init__(self, core, seed=None):
+        self.core = core
+        self.rows = core.rows
+        self.cols = core.cols
+        self.rng = random.Random(seed)
+        self.known_mines = set() # плоские индексы
+        self.guesses = 0
+        self.moves = 0
+
+    def _neighbors(self, index):
+        row, col = divmod(index, self.cols)
+        result = []
+        for r in range(max(0, row - 1), min(self.rows, row + 2)):
+            for c in range(max(0, col - 1), min(self.cols, col + 2)):
+                if r != row or c != col:
+                    result.append(r * self.cols + c)
+        return result
+
+    def _constraints(self):
+        # Ограничения фронтира: (множество закрытых неизвестных соседей, сколько среди них мин)
+        is_open = self.core.is_open.reshape(-1)
+        numbers = self.core.neighbor_mines.reshape(-1)
+        closed = ~self.core.is_open
+        # Только открытые клетки, рядом с которыми есть закрытые
+        border = np.zeros_like(closed)
+        border[:-1] |= closed[1:]
+        border[1:] |= closed[:-1]
+        border[:, :-1] |= closed[:, 1:]
+        border[:, 1:] |= closed[:, :-1]
+        border[:-1, :-1] |= closed[1:, 1:]
+        border[1:, 1:] |= closed[:-1, :-1]
+        border[:-1, 1:] |= closed[1:, :-1]
+        border[1:, :-1] |= closed[:-1, 1:]
+        border &= self.core.is_open
+
+        constraints = []
+        for index in border.reshape(-1).nonzero()[0].tolist():
+            unknown = []
+            mines = int(numbers[index])
+            for n in self._neighbors(index):
+                if is_open[n]:
+                    continue
+                if n in self.known_mines:
+                    mines -= 1
+                else:
+                    unknown.append(n)
+            if unknown:
+                constraints.append((frozenset(unknown), mines))
+        return constraints
+
+    def _deduce(self, constraints):
+        # Одиночные правила и правило подмножеств; возвращает (безопасные, мины)
+        safe, mines = set(), set()
+        for cells, count in constraints:
+            if count == 0:
+                safe |= cells
+            elif count == len(cells):
+                mines |= cells
+        if safe or mines:
+            return safe, mines
+
+        # Пары ограничений, у которых есть общие клетки
+        by_cell = {}
+        for i, (cells, _) in enumerate(constraints):
+            for cell in cells:
+                by_cell.setdefault(cell, []).append(i)
+        for i, (a, count_a) in enumerate(constraints):
+            partners = set()
+            for cell in a:
+                partners.update(by_cell[cell])
+            for j in partners:
+                if j == i:
+                    continue
+                b, count_b = constraints[j]
+                only_b = b - a
+                if not only_b:
+                    continue
+                only_a = a - b
+                # В b\a не меньше count_b - count_a мин; если это все клетки b\a - они мины, а a\b пуста от мин
+                if count_b - count_a == len(only_b):
+                    mines |= only_b
+                    safe |= only_a
+                elif a <= b and count_b == count_a:
+                    safe |= only_b
+        return safe - mines, mines
+
+    def _components(self, constraints):
+        # Связные части фронтира: ограничения, связанные общими клетками
+        parent = list(range(len(constraints)))
+
+        def find(i):
+            while parent[i] != i:
+                parent[i] = parent[parent[i]]
+                i = parent[i]
+            return i
+
+        owner = {}
+        for i, (cells, _) in enumerate(constraints):
+            for cell in cells:
+                if cell in owner:
+                    a, b = find(owner[cell]), find(i)
+                    if a != b:
+                        parent[b] = a
+                else:
+                    owner[cell] = i
+        groups = {}
+        for i in range(len(constraints)):
+            groups.setdefault(find(i), []).append(constraints[i])
+        return list(groups.values())
+
+    def _enumerate(self, constraints):
+        # Все расстановки мин в части фронтира: {число мин: (количество решений, {клетка: решений с миной})}
+        cells = sorted(set().union(*(c for c, _ in constraints)))
+        if len(cells) > MAX_ENUM_CELLS:
+            return None
+        position = {cell: i for i, cell in enumerate(cells)}
+        # Для каждого ограничения - номера его клеток; для каждой клетки - ее ограничения
+        cons = [([position[c] for c in cs], count) for cs, count in constraints]
+        cell_cons = [[] for _ in cells]
+        for k, (members, _) in enumerate(cons):
+            for m in members:
+                cell_cons[m].append(k)
+        # Сколько клеток ограничения еще не назначено и сколько мин уже поставлено
+        left = [len(members) for members, _ in cons]
+        placed = [0] * len(cons)
+        assignment = [0] * len(cells)
+        results = {}
+        nodes = 0
+
+        def backtrack(i, total):
+            nonlocal nodes
+            nodes += 1
+            if nodes > MAX_ENUM_NODES:
+                raise OverflowError
+            if i == len(cells):
+                count, hits = results.get(total, (0, [0] * len(cells)))
+                for m in range(len(cells)):
+                    hits[m] += assignment[m]
+                results[total] = (count + 1, hits)
+                return
+            for value in (0, 1):
+                ok = True
+                for k in cell_cons[i]:
+                    need = cons[k][1] - placed[k] - value
+                    if need < 0 or need > left[k] - 1:
+                        ok = False
+                        break
+                if not ok:
+                    continue
+                assignment[i] = value
+                for k in cell_cons[i]:
+                    placed[k] += value
+                    left[k] -= 1
+                backtrack(i + 1, total + value)
+                for k in cell_cons[i]:
+                    placed[k] -= value
+                    left[k] += 1
+            assignment[i] = 0
+
+        try:
+            backtrack(0, 0)
+        except OverflowError:
+            return None
+        return cells, results
+
+    def _probabilities(self, constraints):
+        # Вероятности мин для догадки и выводы перебора.
+        # Возвращает (вероятности клеток фронтира, безопасные, мины, клетки вне фронтира, их вероятность)
+        mines_left = self.core.total_mines - len(self.known_mines)
+        frontier = set().union(*(c for c, _ in constraints)) if constraints else set()
+        is_open = self.core.is_open.reshape(-1)
+        interior = [i for i in (~is_open).nonzero()[0].tolist()
+                    if i not in frontier and i not in self.known_mines]
+
+        probs = {}
+        safe, mines = set(), set()
+        expected = 0.0
+        exact = True
+        min_frontier = max_frontier = 0
+        for group in self._components(constraints):
+            enumerated = self._enumerate(group)
+            if enumerated is None:
+                # Слишком большая часть: оценка по самому "опасному" ограничению клетки
+                exact = False
+                for cells, count in group:
+                    p = count / len(cells)
+                    for cell in cells:
+                        probs[cell] = max(probs.get(cell, 0.0), p)
+                expected += sum(probs[c] for c in set().union(*(c for c, _ in group)))
+                continue
+            cells, results = enumerated
+            min_frontier += min(results)
+            max_frontier += max(results)
+            # Выводы не зависят от весов: клетка пуста (или заминирована) во всех решениях
+            solutions = sum(count for count, _ in results.values())
+            for m, cell in enumerate(cells):
+                hits = sum(h[m] for _, h in results.values())
+                if hits == 0:
+                    safe.add(cell)
+                elif hits == solutions:
+                    mines.add(cell)
+            # Вес решения с k минами - число способов разместить остальные мины вне фронтира
+            # (части считаются независимыми - это приближение, оно влияет только на выбор догадки)
+            weights = {k: math.comb(len(interior), mines_left - k) if 0 <= mines_left - k <= len(interior) else 0
+                       for k in results}
+            total = sum(results[k][0] * weights[k] for k in results)
+            if total == 0:
+                weights = {k: 1 for k in results}
+                total = solutions
+            for m, cell in enumerate(cells):
+                probs[cell] = sum(results[k][1][m] * weights[k] for k in results) / total
+            expected += sum(k * results[k][0] * weights[k] for k in results) / total
+
+        interior_prob = None
+        if interior:
+            # Вне фронтира от mines_left - max_frontier до mines_left - min_frontier мин
+            if exact and min_frontier == mines_left:
+                safe.update(interior)
+            elif exact and mines_left - max_frontier == len(interior):
+                mines.update(interior)
+            interior_prob = min(1.0, max(0.0, (mines_left - expected) / len(interior)))
+        return probs, safe, mines, interior, interior_prob
+
+    def step(self):
+        # Делает один ход; возвращает False, когда игра закончилась
+        core = self.core
+        if core.game_over:
+            return False
+
+        if core.first_click:
+            # Первый клик всегда безопасен: начинаем с центра
+            self._reveal(self.rows // 2 * self.cols + self.cols // 2)
+            return not core.game_over
+
+        constraints = self._constraints()
+        safe, mines = self._deduce(constraints)
+        if not safe and not mines:
+            probs, safe, mines, interior, interior_prob = self._probabilities(constraints)
+            if not safe:
+                self.known_mines |= mines
+                self.guesses += 1
+                self._reveal(self._pick_guess(probs, interior, interior_prob))
+                return not core.game_over
+
+        self.known_mines |= mines
+        for cell in safe:
+            if core.game_over:
+                break
+            self._reveal(cell)
+        return not core.game_over
+
+    def _pick_guess(self, probs, interior, interior_prob):
+        candidates = [(p, cell) for cell, p in probs.items() if cell not in self.known_mines and p < 1.0]
+        if interior and interior_prob is not None:
+            # Клетки вне фронтира равновероятны: предпочитаем углы (у них чаще ноль)
+            corners = [i for i in interior if self._is_corner(i)]
+            candidates.append((interior_prob, self.rng.choice(corners or interior)))
+        if not candidates:
+            candidates = [(1.0, cell) for cell in probs]
+        best = min(p for p, _ in candidates)
+        return self.rng.choice([cell for p, cell in candidates if p == best])
+
+    def _is_corner(self, index):
+        row, col = divmod(index, self.cols)
+        return row in (0, self.rows - 1) and col in (0, self.cols - 1)
+
+    def _reveal(self, index):
+        row, col = divmod(index, self.cols)
+        self.core.reveal(row, col)
+        self.core.pop_events()
+        self.moves += 1
+
+    def solve(self):
+        start = time.perf_counter()
+        while self.step():
+            pass
+        return {
+            'win': self.core.win,
+            'guesses': self.guesses,
+            'moves': self.moves,
+            'time_ms': (time.perf_counter() - start) * 1000,
+        }
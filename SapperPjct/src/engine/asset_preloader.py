@@ -0,0 +1,107 @@
+import pygame
+import os
+import time
+import queue
+import threading
+from src.config.settings import SETTINGS
+from src.engine.resource_manager import RESOURCES
+from src.engine.perf_monitor import SURFACES
+
+# Предзагрузка ресурсов из манифеста (src/config/assets.json) до первого игрового кадра.
+# Чтение и декодирование файлов - в рабочем потоке; главный поток только забирает готовое,
+# делает convert_alpha (нужен дисплей) и кладет в кэши RESOURCES.
+
+class AssetPreloader:
+    def __init__(self, manifest=None, resources=RESOURCES, audio_ready=None):
+        # audio_ready - событие готовности микшера (Game.audio_ready): звуки грузятся после него
+        self.resources = resources
+        self.audio_ready = audio_ready
+        manifest = manifest if manifest is not None else SETTINGS.asset_manifest
+        audio = SETTINGS.game_config['audio']['enabled']
+
+        # (тип, имя, путь) существующих файлов; отсутствующие необязательные картинки - отдельно,
+        # а вместо отсутствующих необязательных звуков синтезируется замена ('synth')
+        self.tasks = []
+        self.optional_missing = []
+        missing = []
+        groups = [('images', 'images')] + ([('sounds', 'sounds')] if audio else [])
+        for kind, folder in groups:
+            for name, required in manifest.get(kind, {}).items():
+                path = os.path.join(resources.assets_dir, folder, name)
+                if os.path.exists(path):
+                    self.tasks.append((kind, name, path))
+                elif required:
+                    missing.append(os.path.join(folder, name))
+                elif kind == 'sounds':
+                    self.tasks.append(('synth', name, None))
+                else:
+                    self.optional_missing.append(name)
+        if audio:
+            # Последний шаг - все процедурные звуки банка: замена файлу, которого нет в манифесте,
+            # потом не будет синтезироваться посреди партии
+            self.tasks.append(('bank', None, None))
+        if missing:
+            # Сразу при старте, а не посреди партии, когда ресурс впервые понадобится
+            raise FileNotFoundError("Не найдены обязательные ресурсы: " + ", ".join(missing))
+
+        self.total = len(self.tasks)
+        self.done = 0
+        self._results = queue.Queue()
+        self._thread = threading.Thread(target=self._run, name='AssetPreloader', daemon=True)
+
+    def start(self):
+        self._thread.start()
+
+    def _run(self):
+        # Картинки идут первыми (self.tasks), пока микшер еще открывается в фоне
+        for kind, name, path in self.tasks:
+            if kind != 'images':
+                if self.audio_ready is not None:
+                    self.audio_ready.wait()
+                if not pygame.mixer.get_init():
+                    # Звуковое устройство не открылось: игра идет без звука
+                    self._results.put(('bank' if kind == 'bank' else 'sounds', name, None, None))
+                    continue
+            try:
+                if kind == 'images':
+                    data = pygame.image.load(path)
+                elif kind == 'synth':
+                    from src.engine.sound_generator import SOUND_BANK
+                    kind, data = 'sounds', SOUND_BANK.for_file(name)
+                elif kind == 'bank':
+                    from src.engine.sound_generator import SOUND_BANK
+                    SOUND_BANK.preload()
+                    data = None
+                else:
+                    data = pygame.mixer.Sound(path)
+                self._results.put((kind, name, data, None))
+            except (pygame.error, OSError) as e:
+                self._results.put((kind, name, None, e))
+
+    def poll(self, budget_ms=8):
+        # Забирает декодированные ресурсы, пока не выйдет бюджет кадра; ошибка декодирования - исключение
+        deadline = time.perf_counter() + budget_ms / 1000
+        while time.perf_counter() < deadline:
+            try:
+                kind, name, data, error = self._results.get_nowait()
+            except queue.Empty:
+                break
+            if error is not None:
+                raise RuntimeError(f"Не удалось загрузить {name}: {error}")
+            if kind == 'images':
+                self.resources.images[name] = SURFACES.new(data.convert_alpha())
+            elif kind == 'sounds':
+                # data None - звука нет ни на диске, ни в банке (или нет звукового устройства)
+                if data is not None:
+                    data.set_volume(SETTINGS.game_config['audio']['sfx_volume'])
+                self.resources.sounds[name] = data
+            self.done += 1
+        return self.finished
+
+    @property
+    def finished(self):
+        return self.done >= self.total
+
+    @property
+    def progress(self):
+        return self.done / self.total if self.total else 1.0
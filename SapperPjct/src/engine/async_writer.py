@@ -0,0 +1,59 @@
+import os
+import threading
+from collections import deque
+
+def write_atomic(path, data):
+    # Запись целиком или никак: временный файл рядом, затем атомарная замена.
+    # При сбое посреди записи на диске остается прежняя версия файла.
+    directory = os.path.dirname(path)
+    if directory and not os.path.exists(directory):
+        os.makedirs(directory)
+    temp = path + '.tmp'
+    with open(temp, 'wb') as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(temp, path)
+
+class AsyncWriter:
+    # Фоновая запись, чтобы кадр не ждал диска.
+    # call() ставит в очередь произвольную запись (например, в базу); задачи выполняются по порядку.
+    def __init__(self):
+        self._calls = deque() # (функция, аргументы)
+        self._busy = False # Поток сейчас пишет
+        self._condition = threading.Condition()
+        self._thread = None
+
+    def call(self, func, *args):
+        with self._condition:
+            self._calls.append((func, args))
+            self._wake()
+
+    def _wake(self):
+        if self._thread is None:
+            # Поток демон: не держит процесс, а недописанное дописывает flush() при выходе
+            self._thread = threading.Thread(target=self._run, name='AsyncWriter', daemon=True)
+            self._thread.start()
+        self._condition.notify_all()
+
+    def _run(self):
+        while True:
+            with self._condition:
+                while not self._calls:
+                    self._condition.wait()
+                func, args = self._calls.popleft()
+                self._busy = True
+            try:
+                func(*args)
+            except Exception as e:
+                # Ошибка одной записи не должна останавливать поток
+                print(f"Error in background write: {e}")
+            finally:
+                with self._condition:
+                    self._busy = False
+                    self._condition.notify_all()
+
+    def flush(self, timeout=5.0):
+        # Ждет, пока очередь опустеет; возвращает False, если не успели за timeout секунд
+        with self._condition:
+            return self._condition.wait_for(lambda: not self._calls and not self._busy, timeout)
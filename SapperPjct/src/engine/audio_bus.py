@@ -0,0 +1,93 @@
+import pygame
+from src.config.settings import SETTINGS
+from src.engine.resource_manager import RESOURCES
+
+# Приоритеты звуков: более важный звук может занять канал менее важного
+PRIORITY_UI = 0 # Кнопки меню
+PRIORITY_GAME = 1 # Клики по полю
+PRIORITY_OUTCOME = 2 # Взрыв, победа, итог мультиплеера - не теряются никогда
+
+class AudioBus:
+    # Шина звуковых событий. Игровой код только сообщает, что звук нужен (post),
+    # а играет их update() раз в кадр:
+    # - одинаковые события за кадр сливаются в одно (заливка в сотни клеток - один клик);
+    # - один и тот же звук не чаще раза в repeat_ms;
+    # - звуки идут через несколько зарезервированных каналов, которые pygame не отдает
+    #   обычному Sound.play(); если все заняты, вытесняется звук с наименьшим приоритетом.
+    def __init__(self):
+        self.pending = {} # имя файла -> приоритет
+        self.last_played = {} # имя файла -> время последнего запуска (мс)
+        self.channels = None # Создаются при первом update() после открытия микшера
+        self.channel_priority = []
+        # Счетчики: 'posted' - событий, 'played' - запущено, 'merged' - слито в кадре,
+        # 'limited' - отброшено по частоте, 'dropped' - не нашлось канала
+        self.stats = dict.fromkeys(('posted', 'played', 'merged', 'limited', 'dropped'), 0)
+
+    def post(self, name, priority=PRIORITY_GAME):
+        self.stats['posted'] += 1
+        if name in self.pending:
+            self.stats['merged'] += 1
+            priority = max(priority, self.pending[name])
+        self.pending[name] = priority
+
+    def _open_channels(self):
+        count = SETTINGS.game_config['audio'].get('channels', 4)
+        if pygame.mixer.get_num_channels() < count * 2:
+            pygame.mixer.set_num_channels(count * 2)
+        # Каналы 0..count-1 больше не выдаются автоматически другим звукам
+        count = pygame.mixer.set_reserved(count)
+        self.channels = [pygame.mixer.Channel(i) for i in range(count)]
+        self.channel_priority = [PRIORITY_UI] * count
+
+    def update(self):
+        if not self.pending:
+            return
+        pending, self.pending = self.pending, {}
+        if not pygame.mixer.get_init():
+            # Звукового устройства нет (или оно еще открывается) - события просто теряются
+            return
+        if self.channels is None:
+            self._open_channels()
+
+        now = pygame.time.get_ticks()
+        repeat_ms = SETTINGS.game_config['audio'].get('repeat_ms', 60)
+        volume = SETTINGS.game_config['audio']['sfx_volume']
+        # Сначала самые важные: им достаются свободные каналы
+        for name, priority in sorted(pending.items(), key=lambda item: -item[1]):
+            last = self.last_played.get(name)
+            if priority < PRIORITY_OUTCOME and last is not None and now - last < repeat_ms:
+                self.stats['limited'] += 1
+                continue
+            sound = RESOURCES.get_sound(name)
+            if sound is None:
+                continue
+            index = self._find_channel(priority)
+            if index is None:
+                self.stats['dropped'] += 1
+                continue
+            sound.set_volume(volume)
+            self.channels[index].play(sound)
+            self.channel_priority[index] = priority
+            self.last_played[name] = now
+            self.stats['played'] += 1
+
+    def _find_channel(self, priority):
+        # Свободный канал, иначе занятый звуком не важнее этого
+        busy = []
+        for index, channel in enumerate(self.channels):
+            if not channel.get_busy():
+                return index
+            busy.append((self.channel_priority[index], index))
+        if not busy:
+            return None
+        lowest, index = min(busy)
+        return index if lowest <= priority else None
+
+    def music(self, command, *args):
+        # Команда pygame.mixer.music ('stop', 'pause', 'set_volume', ...);
+        # без звукового устройства ничего не делает, а не бросает pygame.error
+        if pygame.mixer.get_init():
+            getattr(pygame.mixer.music, command)(*args)
+
+# Глобальный экземпляр
+AUDIO = AudioBus()
@@ -1,13 +1,24 @@
 import pygame
 import sys
+import time
+import threading
 from src.config.settings import SETTINGS
 from src.engine.state_manager import StateManager
 from src.engine.resource_manager import RESOURCES
+from src.engine.perf_monitor import PerfMonitor
+from src.engine.startup_profile import STARTUP
+from src.engine.audio_bus import AUDIO
+from src.ui.backgrounds import BACKGROUNDS
 
 class Game:
     def __init__(self):
-        pygame.init()
-        pygame.mixer.init()
+        # Только нужные подсистемы вместо pygame.init(): открытие звукового устройства
+        # может занимать сотни мс, поэтому микшер запускается в фоне (см. audio_ready)
+        pygame.display.init()
+        pygame.font.init()
+        pygame.time.wait(0) # Запускает таймер SDL: без него get_ticks() возвращает 0
+        self.audio_ready = threading.Event()
+        threading.Thread(target=self._init_audio, name='AudioInit', daemon=True).start()
         
         self.WIDTH = SETTINGS.WIDTH
         self.HEIGHT = SETTINGS.HEIGHT
@@ -18,19 +29,67 @@ class Game:
         self.running = True
         
         self.state_manager = StateManager(self)
-        self.state_manager = StateManager(self)
+
+        # Режим грязных прямоугольников: обновляем на экране только изменившиеся области
+        self.dirty_rendering = SETTINGS.game_config.get('render', {}).get('dirty_rects', True)
+        self.show_dirty_rects = False # Отладка: подсвечивать обновляемые области (F9)
+        self._dirty_debug = [] # [rect, оставшиеся кадры]
+        # Время фаз последнего кадра в мс: 'events', 'update', 'draw', 'flip'
+        self.frame_times = {}
+        self.perf = PerfMonitor()
+        self.first_frame_ms = None # Время от запуска до первого выведенного кадра
         # Начальное состояние будет установлено в main.py
+
+    def _init_audio(self):
+        try:
+            pygame.mixer.init()
+        except pygame.error as e:
+            print(f"Не удалось открыть звуковое устройство: {e}")
+        finally:
+            self.audio_ready.set()
         
     def run(self):
         while self.running:
             self.clock.tick(SETTINGS.FPS)
-            self._handle_events()
-            self._update()
-            self._draw()
+            self.step()
             
+        self._save_on_exit()
         pygame.quit()
         sys.exit()
         
+    def step(self):
+        # Один кадр игрового цикла с замером времени каждой фазы
+        self.perf.begin_frame()
+        t0 = time.perf_counter()
+        self._handle_events()
+        t1 = time.perf_counter()
+        self._update()
+        AUDIO.update() # Звуки, накопленные за кадр
+        t2 = time.perf_counter()
+        rects = self._draw()
+        t3 = time.perf_counter()
+        self._present(rects)
+        t4 = time.perf_counter()
+        self.frame_times = {
+            'events': (t1 - t0) * 1000,
+            'update': (t2 - t1) * 1000,
+            'draw': (t3 - t2) * 1000,
+            'flip': (t4 - t3) * 1000,
+        }
+        self.perf.end_frame(self.frame_times)
+        if self.first_frame_ms is None:
+            self.first_frame_ms = STARTUP.mark('first_frame')
+        
+    def _save_on_exit(self):
+        # При закрытии окна посреди партии (в том числе из паузы) она сохраняется для CONTINUE
+        from src.engine.save_manager import SAVE_MANAGER
+        scene = self.state_manager.state
+        scene = getattr(scene, 'previous_scene', scene)
+        if hasattr(scene, 'can_save') and scene.can_save():
+            SAVE_MANAGER.save_game(scene)
+        # Дописываем то, что еще в очереди фоновой записи
+        SAVE_MANAGER.flush()
+
     def _handle_events(self):
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
@@ -39,12 +98,15 @@ class Game:
                 self.WIDTH, self.HEIGHT = event.w, event.h
                 SETTINGS.WIDTH, SETTINGS.HEIGHT = event.w, event.h
                 self.screen = pygame.display.set_mode((self.WIDTH, self.HEIGHT), pygame.RESIZABLE)
+                BACKGROUNDS.invalidate()
                 # Уведомляем текущее состояние если нужно
                 if hasattr(self.state_manager.state, 'on_resize'):
                     self.state_manager.state.on_resize(self.WIDTH, self.HEIGHT)
                     
             elif event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_F11:
+                if event.key == pygame.K_F9:
+                    self.toggle_dirty_debug()
+                elif event.key == pygame.K_F11:
                     # Переключение полноэкранного режима
                     is_fullscreen = self.screen.get_flags() & pygame.FULLSCREEN
                     if is_fullscreen:
@@ -57,6 +119,7 @@ class Game:
                     # Обновляем ширину/высоту из поверхности
                     self.WIDTH, self.HEIGHT = self.screen.get_size()
                     SETTINGS.WIDTH, SETTINGS.HEIGHT = self.WIDTH, self.HEIGHT
+                    BACKGROUNDS.invalidate()
                     
                     if hasattr(self.state_manager.state, 'on_resize'):
                         self.state_manager.state.on_resize(self.WIDTH, self.HEIGHT)
@@ -66,7 +129,44 @@ class Game:
     def _update(self):
         self.state_manager.update()
         
+    def toggle_dirty_debug(self):
+        self.show_dirty_rects = not self.show_dirty_rects
+        self._dirty_debug = []
+
     def _draw(self):
+        # Рисует кадр и возвращает, что вывести на экран: None - весь экран, список - только эти области
+        rects = None
+        if self.dirty_rendering:
+            rects = self.state_manager.draw_dirty(self.screen)
+
+        if rects is None:
+            self._draw_full()
+        elif self.show_dirty_rects:
+            self._draw_dirty_debug(rects)
+            return None
+        return rects
+
+    def _present(self, rects):
+        if rects is None:
+            pygame.display.flip()
+        elif rects:
+            pygame.display.update(rects)
+
+    def _draw_full(self):
         self.screen.fill(SETTINGS.COLORS['background'])
         self.state_manager.draw(self.screen)
-        pygame.display.flip()
+        if self.show_dirty_rects:
+            self._draw_dirty_outlines()
+
+    def _draw_dirty_debug(self, rects):
+        # Кадр рисуется целиком, а поверх обводятся области, которые сцена пометила грязными.
+        # Обводка держится несколько кадров, чтобы ее было видно.
+        for rect in rects:
+            self._dirty_debug.append([pygame.Rect(rect), 15])
+        self._draw_full()
+
+    def _draw_dirty_outlines(self):
+        for item in self._dirty_debug:
+            pygame.draw.rect(self.screen, (255, 0, 255), item[0], 1)
+            item[1] -= 1
+        self._dirty_debug = [item for item in self._dirty_debug if item[1] > 0]
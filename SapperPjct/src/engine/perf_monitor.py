@@ -0,0 +1,103 @@
+import os
+import time
+import cProfile
+import pstats
+from collections import deque
+from src.config.settings import SETTINGS
+
+# Фазы кадра в порядке выполнения (время в мс хранится в Game.frame_times)
+PHASES = ('events', 'update', 'draw', 'flip')
+
+class SurfaceCounter:
+    # Явный счетчик созданных поверхностей: каждое место, где появляется новая Surface
+    # (pygame.Surface, Font.render, convert/convert_alpha, copy, transform), оборачивает результат
+    # в SURFACES.new(...). Это одно сложение, поэтому счетчик работает всегда и не искажает время кадра
+    def __init__(self):
+        self.created = 0
+
+    def new(self, surf):
+        self.created += 1
+        return surf
+
+SURFACES = SurfaceCounter()
+
+class PerfMonitor:
+    # Статистика кадров для страницы производительности в DebugPanel
+    # и запись cProfile за несколько кадров подряд
+    def __init__(self, history=120):
+        self.history = deque(maxlen=history) # Время кадров в мс: словари с фазами и 'total'
+        self.allocations = deque(maxlen=history) # Созданные за кадр поверхности (по SURFACES)
+        self._surfaces_seen = SURFACES.created
+        self.profiles_dir = os.path.join(SETTINGS.base_dir, 'data', 'profiles')
+        self.profiler = None
+        self.profile_frames_left = 0
+        self.profile_frames_total = 0
+        self.last_profile = None # Путь к последнему сохраненному профилю
+
+    def begin_frame(self):
+        if self.profile_frames_left and self.profiler is None:
+            self.profiler = cProfile.Profile()
+            self.profiler.enable()
+
+    def end_frame(self, frame_times):
+        record = dict(frame_times)
+        record['total'] = sum(frame_times.get(phase, 0.0) for phase in PHASES)
+        self.history.append(record)
+
+        self.allocations.append(SURFACES.created - self._surfaces_seen)
+        self._surfaces_seen = SURFACES.created
+
+        if self.profiler is not None:
+            self.profile_frames_left -= 1
+            if self.profile_frames_left <= 0:
+                self._finish_profile()
+
+    def start_profile(self, frames):
+        if self.profile_frames_left:
+            return
+        self.profile_frames_left = frames
+        self.profile_frames_total = frames
+
+    @property
+    def profiling(self):
+        return self.profile_frames_left > 0
+
+    def _finish_profile(self):
+        self.profiler.disable()
+        profiler = self.profiler
+        self.profiler = None
+        self.profile_frames_left = 0
+
+        name = time.strftime('frames_%Y%m%d_%H%M%S')
+        path = os.path.join(self.profiles_dir, name + '.prof')
+        try:
+            if not os.path.exists(self.profiles_dir):
+                os.makedirs(self.profiles_dir)
+            profiler.dump_stats(path)
+            # Рядом кладем текстовую сводку, чтобы смотреть профиль без snakeviz/pstats
+            with open(os.path.join(self.profiles_dir, name + '.txt'), 'w', encoding='utf-8') as f:
+                f.write(f"{self.profile_frames_total} кадров\n\n")
+                stats = pstats.Stats(profiler, stream=f)
+                stats.sort_stats('cumulative').print_stats(40)
+            self.last_profile = path
+        except OSError as e:
+            print(f"Не удалось сохранить профиль: {e}")
+
+    def fps_stats(self, clock):
+        totals = [record['total'] for record in self.history]
+        return {
+            'fps': clock.get_fps(),
+            'last': totals[-1] if totals else 0.0,
+            'worst': max(totals) if totals else 0.0,
+        }
+
+    def phase_averages(self):
+        if not self.history:
+            return {phase: 0.0 for phase in PHASES}
+        n = len(self.history)
+        return {phase: sum(record.get(phase, 0.0) for record in self.history) / n for phase in PHASES}
+
+    def allocations_per_frame(self):
+        if not self.allocations:
+            return 0.0
+        return sum(self.allocations) / len(self.allocations)
@@ -1,30 +1,52 @@
 import pygame
 import os
+from collections import OrderedDict
 from src.config.settings import SETTINGS
+from src.engine.perf_monitor import SURFACES
 
 class ResourceManager:
     def __init__(self):
         self.images = {}
         self.fonts = {}
         self.sounds = {}
+        # Кэш отрисованного текста (LRU): ключ - (шрифт, размер, текст, цвет)
+        self.texts = OrderedDict()
+        self.text_cache_size = 512
+        # Атлас глифов для строк из цифр (счетчики, таймер)
+        self.glyphs = {}
+        # Счетчики попаданий/промахов по кэшам: имя кэша -> [попадания, промахи]
+        self.cache_stats = {name: [0, 0] for name in ('images', 'fonts', 'texts', 'glyphs', 'sounds')}
         self.base_dir = SETTINGS.base_dir
         self.assets_dir = os.path.join(self.base_dir, 'assets')
         
+    def _count(self, cache, hit):
+        self.cache_stats[cache][0 if hit else 1] += 1
+
+    def hit_rates(self):
+        # Доля попаданий по каждому кэшу (None, если к кэшу еще не обращались)
+        rates = {}
+        for name, (hits, misses) in self.cache_stats.items():
+            total = hits + misses
+            rates[name] = hits / total if total else None
+        return rates
+
     def get_image(self, name):
+        self._count('images', name in self.images)
         if name not in self.images:
             path = os.path.join(self.assets_dir, 'images', name)
             if os.path.exists(path):
-                self.images[name] = pygame.image.load(path).convert_alpha()
+                self.images[name] = SURFACES.new(pygame.image.load(path).convert_alpha())
             else:
                 # Создаем заглушку, если изображение не найдено
                 print(f"Изображение не найдено: {name}, создаем заглушку.")
-                surf = pygame.Surface((SETTINGS.LAYOUT['cell_size'], SETTINGS.LAYOUT['cell_size']))
+                surf = SURFACES.new(pygame.Surface((SETTINGS.LAYOUT['cell_size'], SETTINGS.LAYOUT['cell_size'])))
                 surf.fill((255, 0, 255)) # Пурпурная заглушка
                 self.images[name] = surf
         return self.images[name]
 
     def get_font(self, name, size):
         key = (name, size)
+        self._count('fonts', key in self.fonts)
         if key not in self.fonts:
             # Пока используем системный шрифт или конкретный файл шрифта
             # Если имя - это путь к файлу в assets/fonts, загружаем его. Иначе используем SysFont.
@@ -35,18 +57,68 @@ class ResourceManager:
                 self.fonts[key] = pygame.font.SysFont(name, size)
         return self.fonts[key]
     
+    def render_text(self, font_name, size, text, color, antialias=True):
+        key = (font_name, size, text, tuple(color), antialias)
+        surf = self.texts.get(key)
+        self._count('texts', surf is not None)
+        if surf is not None:
+            self.texts.move_to_end(key)
+            return surf
+
+        surf = SURFACES.new(self.get_font(font_name, size).render(text, antialias, color))
+        self._cache_text(key, surf)
+        return surf
+
+    def render_counter(self, font_name, size, text, color):
+        # Строка собирается из закэшированных глифов: для счетчиков, где меняются только цифры,
+        # шрифт растеризует каждый символ один раз, а не всю строку при каждом изменении
+        key = (font_name, size, text, tuple(color), 'glyphs')
+        surf = self.texts.get(key)
+        self._count('texts', surf is not None)
+        if surf is not None:
+            self.texts.move_to_end(key)
+            return surf
+
+        glyphs = [self._get_glyph(font_name, size, ch, color) for ch in text]
+        width = sum(glyph.get_width() for glyph in glyphs)
+        height = max([glyph.get_height() for glyph in glyphs] or [self.get_font(font_name, size).get_height()])
+        surf = SURFACES.new(pygame.Surface((width, height), pygame.SRCALPHA))
+        x = 0
+        for glyph in glyphs:
+            surf.blit(glyph, (x, 0))
+            x += glyph.get_width()
+        self._cache_text(key, surf)
+        return surf
+
+    def _get_glyph(self, font_name, size, ch, color):
+        key = (font_name, size, ch, tuple(color))
+        self._count('glyphs', key in self.glyphs)
+        if key not in self.glyphs:
+            self.glyphs[key] = SURFACES.new(self.get_font(font_name, size).render(ch, True, color))
+        return self.glyphs[key]
+
+    def _cache_text(self, key, surf):
+        self.texts[key] = surf
+        if len(self.texts) > self.text_cache_size:
+            self.texts.popitem(last=False) # Вытесняем самую давно использованную строку
+    
     def get_sound(self, name):
-        if not SETTINGS.game_config['audio']['enabled']:
+        if not SETTINGS.game_config['audio']['enabled'] or not pygame.mixer.get_init():
             return None
             
+        self._count('sounds', name in self.sounds)
         if name not in self.sounds:
             path = os.path.join(self.assets_dir, 'sounds', name)
             if os.path.exists(path):
                 self.sounds[name] = pygame.mixer.Sound(path)
                 self.sounds[name].set_volume(SETTINGS.game_config['audio']['sfx_volume'])
             else:
+                # Нет файла - процедурная замена из банка (None, если для звука нет рецепта)
+                from src.engine.sound_generator import SOUND_BANK
                 print(f"Звуковой файл не найден: {name}")
-                self.sounds[name] = None
+                self.sounds[name] = SOUND_BANK.for_file(name)
+                if self.sounds[name] is not None:
+                    self.sounds[name].set_volume(SETTINGS.game_config['audio']['sfx_volume'])
         return self.sounds[name]
 
 # Глобальный экземпляр
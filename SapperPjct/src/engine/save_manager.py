@@ -1,45 +1,213 @@
-import json
 import os
+import struct
+import threading
+from datetime import datetime
+import numpy as np
 from src.config.settings import SETTINGS
+from src.engine.async_writer import AsyncWriter, write_atomic
+
+# Бинарное сохранение незаконченной партии (data/savegame.bin), little-endian:
+#   заголовок: SAVE_MAGIC, версия, игроков, уровень кампании, досок, прошло мс, длина названия сложности
+#   название сложности (utf-8)
+#   для каждой доски: вид (_VIEW) и данные своего типа
+#     обычная (_FIXED): размеры, мины, зерно, флаги, первый клик; затем плоскости по биту на клетку
+#       (packbits): мины - только если их нельзя восстановить из зерна и первого клика, открытые, флаги
+#     бесконечная (_ENDLESS): зерно, плотность, флаги, первый клик, счетчики и число кусков;
+#       затем куски (_CHUNK) со сжатым состоянием open/flagged из EndlessCore
+SAVE_MAGIC = b'SPSV'
+SAVE_VERSION = 2
+_HEADER = struct.Struct('<4sHBHBIB')
+_VIEW = struct.Struct('<BHqqI')      # тип доски, размер клетки, cam_x, cam_y, кликов
+_FIXED = struct.Struct('<IIIQBqq')   # rows, cols, mines, seed, флаги, первый клик
+_ENDLESS = struct.Struct('<QdBqqiQI') # seed, плотность, флаги, первый клик, флагов, открыто, кусков
+_CHUNK = struct.Struct('<iiI')       # cy, cx, длина сжатых данных
+
+KIND_FIXED = 0
+KIND_ENDLESS = 1
+
+# Биты поля флагов доски
+FLAG_FIRST_CLICK = 1
+FLAG_GAME_OVER = 2
+FLAG_WIN = 4
+FLAG_SEED_ONLY = 8 # Мины не записаны: расстановка повторяется из зерна и первого клика
 
 class SaveManager:
     def __init__(self):
         self.data_dir = os.path.join(SETTINGS.base_dir, 'data')
         self.scores_file = os.path.join(self.data_dir, 'highscores.json')
-        self.scores = self._load_scores()
-        
-    def _load_scores(self):
-        if not os.path.exists(self.scores_file):
-            return {'easy': [], 'medium': [], 'hard': []}
-            
+        self.game_file = os.path.join(self.data_dir, 'savegame.bin')
+        # Результаты пишутся в фоне: экран конца игры не ждет диска
+        self.writer = AsyncWriter()
+        self._store = None
+        self._store_lock = threading.Lock() # Базу могут впервые открыть оба потока сразу
+
+    @property
+    def store(self):
+        # История партий открывается при первом обращении, а не при старте игры;
+        # старый highscores.json переносится в базу при первом открытии
+        from src.engine.score_store import ScoreStore
+        with self._store_lock:
+            if self._store is None:
+                self._store = ScoreStore(os.path.join(self.data_dir, 'scores.db'), legacy_json=self.scores_file)
+        return self._store
+
+    def open_store(self):
+        # Открыть базу заранее в потоке записи (при загрузке), чтобы первая сцена с результатами
+        # не ждала подключения и переноса старого json
+        self.writer.call(lambda: self.store)
+
+    def record_game(self, difficulty, level, board, time_ms, won):
+        # Законченная одиночная партия (победа или проигрыш)
+        record = {
+            'difficulty': difficulty,
+            'level': level,
+            'rows': board.rows,
+            'cols': board.cols,
+            'mines': board.total_mines,
+            'seed': board.seed,
+            'time_ms': int(time_ms),
+            'clicks': board.clicks,
+            'won': 1 if won else 0,
+            'played_at': datetime.now().isoformat(timespec='seconds'),
+        }
+        self.writer.call(self._add_game, record)
+
+    def _add_game(self, record):
+        # В фоновом потоке: там же при необходимости открывается база
+        self.store.add_game(record)
+
+    def flush(self):
+        # Дождаться фоновых записей (при выходе из игры)
+        if not self.writer.flush():
+            print("Error saving scores: write did not finish in time")
+
+    # --- Сохранение партии ---
+
+    def has_saved_game(self):
+        return os.path.exists(self.game_file)
+
+    def delete_saved_game(self):
         try:
-            with open(self.scores_file, 'r') as f:
-                return json.load(f)
-        except:
-            return {'easy': [], 'medium': [], 'hard': []}
-            
-    def save_score(self, difficulty, time):
-        if difficulty not in self.scores:
-            self.scores[difficulty] = []
-            
-        self.scores[difficulty].append(time)
-        self.scores[difficulty].sort()
-        self.scores[difficulty] = self.scores[difficulty][:5] # Храним топ-5
-        
-        self._save_to_file()
-        
-    def _save_to_file(self):
+            os.remove(self.game_file)
+        except OSError:
+            pass
+
+    def save_game(self, scene, seed_only=True):
+        # Снимок партии GameScene; seed_only - не писать мины, если их можно получить заново из зерна
+        difficulty = scene.difficulty.encode('utf-8')
+        parts = [_HEADER.pack(SAVE_MAGIC, SAVE_VERSION, scene.num_players, scene.level,
+                              len(scene.boards), scene.elapsed_ms(), len(difficulty)), difficulty]
+        for board in scene.boards:
+            core = board.core
+            kind = KIND_ENDLESS if board.endless else KIND_FIXED
+            parts.append(_VIEW.pack(kind, board.cell_size, board.cam_x, board.cam_y, board.clicks))
+            flags = ((FLAG_FIRST_CLICK if core.first_click else 0) | (FLAG_GAME_OVER if core.game_over else 0)
+                     | (FLAG_WIN if core.win else 0))
+            safe_row, safe_col = core.safe_cell if core.safe_cell is not None else (-1, -1)
+            if board.endless:
+                chunks = core.export_chunks()
+                parts.append(_ENDLESS.pack(core.seed, core.density, flags, safe_row, safe_col,
+                                           core.flags_placed, core.opened, len(chunks)))
+                for (cy, cx), data in chunks.items():
+                    parts.append(_CHUNK.pack(cy, cx, len(data)))
+                    parts.append(data)
+                continue
+            if seed_only and core.safe_cell is not None:
+                flags |= FLAG_SEED_ONLY
+            parts.append(_FIXED.pack(core.rows, core.cols, core.total_mines, core.seed, flags, safe_row, safe_col))
+            if not flags & (FLAG_SEED_ONLY | FLAG_FIRST_CLICK):
+                parts.append(np.packbits(core.is_mine).tobytes())
+            parts.append(np.packbits(core.is_open).tobytes())
+            parts.append(np.packbits(core.is_flagged).tobytes())
+
+        # Запись через временный файл: при сбое старое сохранение остается целым
+        try:
+            write_atomic(self.game_file, b''.join(parts))
+            return True
+        except OSError as e:
+            print(f"Error saving game: {e}")
+            return False
+
+    def load_game(self):
+        # Возвращает {'difficulty', 'num_players', 'level', 'elapsed_ms', 'boards': [...]} или None.
+        # Файл отображается в память: плоскости большой доски распаковываются прямо из отображения.
+        if not self.has_saved_game():
+            return None
         try:
-            if not os.path.exists(self.data_dir):
-                os.makedirs(self.data_dir)
-            with open(self.scores_file, 'w') as f:
-                json.dump(self.scores, f)
-        except Exception as e:
-            print(f"Error saving scores: {e}")
-            
-    def get_best_score(self, difficulty):
-        if difficulty in self.scores and self.scores[difficulty]:
-            return self.scores[difficulty][0]
-        return None
+            data = np.memmap(self.game_file, dtype=np.uint8, mode='r')
+            return self._parse_game(data)
+        except (OSError, ValueError, struct.error, KeyError) as e:
+            print(f"Error loading game: {e}")
+            return None
+
+    def _parse_game(self, data):
+        # Ядра нужны только при продолжении партии: не импортируем их при старте меню
+        from src.core.minesweeper import MinesweeperCore
+        from src.core.endless import EndlessCore
+        magic, version, num_players, level, count, elapsed_ms, name_len = _HEADER.unpack_from(data, 0)
+        if magic != SAVE_MAGIC or version != SAVE_VERSION:
+            raise ValueError("unknown save format")
+        offset = _HEADER.size
+        difficulty = bytes(data[offset:offset + name_len]).decode('utf-8')
+        offset += name_len
+
+        boards = []
+        for _ in range(count):
+            kind, cell_size, cam_x, cam_y, clicks = _VIEW.unpack_from(data, offset)
+            offset += _VIEW.size
+            if kind == KIND_ENDLESS:
+                seed, density, flags, safe_row, safe_col, flags_placed, opened, chunk_count = \
+                    _ENDLESS.unpack_from(data, offset)
+                offset += _ENDLESS.size
+                chunks = {}
+                for _ in range(chunk_count):
+                    cy, cx, size = _CHUNK.unpack_from(data, offset)
+                    offset += _CHUNK.size
+                    chunks[(cy, cx)] = bytes(data[offset:offset + size])
+                    offset += size
+                core = EndlessCore(density, seed)
+                core.import_chunks(chunks)
+                core.flags_placed = flags_placed
+                core.opened = opened
+            else:
+                rows, cols, mines, seed, flags, safe_row, safe_col = _FIXED.unpack_from(data, offset)
+                offset += _FIXED.size
+                n = rows * cols
+                plane_size = (n + 7) // 8
+
+                def plane(at):
+                    if at + plane_size > len(data):
+                        raise ValueError("truncated save")
+                    return np.unpackbits(data[at:at + plane_size], count=n).view(bool).reshape(rows, cols)
+
+                core = MinesweeperCore(rows, cols, mines, seed)
+                if flags & FLAG_FIRST_CLICK:
+                    # Мины еще не расставлены: сохранены только флаги
+                    offset += plane_size
+                    core.is_flagged = plane(offset)
+                    core.flags_placed = int(np.count_nonzero(core.is_flagged))
+                    offset += plane_size
+                else:
+                    if flags & FLAG_SEED_ONLY:
+                        core.place_mines(safe_row, safe_col, label=False)
+                        is_mine = core.is_mine
+                    else:
+                        is_mine = plane(offset)
+                        offset += plane_size
+                    is_open = plane(offset)
+                    is_flagged = plane(offset + plane_size)
+                    offset += plane_size * 2
+                    core.load_state(is_mine, is_open, is_flagged)
+                    core.safe_cell = (safe_row, safe_col) if safe_row >= 0 else None
+            core.game_over = bool(flags & FLAG_GAME_OVER)
+            core.win = bool(flags & FLAG_WIN)
+            if flags & FLAG_FIRST_CLICK == 0:
+                core.first_click = False
+                if kind == KIND_ENDLESS:
+                    core.safe_cell = (safe_row, safe_col)
+            boards.append({'core': core, 'cell_size': cell_size, 'cam_x': cam_x, 'cam_y': cam_y, 'clicks': clicks})
+
+        return {'difficulty': difficulty, 'num_players': num_players, 'level': level,
+                'elapsed_ms': elapsed_ms, 'boards': boards}
 
 SAVE_MANAGER = SaveManager()
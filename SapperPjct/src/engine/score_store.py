@@ -0,0 +1,110 @@
+import os
+import json
+import sqlite3
+import threading
+from datetime import datetime
+
+# История партий в SQLite (data/scores.db): каждая законченная одиночная партия - одна строка.
+# Запросы страницами и по индексам, в память целиком ничего не загружается.
+#
+# Пишет фоновый поток SaveManager, читают сцены из главного: у каждого потока свое соединение,
+# журнал WAL позволяет читать во время записи.
+
+SCHEMA_VERSION = 1
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS games (
+    id INTEGER PRIMARY KEY,
+    difficulty TEXT NOT NULL,
+    level INTEGER NOT NULL DEFAULT 1,
+    rows INTEGER,
+    cols INTEGER,
+    mines INTEGER,
+    seed INTEGER,
+    time_ms INTEGER NOT NULL,
+    clicks INTEGER,
+    won INTEGER NOT NULL,
+    played_at TEXT NOT NULL
+);
+-- Топ-N и личные рекорды по сложности
+CREATE INDEX IF NOT EXISTS games_top ON games (difficulty, won, time_ms);
+-- Сводки по дням и история в порядке игры
+CREATE INDEX IF NOT EXISTS games_played ON games (difficulty, played_at);
+"""
+
+class ScoreStore:
+    def __init__(self, path, legacy_json=None):
+        self.path = path
+        self._local = threading.local()
+        conn = self._conn()
+        version = conn.execute("PRAGMA user_version").fetchone()[0]
+        if version < SCHEMA_VERSION:
+            with conn:
+                conn.executescript(SCHEMA)
+                if legacy_json:
+                    self._migrate_json(conn, legacy_json)
+                conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+
+    def _conn(self):
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            directory = os.path.dirname(self.path)
+            if directory and not os.path.exists(directory):
+                os.makedirs(directory)
+            conn = sqlite3.connect(self.path, timeout=5.0)
+            conn.execute("PRAGMA journal_mode = WAL")
+            conn.execute("PRAGMA synchronous = NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def _migrate_json(self, conn, path):
+        # Однократный перенос старого highscores.json (топ-5 секунд по сложности).
+        # Дата партий неизвестна - берется время изменения файла. Сам файл остается на месте:
+        # повторный перенос исключает версия схемы (PRAGMA user_version).
+        if not os.path.exists(path):
+            return
+        try:
+            with open(path, 'r') as f:
+                scores = json.load(f)
+            played_at = datetime.fromtimestamp(os.path.getmtime(path)).isoformat(timespec='seconds')
+        except (OSError, ValueError) as e:
+            print(f"Error migrating scores: {e}")
+            return
+        rows = [(difficulty, int(seconds * 1000), played_at)
+                for difficulty, times in scores.items() for seconds in times]
+        conn.executemany("INSERT INTO games (difficulty, time_ms, won, played_at) VALUES (?, ?, 1, ?)", rows)
+
+    def add_game(self, record):
+        # record: словарь с полями таблицы games (кроме id)
+        conn = self._conn()
+        with conn:
+            conn.execute(
+                "INSERT INTO games (difficulty, level, rows, cols, mines, seed, time_ms, clicks, won, played_at) "
+                "VALUES (:difficulty, :level, :rows, :cols, :mines, :seed, :time_ms, :clicks, :won, :played_at)",
+                record)
+
+    def top(self, difficulty, limit=5, offset=0):
+        # Лучшие победы: [(time_ms, clicks, played_at), ...]
+        return self._conn().execute(
+            "SELECT time_ms, clicks, played_at FROM games WHERE difficulty = ? AND won = 1 "
+            "ORDER BY time_ms LIMIT ? OFFSET ?", (difficulty, limit, offset)).fetchall()
+
+    def count_wins(self, difficulty):
+        return self._conn().execute(
+            "SELECT COUNT(*) FROM games WHERE difficulty = ? AND won = 1", (difficulty,)).fetchone()[0]
+
+    def best_trend(self, difficulty):
+        # Как улучшался личный рекорд: [(played_at, time_ms), ...] - победы, побившие все предыдущие
+        return self._conn().execute(
+            "SELECT played_at, time_ms FROM ("
+            "  SELECT played_at, time_ms, MIN(time_ms) OVER ("
+            "    ORDER BY played_at, id ROWS BETWEEN UNBOUNDED PRECEDING AND 1 PRECEDING) AS previous"
+            "  FROM games WHERE difficulty = ? AND won = 1"
+            ") WHERE previous IS NULL OR time_ms < previous", (difficulty,)).fetchall()
+
+    def daily(self, difficulty, days=30):
+        # Сводка по дням, последние сначала: [(день, партий, побед, лучшее время мс), ...]
+        return self._conn().execute(
+            "SELECT substr(played_at, 1, 10) AS day, COUNT(*), SUM(won), MIN(CASE WHEN won THEN time_ms END) "
+            "FROM games WHERE difficulty = ? GROUP BY day ORDER BY day DESC LIMIT ?",
+            (difficulty, days)).fetchall()
@@ -1,42 +1,128 @@
 import pygame
+import threading
 import numpy as np
-import math
 
-class SoundGenerator:
+# Рецепты звуков, которые банк умеет синтезировать вместо .wav из assets/sounds.
+# Ноты: (частота Гц или кортеж частот аккорда, длительность с); громкость 0..1
+RECIPES = {
+    'click.wav': ('tone', 800, 0.05, 0.3),
+    'explode.wav': ('noise', 0.5, 0.5),
+    # C5 - E5 - G5, последняя нота - весь мажорный аккорд
+    'win.wav': ('notes', ((523.25, 0.1), (659.25, 0.1), ((523.25, 659.25, 783.99), 0.3)), 0.4),
+    # G4 - E4 - C4 вниз
+    'mp_lose.wav': ('notes', ((392.0, 0.15), (329.63, 0.15), (261.63, 0.4)), 0.4),
+}
+
+# Формат отсчетов микшера (size из pygame.mixer.get_init()) -> (тип numpy, амплитуда, смещение нуля)
+SAMPLE_FORMATS = {
+    -8: (np.int8, 127, 0),
+    8: (np.uint8, 127, 128),
+    -16: (np.int16, 32767, 0),
+    16: (np.uint16, 32767, 32768),
+    # 32 бита у pygame - отсчеты с плавающей точкой (get_init() сообщает -32)
+    -32: (np.float32, 1.0, 0),
+    32: (np.float32, 1.0, 0),
+}
+
+class SoundBank:
+    # Процедурные звуки: волна синтезируется один раз и хранится готовым pygame.mixer.Sound,
+    # ключ кэша - параметры звука. Формат берется у уже открытого микшера (Game открывает его в фоне),
+    # поэтому создание банка ничего не делает со звуком и не влияет на время старта.
+    # Синтезировать можно и из рабочего потока (AssetPreloader): кэш под блокировкой.
     def __init__(self):
-        self.sample_rate = 44100
-        self.bits = 16
-        pygame.mixer.pre_init(self.sample_rate, -self.bits, 1) 
-        
-    def _make_sound(self, wave):
-        audio = wave.astype(np.int16)
-        if pygame.mixer.get_init()[2] == 2: # Проверить, является ли стерео
-            audio = np.column_stack((audio, audio))
-        return pygame.sndarray.make_sound(audio)
-
-    def generate_beep(self, frequency=440, duration=0.1, volume=0.5):
-        n_samples = int(self.sample_rate * duration)
-        # Сгенерировать синусоидальную волну
-        t = np.linspace(0, duration, n_samples, False)
-        wave = np.sin(2 * np.pi * frequency * t) * volume * (2**(self.bits-1) - 1)
-        return self._make_sound(wave)
-        
-    def generate_noise(self, duration=0.1, volume=0.5):
-        n_samples = int(self.sample_rate * duration)
-        wave = np.random.uniform(-1, 1, n_samples) * volume * (2**(self.bits-1) - 1)
-        return self._make_sound(wave)
+        self.sounds = {} # параметры -> Sound
+        self._times = {} # число отсчетов -> ось времени (с)
+        self._format = None # (частота, размер отсчета, каналы) микшера, под который собраны звуки
+        self._lock = threading.Lock()
+
+    def _check_format(self):
+        # Звуки привязаны к формату микшера: после его переоткрытия кэш собирается заново
+        frequency, size, channels = pygame.mixer.get_init()
+        if (frequency, size, channels) != self._format:
+            self._format = (frequency, size, channels)
+            self.sounds.clear()
+            self._times.clear()
+        return frequency
+
+    def _time(self, n_samples, sample_rate):
+        t = self._times.get(n_samples)
+        if t is None:
+            t = np.arange(n_samples, dtype=np.float32) / np.float32(sample_rate)
+            self._times[n_samples] = t
+        return t
+
+    def _envelope(self, n_samples, sample_rate, attack=0.005, release=0.02):
+        # Линейные нарастание и затухание по краям: без щелчков на границах волны
+        ramp = np.arange(n_samples, dtype=np.float32)
+        env = np.minimum(ramp / max(attack * sample_rate, 1), (n_samples - ramp) / max(release * sample_rate, 1))
+        return np.clip(env, 0, 1, out=env)
+
+    def _tone(self, frequencies, duration, sample_rate):
+        # Одна частота или аккорд: синусы всех нот считаются одной операцией и усредняются
+        n_samples = int(sample_rate * duration)
+        t = self._time(n_samples, sample_rate)
+        freqs = np.atleast_1d(np.asarray(frequencies, dtype=np.float32))
+        wave = np.sin(2 * np.pi * freqs[:, None] * t).mean(axis=0)
+        return wave * self._envelope(n_samples, sample_rate)
+
+    def _noise(self, duration, sample_rate):
+        # Взрыв: белый шум с экспоненциальным затуханием; зерно постоянное - звук всегда один и тот же
+        n_samples = int(sample_rate * duration)
+        wave = np.random.default_rng(0).uniform(-1, 1, n_samples).astype(np.float32)
+        decay = np.exp(-5 * self._time(n_samples, sample_rate) / duration)
+        return wave * decay * self._envelope(n_samples, sample_rate, attack=0.001)
+
+    def _make_sound(self, wave, volume):
+        _, size, channels = self._format
+        dtype, amplitude, zero = SAMPLE_FORMATS[size]
+        audio = (wave * (volume * amplitude) + zero).astype(dtype)
+        if channels > 1:
+            audio = np.repeat(audio[:, None], channels, axis=1)
+        # sndarray.make_sound копирует данные: массив после этого не нужен
+        return pygame.sndarray.make_sound(np.ascontiguousarray(audio))
+
+    def get(self, recipe):
+        # recipe - кортеж параметров как в RECIPES; None, если микшер не открыт
+        if not pygame.mixer.get_init():
+            return None
+        with self._lock:
+            sample_rate = self._check_format()
+            if self._format[1] not in SAMPLE_FORMATS:
+                return None # Такой формат отсчетов не синтезируем - звук просто не играет
+            sound = self.sounds.get(recipe)
+            if sound is None:
+                kind = recipe[0]
+                if kind == 'tone':
+                    _, frequency, duration, volume = recipe
+                    wave = self._tone(frequency, duration, sample_rate)
+                elif kind == 'noise':
+                    _, duration, volume = recipe
+                    wave = self._noise(duration, sample_rate)
+                else:
+                    _, notes, volume = recipe
+                    wave = np.concatenate([self._tone(frequency, duration, sample_rate) for frequency, duration in notes])
+                sound = self._make_sound(wave, volume)
+                self.sounds[recipe] = sound
+            return sound
+
+    def for_file(self, name):
+        # Замена отсутствующего файла из assets/sounds; None, если рецепта нет
+        recipe = RECIPES.get(name)
+        return self.get(recipe) if recipe else None
+
+    def preload(self):
+        # Синтезирует все рецепты заранее (например, в рабочем потоке загрузки)
+        for recipe in RECIPES.values():
+            self.get(recipe)
 
     def get_click_sound(self):
-        return self.generate_beep(800, 0.05, 0.3)
-        
+        return self.for_file('click.wav')
+
     def get_explosion_sound(self):
-        return self.generate_noise(0.5, 0.5)
-        
+        return self.for_file('explode.wav')
+
     def get_win_sound(self):
-        s1 = self.generate_beep(523.25, 0.1, 0.4) # C5
-        s2 = self.generate_beep(659.25, 0.1, 0.4) # E5
-        s3 = self.generate_beep(783.99, 0.2, 0.4) # G5
-        return s1 
-        return self.generate_beep(1000, 0.3, 0.4)
+        return self.for_file('win.wav')
 
-SOUND_GEN = SoundGenerator()
+# Глобальный экземпляр
+SOUND_BANK = SoundBank()
@@ -0,0 +1,106 @@
+import os
+import sys
+import time
+import builtins
+import threading
+import importlib.util
+
+# Замер холодного старта: время от запуска main.py до ключевых точек
+# ('imports', 'game_init', 'first_frame', 'menu') и, в режиме --profile-startup,
+# время импорта каждого модуля в формате python -X importtime (собственное | с вложенными).
+# Пока замер включен, импортируют и фоновые потоки (AudioInit, AssetPreloader): стек вложенности
+# у каждого потока свой, а их импорты помечаются именем потока.
+
+class StartupProfile:
+    def __init__(self):
+        self.start = time.perf_counter()
+        self.marks = {} # имя -> мс от старта
+        self.imports = [] # (имя модуля, собственное мс, с вложенными мс, глубина)
+        self.tracking = False
+        self._local = threading.local() # .stack - вложенные импорты текущего потока
+        self._original_import = None
+
+    def track_imports(self):
+        if self.tracking:
+            return
+        self.tracking = True
+        self._original_import = builtins.__import__
+        builtins.__import__ = self._timed_import
+
+    def _timed_import(self, name, globals=None, locals=None, fromlist=(), level=0):
+        if level == 0 and name in sys.modules:
+            return self._original_import(name, globals, locals, fromlist, level)
+        stack = getattr(self._local, 'stack', None)
+        if stack is None:
+            stack = self._local.stack = []
+        start = time.perf_counter()
+        stack.append(0.0)
+        try:
+            return self._original_import(name, globals, locals, fromlist, level)
+        finally:
+            elapsed = (time.perf_counter() - start) * 1000
+            nested = stack.pop()
+            if stack:
+                stack[-1] += elapsed
+            # Уже загруженные модули (относительный импорт, from-импорт) почти ничего не стоят
+            if elapsed - nested > 0.05 or nested:
+                module = self._module_name(name, globals, fromlist, level)
+                thread = threading.current_thread()
+                if thread is not threading.main_thread():
+                    module += f' [{thread.name}]'
+                self.imports.append((module, elapsed - nested, elapsed, len(stack)))
+
+    @staticmethod
+    def _module_name(name, globals, fromlist, level):
+        # Полное имя для относительных импортов ("from . import x" внутри пакета)
+        if not level:
+            return name
+        package = (globals or {}).get('__package__')
+        if not package:
+            return '.' * level + name
+        try:
+            full = importlib.util.resolve_name('.' * level + name, package)
+        except ImportError:
+            return '.' * level + name
+        if not name and fromlist:
+            full += '.' + ','.join(fromlist)
+        return full
+
+    def mark(self, name):
+        # Отмечает точку старта один раз; возвращает ее время в мс
+        if name not in self.marks:
+            self.marks[name] = (time.perf_counter() - self.start) * 1000
+        return self.marks[name]
+
+    def finish(self, directory):
+        # Печатает отчет и сохраняет его рядом с профилями кадров
+        if not self.tracking:
+            return None
+        builtins.__import__ = self._original_import
+        self.tracking = False
+        report = self.report()
+        print(report)
+        path = os.path.join(directory, time.strftime('startup_%Y%m%d_%H%M%S.txt'))
+        try:
+            if not os.path.exists(directory):
+                os.makedirs(directory)
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write(report)
+        except OSError as e:
+            print(f"Не удалось сохранить отчет о старте: {e}")
+            return None
+        return path
+
+    def report(self, top=25):
+        lines = ["Старт (мс от запуска main.py):"]
+        for name, ms in self.marks.items():
+            lines.append(f"  {name:<12}{ms:9.1f}")
+        lines.append("")
+        lines.append("Самые долгие импорты (мс, как -X importtime): собственное | с вложенными | модуль")
+        slowest = sorted(self.imports, key=lambda item: item[2], reverse=True)[:top]
+        for name, own, total, depth in slowest:
+            lines.append(f"  {own:9.1f} | {total:9.1f} | {'  ' * depth}{name}")
+        return "\n".join(lines) + "\n"
+
+# Глобальный экземпляр: создается при первом импорте, то есть в самом начале main.py
+STARTUP = StartupProfile()
@@ -9,6 +9,8 @@ class StateManager:
         self.state = new_state
         if self.state:
             self.state.enter()
+            # Новая сцена всегда сначала рисуется целиком
+            self.state.invalidate()
             
     def update(self):
         if self.state:
@@ -17,6 +19,11 @@ class StateManager:
     def draw(self, screen):
         if self.state:
             self.state.draw(screen)
+
+    def draw_dirty(self, screen):
+        if self.state:
+            return self.state.draw_dirty(screen)
+        return None
             
     def handle_event(self, event):
         if self.state:
@@ -25,6 +32,7 @@ class StateManager:
 class State:
     def __init__(self, game):
         self.game = game
+        self.full_redraw = True
         
     def enter(self):
         pass
@@ -37,6 +45,15 @@ class State:
         
     def draw(self, screen):
         pass
+
+    def invalidate(self):
+        # Следующий кадр будет нарисован целиком
+        self.full_redraw = True
+
+    def draw_dirty(self, screen):
+        # Рисует только изменившиеся области и возвращает их список.
+        # None означает, что сцене нужна полная перерисовка (поведение по умолчанию).
+        return None
         
     def handle_event(self, event):
         pass
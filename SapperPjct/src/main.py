@@ -3,10 +3,18 @@ import os
 
 sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
 
+# Отсчет времени старта начинается здесь; с --profile-startup замеряется и каждый импорт
+from src.engine.startup_profile import STARTUP
+if '--profile-startup' in sys.argv:
+    STARTUP.track_imports()
+
 from src.engine.game import Game
 
 if __name__ == "__main__":
+    STARTUP.mark('imports')
     game = Game()
-    from src.scenes.menu_scene import MenuScene
-    game.state_manager.change_state(MenuScene(game)) 
+    STARTUP.mark('game_init')
+    # Сначала экран загрузки: ресурсы грузятся до меню, дальше он сам переключится на MenuScene
+    from src.scenes.loading_scene import LoadingScene
+    game.state_manager.change_state(LoadingScene(game))
     game.run()
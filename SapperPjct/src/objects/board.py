@@ -1,170 +1,424 @@
 import pygame
-import random
-from src.objects.cell import Cell
+import bisect
+import numpy as np
+from collections import OrderedDict
+from src.core.minesweeper import MinesweeperCore, EVENT_REVEAL, EVENT_FLAG, EVENT_EXPLODE
+from src.objects.cell import Cell, CellGrid
+from src.objects.tile_atlas import get_tile_atlas, TILE_CLOSED, TILE_FLAG, TILE_MINE
 from src.config.settings import SETTINGS
+from src.engine.audio_bus import AUDIO, PRIORITY_GAME
+from src.engine.perf_monitor import SURFACES
+
+# Камера: минимальный и максимальный размер клетки при масштабировании колесом
+MIN_CELL_SIZE = 10
+MAX_CELL_SIZE = 64
+# Доска в режиме камеры рисуется кусками CHUNK x CHUNK клеток, закэшированными в поверхностях
+CHUNK = 16
 
 class Board:
-    def __init__(self, rows, cols, mines, x_offset, y_offset, cell_size=None):
-        self.rows = rows
-        self.cols = cols
-        self.total_mines = mines
+    # Отображение доски: раскладка, отрисовка и звук поверх чистой логики MinesweeperCore
+    endless = False
+    def __init__(self, rows, cols, mines, x_offset, y_offset, cell_size=None, seed=None, core=None):
+        # core передается готовым для полей с другой логикой (EndlessBoard)
+        self.core = core if core is not None else MinesweeperCore(rows, cols, mines, seed)
         self.x_offset = x_offset
         self.y_offset = y_offset
         self.cell_size = cell_size if cell_size else SETTINGS.LAYOUT['cell_size']
-        
-        self.cells = []
-        self.game_over = False
-        self.win = False
-        self.first_click = True
-        self.flags_placed = 0
-        
-        self._create_grid()
-        
-    def _create_grid(self):
-        self.cells = []
-        for r in range(self.rows):
-            row_cells = []
-            for c in range(self.cols):
-                x = self.x_offset + c * self.cell_size
-                y = self.y_offset + r * self.cell_size
-                row_cells.append(Cell(r, c, x, y, self.cell_size))
-            self.cells.append(row_cells)
-            
+        self.atlas = None # Строится лениво при первой отрисовке или в update_layout
+
+        # Изменившиеся с прошлой отрисовки диапазоны клеток: (r0, r1, c0, c1), концы не включены
+        self.dirty_ranges = []
+        self.cells = CellGrid(self)
+        self.clicks = 0 # Клики по клеткам (для истории партий)
+
+        # Камера. viewport - видимая на экране часть доски; None - доска видна целиком
+        # (и рисуется напрямую, как в бенчмарках). x_offset/y_offset - экранные координаты
+        # клетки (0, 0), при прокрутке они уходят за край viewport.
+        self.view_area = None # Область экрана, отведенная под доску
+        self.viewport = None
+        self.cam_x = 0 # Прокрутка в пикселях доски
+        self.cam_y = 0
+        # Кэш кусков доски: (строка куска, столбец куска) -> поверхность (LRU)
+        self.chunks = OrderedDict()
+        self.chunk_limit = 64
+        self.view_dirty = False # Камера сдвинулась: перерисовать весь viewport (содержимое кусков не менялось)
+        self._view_state = None # (viewport, x_offset, y_offset, cell_size) на момент последнего _apply_camera
+
+    # Состояние доски живет в ядре; свойства оставлены для сцен и отладочной панели
+    @property
+    def rows(self):
+        return self.core.rows
+
+    @property
+    def cols(self):
+        return self.core.cols
+
+    @property
+    def total_mines(self):
+        return self.core.total_mines
+
+    @property
+    def seed(self):
+        return self.core.seed
+
+    @property
+    def first_click(self):
+        return self.core.first_click
+
+    @property
+    def flags_placed(self):
+        return self.core.flags_placed
+
+    @property
+    def safe_cells_left(self):
+        return self.core.safe_cells_left
+
+    @property
+    def game_over(self):
+        return self.core.game_over
+
+    @game_over.setter
+    def game_over(self, value):
+        self.core.game_over = value
+
+    @property
+    def win(self):
+        return self.core.win
+
+    @win.setter
+    def win(self, value):
+        self.core.win = value
+
+    @property
+    def is_mine(self):
+        return self.core.is_mine
+
+    @property
+    def is_open(self):
+        return self.core.is_open
+
+    @property
+    def is_flagged(self):
+        return self.core.is_flagged
+
+    @property
+    def neighbor_mines(self):
+        return self.core.neighbor_mines
+
     def update_layout(self, x_offset, y_offset, cell_size):
         self.x_offset = x_offset
         self.y_offset = y_offset
         self.cell_size = cell_size
-        
-        for r in range(self.rows):
-            for c in range(self.cols):
-                cell = self.cells[r][c]
-                cell.x = self.x_offset + c * self.cell_size
-                cell.y = self.y_offset + r * self.cell_size
-                cell.width = self.cell_size
-                cell.height = self.cell_size
-                cell.rect = pygame.Rect(cell.x, cell.y, cell.width, cell.height)
-            
+        self.atlas = get_tile_atlas(cell_size)
+        self.view_area = None
+        self.viewport = None
+        self._view_state = None
+        self.chunks.clear()
+        self.mark_all_dirty()
+
+    def set_view(self, area, cell_size):
+        # Доска центрируется в area; если не помещается - видна ее часть, остальное прокручивается
+        self.view_area = pygame.Rect(area)
+        self._set_cell_size(cell_size)
+        self._apply_camera()
+
+    def _set_cell_size(self, cell_size):
+        if cell_size != self.cell_size or self.atlas is None:
+            self.cell_size = cell_size
+            self.atlas = get_tile_atlas(cell_size)
+            self.chunks.clear()
+
+    def _apply_camera(self):
+        size = self.cell_size
+        board_w, board_h = self.cols * size, self.rows * size
+        area = self.view_area
+        self.viewport = pygame.Rect(0, 0, min(board_w, area.width), min(board_h, area.height))
+        self.viewport.center = area.center
+        self.cam_x = max(0, min(self.cam_x, board_w - self.viewport.width))
+        self.cam_y = max(0, min(self.cam_y, board_h - self.viewport.height))
+        self.x_offset = self.viewport.x - self.cam_x
+        self.y_offset = self.viewport.y - self.cam_y
+        # Под одновременно видимые куски (плюс запас на прокрутку) места в кэше должно хватать
+        visible = (self.viewport.width // (CHUNK * size) + 2) * (self.viewport.height // (CHUNK * size) + 2)
+        self.chunk_limit = max(64, visible * 2)
+        self._view_changed()
+
+    def _view_changed(self):
+        # Весь viewport перерисовывается, только если камера, область или масштаб действительно
+        # изменились: прокрутка у края или доски, которая и так помещается, ничего не стоит
+        state = (tuple(self.viewport), self.x_offset, self.y_offset, self.cell_size)
+        if state == self._view_state:
+            return False
+        self._view_state = state
+        self.view_dirty = True
+        return True
+
+    @property
+    def scrollable(self):
+        return self.viewport is not None and (
+            self.viewport.width < self.cols * self.cell_size or self.viewport.height < self.rows * self.cell_size)
+
+    def pan(self, dx, dy):
+        # Сдвиг камеры на (dx, dy) экранных пикселей; возвращает True, если вид изменился
+        if self.viewport is None:
+            return False
+        old = (self.cam_x, self.cam_y)
+        self.cam_x += int(dx)
+        self.cam_y += int(dy)
+        self._apply_camera()
+        return (self.cam_x, self.cam_y) != old
+
+    def zoom(self, steps, anchor):
+        # Масштаб колесом: точка доски под anchor остается на месте (пока доска прокручивается)
+        if self.viewport is None:
+            return False
+        old_size = self.cell_size
+        new_size = max(MIN_CELL_SIZE, min(MAX_CELL_SIZE, old_size + steps * max(1, old_size // 8)))
+        if new_size == old_size:
+            return False
+        bx = (anchor[0] - self.x_offset) / old_size
+        by = (anchor[1] - self.y_offset) / old_size
+        self._set_cell_size(new_size)
+        self.cam_x = int(bx * new_size - (anchor[0] - self.viewport.x))
+        self.cam_y = int(by * new_size - (anchor[1] - self.viewport.y))
+        self._apply_camera()
+        return True
+
+    @property
+    def view_rect(self):
+        # Видимая на экране часть доски
+        return self.viewport if self.viewport is not None else self.rect
+
+    def visible_range(self):
+        # Диапазон клеток, попадающих во viewport: (r0, r1, c0, c1), концы не включены
+        if self.viewport is None:
+            return 0, self.rows, 0, self.cols
+        size = self.cell_size
+        c0 = self.cam_x // size
+        r0 = self.cam_y // size
+        c1 = -(-(self.cam_x + self.viewport.width) // size)
+        r1 = -(-(self.cam_y + self.viewport.height) // size)
+        return self._clip_range(r0, r1, c0, c1)
+
+    def _clip_range(self, r0, r1, c0, c1):
+        # Обрезает диапазон клеток по краям доски
+        return max(0, r0), min(self.rows, r1), max(0, c0), min(self.cols, c1)
+
+    def mark_dirty(self, r0, r1, c0, c1):
+        self.dirty_ranges.append((r0, r1, c0, c1))
+
+    def mark_all_dirty(self):
+        self.dirty_ranges = [(0, self.rows, 0, self.cols)]
+
     def _place_mines(self, safe_row, safe_col):
-        mines_placed = 0
-        while mines_placed < self.total_mines:
-            r = random.randint(0, self.rows - 1)
-            c = random.randint(0, self.cols - 1)
-            
-            # Не ставим мину на уже существующую или на безопасную стартовую клетку (и соседей)
-            if not self.cells[r][c].is_mine and (abs(r - safe_row) > 1 or abs(c - safe_col) > 1):
-                self.cells[r][c].is_mine = True
-                mines_placed += 1
-                
-        # Подсчет соседей
-        for r in range(self.rows):
-            for c in range(self.cols):
-                if not self.cells[r][c].is_mine:
-                    self.cells[r][c].neighbor_mines = self._count_neighbors(r, c)
+        self.core.place_mines(safe_row, safe_col)
 
     def _count_neighbors(self, row, col):
-        count = 0
-        for r in range(max(0, row - 1), min(self.rows, row + 2)):
-            for c in range(max(0, col - 1), min(self.cols, col + 2)):
-                if self.cells[r][c].is_mine:
-                    count += 1
-        return count
-        
+        return self.core.count_neighbors(row, col)
+
+    @property
+    def rect(self):
+        return pygame.Rect(self.x_offset, self.y_offset, self.cols * self.cell_size, self.rows * self.cell_size)
+
+    def cell_at(self, pos):
+        # Возвращает (row, col) клетки под точкой или None
+        if self.viewport is not None and not self.viewport.collidepoint(pos):
+            return None
+        x = pos[0] - self.x_offset
+        y = pos[1] - self.y_offset
+        if x < 0 or y < 0:
+            return None
+        col = int(x // self.cell_size)
+        row = int(y // self.cell_size)
+        if row >= self.rows or col >= self.cols:
+            return None
+        return row, col
+
     def handle_click(self, pos, button):
         if self.game_over:
             return
 
-        # Находим нажатую клетку
-        clicked_cell = None
-        for row in self.cells:
-            for cell in row:
-                if cell.rect.collidepoint(pos):
-                    clicked_cell = cell
-                    break
-            if clicked_cell:
-                break
-                
-        if not clicked_cell:
+        # Находим нажатую клетку арифметикой, без перебора
+        hit = self.cell_at(pos)
+        if hit is None:
             return
-            
+        clicked_cell = Cell(self, *hit)
+
+        # В счетчик кликов (сохранение, история партий) идут только открытия и флаги
         if button == 1: # Левый клик
+            self.clicks += 1
             self._reveal(clicked_cell)
         elif button == 3: # Правый клик
+            self.clicks += 1
             self._toggle_flag(clicked_cell)
-            
+        else:
+            return
+
         self._check_win()
-        
+
     def _reveal(self, cell):
-        if cell.is_open or cell.is_flagged:
-            return
-            
-        if self.first_click:
-            self._place_mines(cell.row, cell.col)
-            self.first_click = False
-        
-        # Проигрываем звук клика (тихий), если игра не окончена
-        if not self.game_over:
-            from src.engine.resource_manager import RESOURCES
-            sound = RESOURCES.get_sound('click.wav')
-            if sound:
-                # Базовая громкость 0.15, умноженная на мастер-громкость эффектов
-                volume = SETTINGS.game_config['audio']['sfx_volume']
-                sound.set_volume(volume)
-                sound.play()
-            
-        cell.is_open = True
-        
-        if cell.is_mine:
-            self.game_over = True
-            self.win = False
-            self._reveal_all_mines()
-        elif cell.neighbor_mines == 0:
-            # Заливка (открытие пустых областей)
-            for r in range(max(0, cell.row - 1), min(self.rows, cell.row + 2)):
-                for c in range(max(0, cell.col - 1), min(self.cols, cell.col + 2)):
-                    neighbor = self.cells[r][c]
-                    if not neighbor.is_open:
-                        self._reveal(neighbor)
-                        
+        self.core.reveal(cell.row, cell.col)
+        self._process_events()
+
     def _toggle_flag(self, cell):
-        if not cell.is_open:
-            cell.is_flagged = not cell.is_flagged
-            if cell.is_flagged:
-                self.flags_placed += 1
-            else:
-                self.flags_placed -= 1
-                
+        self.core.toggle_flag(cell.row, cell.col)
+        self._process_events()
+
     def _reveal_all_mines(self):
-        for row in self.cells:
-            for cell in row:
-                if cell.is_mine:
-                    cell.is_open = True
-                    
+        self.core.reveal_all_mines()
+        self._process_events()
+
     def _check_win(self):
-        if self.game_over:
-            return
-            
-        covered_cells = 0
-        for row in self.cells:
-            for cell in row:
-                if not cell.is_open and not cell.is_mine:
-                    covered_cells += 1
-                    
-        if covered_cells == 0:
-            self.game_over = True
-            self.win = True
-            
+        self.core.check_win()
+        self._process_events()
+
+    def _process_events(self, sound=True):
+        # События ядра превращаются в грязные области и звук
+        play_click = False
+        for event in self.core.pop_events():
+            kind = event[0]
+            if kind == EVENT_REVEAL:
+                self.mark_dirty(*event[1:5])
+                play_click = True
+            elif kind == EVENT_FLAG:
+                self.mark_dirty(event[1], event[1] + 1, event[2], event[2] + 1)
+            elif kind == EVENT_EXPLODE:
+                play_click = True
+        # Звук клика - одно событие на всю заливку; одинаковые события за кадр сливает AUDIO
+        if play_click and sound:
+            AUDIO.post('click.wav', PRIORITY_GAME)
+
+    def range_rect(self, r0, r1, c0, c1):
+        size = self.cell_size
+        return pygame.Rect(self.x_offset + c0 * size, self.y_offset + r0 * size, (c1 - c0) * size, (r1 - r0) * size)
+
     def draw(self, surface):
-        # Обновляем размер шрифта в зависимости от текущего размера клетки
-        # Это немного затратно делать каждый кадр, если мы перезагружаем шрифт,
-        # но мы можем проверить, изменился ли размер клетки, или сделать это один раз в update_layout
-        # Пока просто передаем размер клетки в cell.draw или обрабатываем это там.
-        # На самом деле, Cell.draw использует RESOURCES.get_font. Давайте убедимся, что запрашиваем подходящий размер.
-        
-        # Вычисляем подходящий размер шрифта (например, 80% от высоты клетки)
-        font_size = int(self.cell_size * 0.8)
-        # Нам нужно передать это в клетку или установить глобальное/статическое свойство
-        # Так как Cell использует RESOURCES напрямую, нам может потребоваться изменить Cell.draw или передать его
-        
-        for row in self.cells:
-            for cell in row:
-                cell.draw(surface, font_size)
+        if self.viewport is None:
+            self._draw_cells(surface, 0, self.rows, 0, self.cols)
+        else:
+            self._update_chunks()
+            self._draw_view(surface, self.viewport)
+        self.dirty_ranges = []
+        self.view_dirty = False
+
+    def draw_dirty(self, surface, background):
+        # Перерисовывает только изменившиеся клетки поверх статичного фона и возвращает их области
+        rects = []
+        if self.viewport is not None:
+            self._update_chunks()
+            if self.view_dirty:
+                self.dirty_ranges = [self.visible_range()]
+                self.view_dirty = False
+        for r0, r1, c0, c1 in self.dirty_ranges:
+            rect = self.range_rect(r0, r1, c0, c1)
+            if self.viewport is not None:
+                rect = rect.clip(self.viewport)
+                if not rect.width or not rect.height:
+                    continue
+            surface.blit(background, rect, rect)
+            if self.viewport is None:
+                self._draw_cells(surface, r0, r1, c0, c1)
+            else:
+                self._draw_view(surface, rect)
+            rects.append(rect)
+        self.dirty_ranges = []
+        return rects
+
+    def _update_chunks(self):
+        # Изменившиеся клетки дорисовываются в уже закэшированные куски;
+        # куски, которых нет в кэше, соберутся целиком, когда попадут в кадр
+        for r0, r1, c0, c1 in self.dirty_ranges:
+            for key in list(self.chunks):
+                cr, cc = key
+                kr0, kc0 = cr * CHUNK, cc * CHUNK
+                pr0, pr1 = max(r0, kr0), min(r1, kr0 + CHUNK)
+                pc0, pc1 = max(c0, kc0), min(c1, kc0 + CHUNK)
+                if pr0 >= pr1 or pc0 >= pc1:
+                    continue
+                chunk = self.chunks[key]
+                size = self.cell_size
+                patch = pygame.Rect((pc0 - kc0) * size, (pr0 - kr0) * size, (pc1 - pc0) * size, (pr1 - pr0) * size)
+                chunk.fill((0, 0, 0, 0), patch)
+                self._draw_cells(chunk, pr0, pr1, pc0, pc1, -kc0 * size, -kr0 * size)
+
+    def _get_chunk(self, cr, cc):
+        key = (cr, cc)
+        chunk = self.chunks.get(key)
+        if chunk is not None:
+            self.chunks.move_to_end(key)
+            return chunk
+        r0, r1, c0, c1 = self._clip_range(cr * CHUNK, (cr + 1) * CHUNK, cc * CHUNK, (cc + 1) * CHUNK)
+        size = self.cell_size
+        chunk = SURFACES.new(pygame.Surface(((c1 - c0) * size, (r1 - r0) * size), pygame.SRCALPHA))
+        self._draw_cells(chunk, r0, r1, c0, c1, -c0 * size, -r0 * size)
+        self.chunks[key] = chunk
+        if len(self.chunks) > self.chunk_limit:
+            self.chunks.popitem(last=False) # Вытесняем самый давно показанный кусок
+        return chunk
+
+    def _draw_view(self, surface, area):
+        # Рисует часть доски внутри экранной области area из закэшированных кусков
+        size = self.cell_size
+        span = CHUNK * size
+        x0 = area.left - self.x_offset
+        y0 = area.top - self.y_offset
+        # Куски, которые пересекает область, в пределах доски
+        r0, r1, c0, c1 = self._clip_range(y0 // span * CHUNK, -(-(y0 + area.height) // span) * CHUNK,
+                                          x0 // span * CHUNK, -(-(x0 + area.width) // span) * CHUNK)
+        batch = []
+        for cr in range(r0 // CHUNK, -(-r1 // CHUNK)):
+            for cc in range(c0 // CHUNK, -(-c1 // CHUNK)):
+                chunk = self._get_chunk(cr, cc)
+                chunk_rect = chunk.get_rect(topleft=(self.x_offset + cc * span, self.y_offset + cr * span))
+                visible = chunk_rect.clip(area)
+                batch.append((chunk, visible.topleft, visible.move(-chunk_rect.x, -chunk_rect.y)))
+        surface.blits(batch, doreturn=False)
+
+    def tile_ids(self, r0, r1, c0, c1):
+        # Номера плиток атласа для диапазона клеток, одним векторным выражением
+        window = (slice(r0, r1), slice(c0, c1))
+        closed = np.where(self.is_flagged[window], TILE_FLAG, TILE_CLOSED)
+        opened = np.where(self.is_mine[window], TILE_MINE, self.neighbor_mines[window])
+        return np.where(self.is_open[window], opened, closed)
+
+    def _draw_cells(self, surface, r0, r1, c0, c1, x_offset=None, y_offset=None):
+        # По умолчанию клетки рисуются в экранных координатах; для кусков - со своим смещением
+        if self.atlas is None or self.atlas.cell_size != self.cell_size:
+            self.atlas = get_tile_atlas(self.cell_size)
+        tiles = self.atlas.tiles
+        size = self.cell_size
+        x_offset = self.x_offset if x_offset is None else x_offset
+        y_offset = self.y_offset if y_offset is None else y_offset
+        xs = [x_offset + c * size for c in range(c0, c1)]
+        ys = [y_offset + r * size for r in range(r0, r1)]
+
+        # Вся доска - один пакетный вызов blits
+        batch = [(tiles[tile], (x, y))
+                 for y, row in zip(ys, self.tile_ids(r0, r1, c0, c1).tolist())
+                 for x, tile in zip(xs, row)]
+        fblits = getattr(surface, 'fblits', None) # есть в pygame-ce
+        if fblits:
+            fblits(batch)
+        else:
+            surface.blits(batch, doreturn=False)
+
+
+class BoardIndex:
+    # Индекс досок сцены: по точке находит доску без перебора всех досок.
+    # Доски в сцене стоят в ряд и не пересекаются по X, поэтому хватает
+    # бинарного поиска по левым краям видимых областей.
+    def __init__(self, boards=()):
+        self.rebuild(boards)
+
+    def rebuild(self, boards):
+        self._boards = sorted(boards, key=lambda b: b.view_rect.left)
+        self._lefts = [b.view_rect.left for b in self._boards]
+
+    def board_at(self, pos):
+        i = bisect.bisect_right(self._lefts, pos[0]) - 1
+        if i < 0:
+            return None
+        board = self._boards[i]
+        if board.cell_at(pos) is None:
+            return None
+        return board
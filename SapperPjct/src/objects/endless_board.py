@@ -0,0 +1,86 @@
+import pygame
+from src.core.endless import EndlessCore, CHUNK as CORE_CHUNK
+from src.objects.board import Board, CHUNK
+from src.objects.tile_atlas import TILE_CLOSED, TILE_FLAG, TILE_MINE
+from src.config.settings import SETTINGS
+
+class EndlessBoard(Board):
+    # Бесконечное поле: камера без границ поверх EndlessCore.
+    # Отрисовка, кэш кусков, прокрутка и масштаб - от Board; здесь только то, что зависит от границ.
+    endless = True
+
+    def __init__(self, x_offset, y_offset, cell_size=None, seed=None, density=None, core=None):
+        config = SETTINGS.game_config.get('endless', {})
+        if density is None:
+            density = config.get('mine_density', 0.15)
+        # Сколько кусков ядра вокруг камеры держать распакованными
+        self.keep_radius = config.get('keep_chunks', 4)
+        if core is None:
+            core = EndlessCore(density, seed)
+        super().__init__(None, None, None, x_offset, y_offset, cell_size, core=core)
+
+    @property
+    def opened(self):
+        return self.core.opened
+
+    def continue_flood(self):
+        # Каждый кадр: продолжение заливки, не уместившейся в прошлые кадры (без нового звука клика)
+        if self.core.flood_stack:
+            self.core.continue_flood()
+            self._process_events(sound=False)
+
+    def set_view(self, area, cell_size):
+        if self.view_area is None:
+            # Сначала клетка (0, 0) - в центре отведенной области
+            self.cam_x = -(area.width // 2)
+            self.cam_y = -(area.height // 2)
+        super().set_view(area, cell_size)
+
+    def _apply_camera(self):
+        # Границ нет: viewport - вся отведенная область, камера не ограничена
+        size = self.cell_size
+        self.viewport = pygame.Rect(self.view_area)
+        self.x_offset = self.viewport.x - self.cam_x
+        self.y_offset = self.viewport.y - self.cam_y
+        visible = (self.viewport.width // (CHUNK * size) + 2) * (self.viewport.height // (CHUNK * size) + 2)
+        self.chunk_limit = max(64, visible * 2)
+        if self._view_changed():
+            self._trim()
+
+    def _trim(self):
+        # Дальние куски ядра сжимаются или выбрасываются; радиус не меньше видимой области
+        r0, r1, c0, c1 = self.visible_range()
+        span = max(r1 - r0, c1 - c0) // CORE_CHUNK + 1
+        self.core.trim((r0 + r1) // 2, (c0 + c1) // 2, max(self.keep_radius, span))
+
+    @property
+    def scrollable(self):
+        return True
+
+    def _clip_range(self, r0, r1, c0, c1):
+        return r0, r1, c0, c1
+
+    def mark_all_dirty(self):
+        if self.viewport is None:
+            self.dirty_ranges = []
+        else:
+            self.dirty_ranges = [self.visible_range()]
+
+    @property
+    def rect(self):
+        return self.view_rect
+
+    @property
+    def view_rect(self):
+        if self.viewport is None:
+            return pygame.Rect(self.x_offset, self.y_offset, 0, 0)
+        return self.viewport
+
+    def cell_at(self, pos):
+        if self.viewport is None or not self.viewport.collidepoint(pos):
+            return None
+        return int((pos[1] - self.y_offset) // self.cell_size), int((pos[0] - self.x_offset) // self.cell_size)
+
+    def tile_ids(self, r0, r1, c0, c1):
+        # Номера плиток собираются из кусков ядра (касание камерой создает кусок)
+        return self.core.tile_ids(r0, r1, c0, c1, TILE_CLOSED, TILE_FLAG, TILE_MINE)
@@ -0,0 +1,83 @@
+import pygame
+from src.config.settings import SETTINGS
+from src.engine.resource_manager import RESOURCES
+from src.engine.perf_monitor import SURFACES
+
+# Номера плиток: 0 - открытая пустая клетка, 1-8 - цифры
+TILE_CLOSED = 9
+TILE_FLAG = 10
+TILE_MINE = 11
+TILE_COUNT = 12
+
+# Цвета цифр (создаются один раз, а не при каждом вызове)
+NUMBER_COLORS = {
+    1: (0, 0, 255),
+    2: (0, 128, 0),
+    3: (255, 0, 0),
+    4: (0, 0, 128),
+    5: (128, 0, 0),
+    6: (0, 128, 128),
+    7: (0, 0, 0),
+    8: (128, 128, 128)
+}
+
+class TileAtlas:
+    # Заранее отрисованные плитки клеток для одного размера клетки.
+    # Доска рисуется простыми blit-ами этих поверхностей вместо draw.rect/render на каждую клетку.
+    def __init__(self, cell_size):
+        self.cell_size = cell_size
+        self.tiles = [self._render_tile(tile) for tile in range(TILE_COUNT)]
+
+    def _render_tile(self, tile):
+        size = self.cell_size
+        colors = SETTINGS.COLORS
+        surf = SURFACES.new(pygame.Surface((size, size), pygame.SRCALPHA))
+        rect = surf.get_rect()
+
+        # Фон
+        if tile == TILE_MINE:
+            color = colors['mine']
+        elif tile in (TILE_CLOSED, TILE_FLAG):
+            color = colors['cell_closed']
+        else:
+            color = colors['cell_opened']
+
+        # Рисуем клетку с небольшим отступом для эффекта сетки
+        pygame.draw.rect(surf, color, rect.inflate(-2, -2), border_radius=3)
+
+        # Содержимое
+        if tile == TILE_MINE:
+            # Рисуем мину (круг с шипами)
+            radius = size // 4
+            pygame.draw.circle(surf, (50, 0, 0), rect.center, radius)
+            pygame.draw.circle(surf, (0, 0, 0), rect.center, radius // 2)
+        elif 1 <= tile <= 8:
+            # Размер шрифта - 80% от высоты клетки
+            font = RESOURCES.get_font(SETTINGS.FONTS['main'], max(1, int(size * 0.8)))
+            text_surf = SURFACES.new(font.render(str(tile), True, NUMBER_COLORS[tile]))
+            surf.blit(text_surf, text_surf.get_rect(center=rect.center))
+        elif tile == TILE_FLAG:
+            # Рисуем флаг, масштабированный под размер клетки
+            # Древко
+            pole_top = rect.top + rect.height * 0.15
+            pole_bottom = rect.bottom - rect.height * 0.15
+            pygame.draw.line(surf, (0, 0, 0), (rect.centerx, pole_top), (rect.centerx, pole_bottom), max(1, int(rect.width * 0.05)))
+
+            # Полотнище флага
+            fp1 = (rect.centerx, pole_top)
+            fp2 = (rect.right - rect.width * 0.2, pole_top + rect.height * 0.15)
+            fp3 = (rect.centerx, pole_top + rect.height * 0.3)
+            pygame.draw.polygon(surf, colors['flag'], [fp1, fp2, fp3])
+
+        return surf
+
+
+_ATLASES = {}
+
+def get_tile_atlas(cell_size):
+    # Атлас строится один раз на каждый размер клетки
+    atlas = _ATLASES.get(cell_size)
+    if atlas is None:
+        atlas = TileAtlas(cell_size)
+        _ATLASES[cell_size] = atlas
+    return atlas
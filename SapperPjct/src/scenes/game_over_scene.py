@@ -15,9 +15,7 @@ class GameOverScene(State):
         self.font_title = RESOURCES.get_font(SETTINGS.FONTS['main'], SETTINGS.FONTS['size_large'])
         
         if time_taken is not None and difficulty is not None and "Win" in result_text and "Player" not in result_text:
-            # Победа в одиночной игре
-            from src.engine.save_manager import SAVE_MANAGER
-            SAVE_MANAGER.save_score(difficulty, time_taken)
+            # Победа в одиночной игре (результат уже записан GameScene)
             self.result_text += f" Time: {time_taken}s"
             
         self._create_ui()
@@ -49,7 +47,7 @@ class GameOverScene(State):
         screen.fill(SETTINGS.COLORS['background'])
         
         # Текст результата
-        text_surf = self.font_title.render(self.result_text, True, SETTINGS.COLORS['ui_text'])
+        text_surf = RESOURCES.render_text(SETTINGS.FONTS['main'], SETTINGS.FONTS['size_large'], self.result_text, SETTINGS.COLORS['ui_text'])
         text_rect = text_surf.get_rect(center=(SETTINGS.WIDTH // 2, SETTINGS.HEIGHT // 3))
         screen.blit(text_surf, text_rect)
         
@@ -1,29 +1,44 @@
 import pygame
 import os
 from src.engine.state_manager import State
-from src.objects.board import Board
+from src.objects.board import Board, BoardIndex, MIN_CELL_SIZE
+from src.objects.endless_board import EndlessBoard
+from src.core.minesweeper import campaign_level, CAMPAIGN_MAX_LEVEL
 from src.config.settings import SETTINGS
 from src.engine.resource_manager import RESOURCES
+from src.engine.save_manager import SAVE_MANAGER
+from src.engine.audio_bus import AUDIO, PRIORITY_OUTCOME
+from src.ui.backgrounds import BACKGROUNDS
+from src.engine.perf_monitor import SURFACES
 
 class GameScene(State):
-    def __init__(self, game, difficulty='easy', num_players=1, level=1):
+    def __init__(self, game, difficulty='easy', num_players=1, level=1, saved=None):
+        # saved - партия из SAVE_MANAGER.load_game(), которую нужно продолжить
         super().__init__(game)
         self.difficulty = difficulty
         self.num_players = num_players
         self.level = level
         self.boards = []
+        self.board_index = BoardIndex()
         self.game_over_timer = 0
         self.start_time = pygame.time.get_ticks()
         self.font_hud = RESOURCES.get_font(SETTINGS.FONTS['main'], SETTINGS.FONTS['size_medium'])
+        self._hud_panels = {}
+        self.lose_overlay = None
         
         self.pause_btn = None
         self.p1_lost_triggered = False
         self.p2_lost_triggered = False
-        self._setup_boards()
+        self._recorded = False # Результат одиночной партии уже записан в историю
+        self._drag = None # Перетаскивание камеры средней кнопкой: (доска, последняя позиция)
+        if saved is not None:
+            self._restore_boards(saved)
+        else:
+            self._setup_boards()
         self._create_ui()
         
         # Запускаем фоновую музыку (сначала пробуем OGG, затем MP3)
-        if SETTINGS.game_config['audio']['enabled']:
+        if SETTINGS.game_config['audio']['enabled'] and pygame.mixer.get_init():
             music_loaded = False
             for music_file in ['bgm.ogg', 'bgm.mp3']:
                 music_path = os.path.join(RESOURCES.assets_dir, 'sounds', music_file)
@@ -93,11 +108,13 @@ class GameScene(State):
         self.game.state_manager.change_state(PauseScene(self.game, self))
         
     def _setup_boards(self):
-        if self.difficulty == 'campaign':
-            # Прогрессия кампании: начинаем с малого, увеличиваем/усложняем
-            rows = 5 + self.level * 2
-            cols = 5 + self.level * 2
-            mines = int(rows * cols * 0.15) # 15% мин
+        if self.difficulty == 'endless':
+            # Бесконечное поле: размеров и числа мин нет, раскладка - только камера
+            self.boards = [EndlessBoard(0, 0) for _ in range(self.num_players)]
+            self._apply_layout()
+            return
+        elif self.difficulty == 'campaign':
+            rows, cols, mines = campaign_level(self.level)
         else:
             diff_config = SETTINGS.game_config['difficulty_levels'][self.difficulty]
             rows = diff_config['rows']
@@ -114,10 +131,51 @@ class GameScene(State):
             
         self._apply_layout()
         
+    def _restore_boards(self, saved):
+        for info in saved['boards']:
+            core = info['core']
+            if self.difficulty == 'endless':
+                self.boards.append(EndlessBoard(0, 0, core=core))
+            else:
+                self.boards.append(Board(core.rows, core.cols, core.total_mines, 0, 0, core=core))
+        self._apply_layout()
+        # Камера и масштаб - как были при сохранении
+        for board, info in zip(self.boards, saved['boards']):
+            board._set_cell_size(info['cell_size'])
+            board.cam_x = info['cam_x']
+            board.cam_y = info['cam_y']
+            board.clicks = info['clicks']
+            board._apply_camera()
+        self.board_index.rebuild(self.boards)
+        self.start_time = pygame.time.get_ticks() - saved['elapsed_ms']
+
+    def elapsed_ms(self):
+        if getattr(self, 'paused', False):
+            return self.pause_start_time - self.start_time
+        return pygame.time.get_ticks() - self.start_time
+
+    def can_save(self):
+        # Сохранять есть что, пока партия идет и хотя бы на одной доске сделан ход
+        if hasattr(self, 'losing'):
+            return False
+        if all(board.game_over for board in self.boards):
+            return False
+        return not all(board.first_click for board in self.boards)
+
     def _apply_layout(self):
         if not self.boards: return
         
+        # Корректируем Y, чтобы освободить место для HUD
+        hud_height = 80 # Увеличено для лучшего интервала
+        margin = 30
+
         board = self.boards[0]
+        if board.endless:
+            for board, area in zip(self.boards, self._camera_areas(hud_height, margin)):
+                board.set_view(area, board.cell_size)
+            self.board_index.rebuild(self.boards)
+            return
+
         rows = board.rows
         cols = board.cols
         
@@ -125,10 +183,6 @@ class GameScene(State):
         board_w = cols * SETTINGS.LAYOUT['cell_size']
         board_h = rows * SETTINGS.LAYOUT['cell_size']
         
-        # Корректируем Y, чтобы освободить место для HUD
-        hud_height = 80 # Увеличено для лучшего интервала
-        margin = 30
-        
         # Вычисляем требуемый размер
         if self.num_players == 1:
             req_w = board_w + margin * 2
@@ -146,37 +200,62 @@ class GameScene(State):
             self.scale = min(scale_w, scale_h)
             
         scaled_cell_size = int(SETTINGS.LAYOUT['cell_size'] * self.scale)
-        scaled_board_w = cols * scaled_cell_size
-        scaled_board_h = rows * scaled_cell_size
         
-        if self.num_players == 1:
-            x = (SETTINGS.WIDTH - scaled_board_w) // 2
-            y = (SETTINGS.HEIGHT - scaled_board_h + hud_height) // 2
-            self.boards[0].update_layout(x, y, scaled_cell_size)
+        if scaled_cell_size < MIN_CELL_SIZE:
+            # Доска не помещается даже с минимальной клеткой: каждой доске отводится
+            # вся свободная область, а остальное прокручивается камерой
+            scaled_cell_size = MIN_CELL_SIZE
+            areas = self._camera_areas(hud_height, margin)
         else:
-            gap = 60 * self.scale # Масштабируем зазор тоже
-            total_w = scaled_board_w * 2 + gap
-            start_x = (SETTINGS.WIDTH - total_w) // 2
-            y = (SETTINGS.HEIGHT - scaled_board_h + hud_height) // 2
+            scaled_board_w = cols * scaled_cell_size
+            scaled_board_h = rows * scaled_cell_size
             
-            self.boards[0].update_layout(start_x, y, scaled_cell_size)
-            self.boards[1].update_layout(start_x + scaled_board_w + gap, y, scaled_cell_size)
+            if self.num_players == 1:
+                x = (SETTINGS.WIDTH - scaled_board_w) // 2
+                y = (SETTINGS.HEIGHT - scaled_board_h + hud_height) // 2
+                areas = [pygame.Rect(x, y, scaled_board_w, scaled_board_h)]
+            else:
+                gap = 60 * self.scale # Масштабируем зазор тоже
+                total_w = scaled_board_w * 2 + gap
+                start_x = (SETTINGS.WIDTH - total_w) // 2
+                y = (SETTINGS.HEIGHT - scaled_board_h + hud_height) // 2
+                
+                areas = [pygame.Rect(start_x, y, scaled_board_w, scaled_board_h),
+                         pygame.Rect(start_x + scaled_board_w + gap, y, scaled_board_w, scaled_board_h)]
+
+        # Колесо мыши дальше меняет масштаб в пределах отведенной области
+        for board, area in zip(self.boards, areas):
+            board.set_view(area, scaled_cell_size)
+
+        self.board_index.rebuild(self.boards)
+
+    def _camera_areas(self, hud_height, margin):
+        # Вся свободная под HUD область, поровну между досками
+        top = hud_height + margin
+        height = SETTINGS.HEIGHT - top - margin
+        if self.num_players == 1:
+            return [pygame.Rect(margin, top, SETTINGS.WIDTH - margin * 2, height)]
+        gap = 60
+        area_w = (SETTINGS.WIDTH - margin * 2 - gap) // 2
+        return [pygame.Rect(margin, top, area_w, height),
+                pygame.Rect(margin + area_w + gap, top, area_w, height)]
             
     def on_resize(self, width, height):
         self._apply_layout()
         self._create_ui() # Пересоздаем UI для обновления позиции кнопок
+        self.invalidate()
 
     def pause_game(self):
         self.paused = True
         self.pause_start_time = pygame.time.get_ticks()
-        pygame.mixer.music.pause()
+        AUDIO.music('pause')
         
     def resume_game(self):
         self.paused = False
         if hasattr(self, 'pause_start_time'):
             pause_duration = pygame.time.get_ticks() - self.pause_start_time
             self.start_time += pause_duration # Сдвигаем время старта, чтобы игнорировать длительность паузы
-        pygame.mixer.music.unpause()
+        AUDIO.music('unpause')
              
     def update(self):
         if self.debug_panel:
@@ -186,6 +265,18 @@ class GameScene(State):
             self.pause_btn.update(pygame.mouse.get_pos())
         if self.debug_btn:
             self.debug_btn.update(pygame.mouse.get_pos())
+
+        # Прокрутка камеры стрелками
+        keys = pygame.key.get_pressed()
+        dx = (keys[pygame.K_RIGHT] - keys[pygame.K_LEFT]) * 12
+        dy = (keys[pygame.K_DOWN] - keys[pygame.K_UP]) * 12
+        if dx or dy:
+            for board in self.boards:
+                if board.scrollable:
+                    board.pan(dx, dy)
+        for board in self.boards:
+            if board.endless:
+                board.continue_flood()
             
         # Если активен эффект проигрыша, обновляем его
         if hasattr(self, 'losing') and self.losing:
@@ -199,6 +290,11 @@ class GameScene(State):
                 self.game.state_manager.change_state(GameOverScene(self.game, winner_text, self.lose_elapsed, self.difficulty, self.num_players, self.level))
                 self.losing = False
             return # Не обрабатываем логику игры во время затемнения
+
+        # Законченная одиночная партия записывается в историю один раз, в момент окончания
+        if self.num_players == 1 and self.boards[0].game_over and not self._recorded:
+            self._recorded = True
+            SAVE_MANAGER.record_game(self.difficulty, self.level, self.boards[0], self.elapsed_ms(), self.boards[0].win)
         
         # Проверяем условия окончания игры
         all_finished = True
@@ -213,11 +309,8 @@ class GameScene(State):
         if self.num_players == 1:
             if any_lost and not hasattr(self, 'losing'):
                  # Останавливаем музыку и играем звук взрыва
-                pygame.mixer.music.stop()
-                sound = RESOURCES.get_sound('explode.wav')
-                if sound:
-                    sound.set_volume(SETTINGS.game_config['audio']['sfx_volume'])
-                    sound.play()
+                AUDIO.music('stop')
+                AUDIO.post('explode.wav', PRIORITY_OUTCOME)
                 
                 elapsed = (pygame.time.get_ticks() - self.start_time) // 1000
                 self._show_lose_effect(elapsed, 'lose.png', 2000)
@@ -232,7 +325,7 @@ class GameScene(State):
             
             # Ждем пока ОБА закончат
             if p1_finished and p2_finished and not hasattr(self, 'losing'):
-                pygame.mixer.music.stop()
+                AUDIO.music('stop')
                 
                 p1_win = p1.win
                 p2_win = p2.win
@@ -256,10 +349,7 @@ class GameScene(State):
                     img_name = 'p1_lose.png'
                     sound_name = 'mp_lose.wav'
                     
-                sound = RESOURCES.get_sound(sound_name)
-                if sound:
-                    sound.set_volume(SETTINGS.game_config['audio']['sfx_volume'])
-                    sound.play()
+                AUDIO.post(sound_name, PRIORITY_OUTCOME)
                 
                 # MP win/lose изображения: 9 секунд, другие: 2 секунды
                 if img_name in ['mp_win.png', 'p1_lose.png', 'p2_lose.png']:
@@ -295,16 +385,12 @@ class GameScene(State):
                     if self.boards[0].win:
                         winner_text = "You Win!"
                         # Останавливаем музыку и играем звук победы
-                        pygame.mixer.music.stop()
-                        sound = RESOURCES.get_sound('win.wav')
-                        if sound:
-                            sound.set_volume(SETTINGS.game_config['audio']['sfx_volume'])
-                            sound.play()
+                        AUDIO.music('stop')
+                        AUDIO.post('win.wav', PRIORITY_OUTCOME)
                         
                         if self.difficulty == 'campaign':
                              # Проверяем максимальный уровень
-                             MAX_CAMPAIGN_LEVEL = 10
-                             if self.level >= MAX_CAMPAIGN_LEVEL:
+                             if self.level >= CAMPAIGN_MAX_LEVEL:
                                  winner_text = "Campaign Complete!"
                                  self.game.state_manager.change_state(GameOverScene(self.game, winner_text, elapsed, self.difficulty, self.num_players, self.level))
                                  return
@@ -325,7 +411,7 @@ class GameScene(State):
                     else: winner_text = "Both Lost!"
                     
                     # Останавливаем музыку для мультиплеера тоже
-                    pygame.mixer.music.stop()
+                    AUDIO.music('stop')
                     self.game.state_manager.change_state(GameOverScene(self.game, winner_text, None, self.difficulty, self.num_players, self.level))
                     
     def _show_lose_effect(self, elapsed, image_name='lose.png', duration=2000, winner_text='You Lose!'):
@@ -338,108 +424,130 @@ class GameScene(State):
         self.lose_elapsed = elapsed
         self.lose_duration = duration
         self.lose_winner_text = winner_text
+        self.lose_overlay = self._prepare_lose_overlay(image_name)
         
-    def draw(self, screen):
-        # 1. Рисуем фон
-        bg_name = None
-        if os.path.exists(os.path.join(RESOURCES.assets_dir, 'images', 'background.png')):
-            bg_name = 'background.png'
-        elif os.path.exists(os.path.join(RESOURCES.assets_dir, 'images', 'background.jpg')):
-            bg_name = 'background.jpg'
-            
-        if bg_name:
-            # Рисуем темную основу
-            screen.fill((20, 20, 20))
-            
-            bg_img = RESOURCES.get_image(bg_name)
-            bg_scaled = pygame.transform.scale(bg_img, (SETTINGS.WIDTH, SETTINGS.HEIGHT))
-            
-            # Рисуем фон полностью непрозрачным сначала
-            screen.blit(bg_scaled, (0, 0))
-            
-            # Добавляем глобальное темное наложение, чтобы UI выделялся
-            # Не слишком темное, чтобы не скрыть крутое изображение, но достаточно, чтобы уменьшить шум
-            overlay = pygame.Surface((SETTINGS.WIDTH, SETTINGS.HEIGHT))
-            overlay.set_alpha(100) # ~40% затемнения
-            overlay.fill((0, 0, 0))
-            screen.blit(overlay, (0, 0))
-        else:
-            # Запасная сетка
-            bg_color = (15, 17, 22) 
-            screen.fill(bg_color)
-            grid_color = (255, 255, 255, 3)
-            cell_size = 50
-            grid_surf = pygame.Surface((SETTINGS.WIDTH, SETTINGS.HEIGHT), pygame.SRCALPHA)
-            for x in range(0, SETTINGS.WIDTH, cell_size):
-                pygame.draw.line(grid_surf, grid_color, (x, 0), (x, SETTINGS.HEIGHT), 1)
-            for y in range(0, SETTINGS.HEIGHT, cell_size):
-                pygame.draw.line(grid_surf, grid_color, (0, y), (SETTINGS.WIDTH, y), 1)
-            screen.blit(grid_surf, (0,0))
-            
-        # 2. Рисуем полупрозрачное наложение позади досок (Эффект стекла)
+    def _prepare_lose_overlay(self, image_name):
+        lose_img = RESOURCES.get_image(image_name)
+        
+        # Масштабируем изображение, чтобы оно было меньше (макс 600x600)
+        img_w, img_h = lose_img.get_size()
+        max_size = 600
+        if img_w > max_size or img_h > max_size:
+            scale = max_size / max(img_w, img_h)
+            new_w = int(img_w * scale)
+            new_h = int(img_h * scale)
+            return SURFACES.new(pygame.transform.scale(lose_img, (new_w, new_h)))
+        # Копируем, чтобы set_alpha не менял кэшированную версию
+        return SURFACES.new(lose_img.copy())
+        
+    def exit(self):
+        # Освобождаем подготовленное изображение эффекта (при возврате из паузы оно соберется заново)
+        self.lose_overlay = None
+        
+    def _get_static_layer(self):
+        # Фон и стеклянные панели под досками не меняются между кадрами:
+        # собираем их в одну поверхность и пересобираем только при смене раскладки
+        key = (SETTINGS.WIDTH, SETTINGS.HEIGHT, tuple(tuple(board.view_rect) for board in self.boards))
+        if getattr(self, '_static_key', None) != key:
+            layer = SURFACES.new(BACKGROUNDS.get('game', SETTINGS.WIDTH, SETTINGS.HEIGHT).copy())
+            self._draw_board_panels(layer)
+            self._static_layer = layer
+            self._static_key = key
+        return self._static_layer
+
+    def _draw_board_panels(self, screen):
+        # Полупрозрачное наложение позади досок (Эффект стекла)
         for board in self.boards:
-            # Область доски
-            bx = board.cells[0][0].rect.left - 15
-            by = board.cells[0][0].rect.top - 15
-            bw = board.cols * board.cell_size + 30
-            bh = board.rows * board.cell_size + 30
+            # Видимая область доски (при прокрутке панель не выходит за viewport)
+            view = board.view_rect
+            bx = view.x - 15
+            by = view.y - 15
+            bw = view.width + 30
+            bh = view.height + 30
             
             # Стеклянная панель - Темнее для контраста
-            panel_surf = pygame.Surface((bw, bh), pygame.SRCALPHA)
+            panel_surf = SURFACES.new(pygame.Surface((bw, bh), pygame.SRCALPHA))
             pygame.draw.rect(panel_surf, (10, 10, 10, 180), panel_surf.get_rect(), border_radius=15) # Темнее и более непрозрачно
             pygame.draw.rect(panel_surf, (255, 255, 255, 20), panel_surf.get_rect(), 1, border_radius=15) # Тонкая граница
             screen.blit(panel_surf, (bx, by))
-        
-        # 3. Рисуем HUD (Таймер)
+
+    def _get_hud_panel(self, width, height, border_color, radius):
+        # Фоны панелей HUD строятся один раз на размер
+        key = (width, height, border_color, radius)
+        panel = self._hud_panels.get(key)
+        if panel is None:
+            panel = SURFACES.new(pygame.Surface((width, height), pygame.SRCALPHA))
+            pygame.draw.rect(panel, (0, 0, 0, 200), panel.get_rect(), border_radius=radius)
+            pygame.draw.rect(panel, border_color, panel.get_rect(), 1, border_radius=radius)
+            self._hud_panels[key] = panel
+        return panel
+
+    def _timer_text(self):
         if hasattr(self, 'paused') and self.paused:
             elapsed = (self.pause_start_time - self.start_time) // 1000
         else:
             elapsed = (pygame.time.get_ticks() - self.start_time) // 1000
-        timer_text = f"TIME: {elapsed:03}"
-        
+        return f"TIME: {elapsed:03}"
+
+    def _draw_timer(self, screen, timer_text):
         # Панель таймера
-        # Белый текст для максимальной читаемости
-        timer_surf = self.font_hud.render(timer_text, True, (255, 255, 255)) 
+        # Белый текст для максимальной читаемости, собирается из кэшированных глифов
+        timer_surf = RESOURCES.render_counter(SETTINGS.FONTS['main'], SETTINGS.FONTS['size_medium'], timer_text, (255, 255, 255))
         padding_x, padding_y = 20, 10
         timer_w = timer_surf.get_width() + padding_x * 2
         timer_h = timer_surf.get_height() + padding_y * 2
         timer_x = SETTINGS.WIDTH // 2 - timer_w // 2
         timer_y = 10
         
-        timer_bg = pygame.Surface((timer_w, timer_h), pygame.SRCALPHA)
-        # Темный фон для панели
-        pygame.draw.rect(timer_bg, (0, 0, 0, 200), timer_bg.get_rect(), border_radius=10)
-        # Голубая акцентная граница
-        pygame.draw.rect(timer_bg, (0, 255, 255, 100), timer_bg.get_rect(), 1, border_radius=10) 
+        # Темный фон и голубая акцентная граница
+        timer_bg = self._get_hud_panel(timer_w, timer_h, (0, 255, 255, 100), 10)
         screen.blit(timer_bg, (timer_x, timer_y))
         screen.blit(timer_surf, (timer_x + padding_x, timer_y + padding_y))
+
+        self._hud_timer = (timer_text, pygame.Rect(timer_x, timer_y, timer_w, timer_h))
+        return self._hud_timer[1]
+
+    def _mines_text(self, board):
+        if board.endless:
+            # У бесконечного поля нет общего числа мин - показываем, сколько открыто
+            return f"OPENED: {board.opened}"
+        mines_left = board.total_mines - board.flags_placed
+        return f"MINES: {mines_left}"
+
+    def _draw_mines_counter(self, screen, i, board, mines_text):
+        # Панель мин
+        # Белый текст
+        mines_surf = RESOURCES.render_counter(SETTINGS.FONTS['main'], SETTINGS.FONTS['size_medium'], mines_text, (255, 255, 255))
+        
+        # Позиция над доской
+        bx = board.view_rect.x
+        by = board.view_rect.y - 75
+        
+        padding_x, padding_y = 15, 8
+        mines_w = mines_surf.get_width() + padding_x * 2
+        mines_h = mines_surf.get_height() + padding_y * 2
+        
+        # Темный фон и красная акцентная граница
+        mines_bg = self._get_hud_panel(mines_w, mines_h, (255, 80, 80, 100), 8)
+        
+        screen.blit(mines_bg, (bx, by))
+        screen.blit(mines_surf, (bx + padding_x, by + padding_y))
+
+        self._hud_mines[i] = (mines_text, pygame.Rect(bx, by, mines_w, mines_h))
+        return self._hud_mines[i][1]
+
+    def draw(self, screen):
+        # 1. Рисуем фон и панели досок (из кэша)
+        screen.blit(self._get_static_layer(), (0, 0))
+        
+        # 2. Рисуем HUD (Таймер)
+        self._draw_timer(screen, self._timer_text())
         
+        self._hud_mines = {}
         for i, board in enumerate(self.boards):
             board.draw(screen)
             # Рисуем счетчик мин для каждой доски
-            mines_left = board.total_mines - board.flags_placed
-            mines_text = f"MINES: {mines_left}"
-            
-            # Панель мин
-            # Белый текст
-            mines_surf = self.font_hud.render(mines_text, True, (255, 255, 255))
-            
-            # Позиция над доской
-            bx = board.cells[0][0].rect.left
-            by = board.cells[0][0].rect.top - 75
-            
-            padding_x, padding_y = 15, 8
-            mines_w = mines_surf.get_width() + padding_x * 2
-            mines_h = mines_surf.get_height() + padding_y * 2
-            
-            mines_bg = pygame.Surface((mines_w, mines_h), pygame.SRCALPHA)
-            # Темный фон
-            pygame.draw.rect(mines_bg, (0, 0, 0, 200), mines_bg.get_rect(), border_radius=8)
-            # Красная акцентная граница
-            pygame.draw.rect(mines_bg, (255, 80, 80, 100), mines_bg.get_rect(), 1, border_radius=8) 
-            
-            screen.blit(mines_bg, (bx, by))
-            screen.blit(mines_surf, (bx + padding_x, by + padding_y))
+            self._draw_mines_counter(screen, i, board, self._mines_text(board))
             
         if hasattr(self, 'losing') and self.losing:
             # Рисуем изображение проигрыша с затуханием
@@ -466,16 +574,11 @@ class GameScene(State):
                 # Нормальное затухание на протяжении всего времени
                 alpha = max(0, 255 - int((diff / duration) * 255))
             
-            lose_img = RESOURCES.get_image(img_name).copy() # Копируем, чтобы избежать изменения кэшированной версии
-            
-            # Масштабируем изображение, чтобы оно было меньше (макс 600x600)
-            img_w, img_h = lose_img.get_size()
-            max_size = 600
-            if img_w > max_size or img_h > max_size:
-                scale = max_size / max(img_w, img_h)
-                new_w = int(img_w * scale)
-                new_h = int(img_h * scale)
-                lose_img = pygame.transform.scale(lose_img, (new_w, new_h))
+            # Масштабированное изображение готовится один раз в _show_lose_effect,
+            # каждый кадр меняется только альфа
+            if self.lose_overlay is None:
+                self.lose_overlay = self._prepare_lose_overlay(img_name)
+            lose_img = self.lose_overlay
             
             # Центрируем изображение
             img_rect = lose_img.get_rect(center=(SETTINGS.WIDTH//2, SETTINGS.HEIGHT//2))
@@ -490,6 +593,40 @@ class GameScene(State):
             self.debug_btn.draw(screen)
         if self.debug_panel:
             self.debug_panel.draw(screen)
+
+    def draw_dirty(self, screen):
+        # Во время эффекта проигрыша и с открытой панелью отладки кадр рисуется целиком
+        if self.full_redraw or getattr(self, 'losing', False) or self.debug_panel.visible:
+            self.full_redraw = False
+            return None
+            
+        static = self._get_static_layer()
+        rects = []
+        for board in self.boards:
+            rects.extend(board.draw_dirty(screen, static))
+            
+        # Таймер и счетчики мин перерисовываются только когда меняется их текст
+        timer_text = self._timer_text()
+        if timer_text != self._hud_timer[0]:
+            old_rect = self._hud_timer[1]
+            screen.blit(static, old_rect, old_rect)
+            rects.append(old_rect.union(self._draw_timer(screen, timer_text)))
+            
+        for i, board in enumerate(self.boards):
+            mines_text = self._mines_text(board)
+            if mines_text != self._hud_mines[i][0]:
+                old_rect = self._hud_mines[i][1]
+                screen.blit(static, old_rect, old_rect)
+                rects.append(old_rect.union(self._draw_mines_counter(screen, i, board, mines_text)))
+                
+        for btn in (self.pause_btn, self.debug_btn):
+            if btn and btn.dirty:
+                bounds = btn.bounds
+                screen.blit(static, bounds, bounds)
+                btn.draw(screen)
+                rects.append(bounds)
+                
+        return rects
             
     def handle_event(self, event):
         if self.debug_panel and self.debug_panel.handle_event(event):
@@ -502,10 +639,27 @@ class GameScene(State):
             if self.debug_btn and self.debug_btn.handle_event(event):
                 return
  
-            # В MP, мы можем захотеть ограничить клики конкретными областями или использовать разные вводы?
-            # Пока что клики мышью работают на любой доске
-            for board in self.boards:
+            # Клик передается только доске под курсором
+            board = self.board_index.board_at(event.pos)
+            if board and event.button == 2:
+                self._drag = (board, event.pos)
+            elif board and event.button in (1, 3):
+                # Кнопки 4/5 - это колесо: pygame 2 присылает их вместе с MOUSEWHEEL
                 board.handle_click(event.pos, event.button)
+        elif event.type == pygame.MOUSEBUTTONUP and event.button == 2:
+            self._drag = None
+        elif event.type == pygame.MOUSEMOTION and self._drag:
+            # Перетаскивание: доска движется вслед за курсором
+            board, last = self._drag
+            board.pan(last[0] - event.pos[0], last[1] - event.pos[1])
+            self._drag = (board, event.pos)
+        elif event.type == pygame.MOUSEWHEEL:
+            pos = pygame.mouse.get_pos()
+            board = self.board_index.board_at(pos)
+            if board and board.zoom(event.y, pos):
+                # Меняются видимые области и стеклянные панели: кадр рисуется заново
+                self.board_index.rebuild(self.boards)
+                self.invalidate()
         elif event.type == pygame.KEYDOWN:
             if event.key == pygame.K_ESCAPE:
                 # Открываем меню паузы
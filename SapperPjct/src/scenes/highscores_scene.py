@@ -1,9 +1,15 @@
 import pygame
+from datetime import date
 from src.engine.state_manager import State
 from src.config.settings import SETTINGS
 from src.ui.ui_elements import Button
 from src.engine.resource_manager import RESOURCES
 from src.engine.save_manager import SAVE_MANAGER
+from src.ui.backgrounds import BACKGROUNDS
+from src.engine.perf_monitor import SURFACES
+
+PAGE_SIZE = 7 # Строк в колонке на одной странице
+TREND_SIZE = 3 # Сколько последних рекордов показывать в строке роста рекорда
 
 class HighScoresScene(State):
     def __init__(self, game):
@@ -11,14 +17,60 @@ class HighScoresScene(State):
         self.buttons = []
         self.font_title = RESOURCES.get_font(SETTINGS.FONTS['main'], SETTINGS.FONTS['size_large'])
         self.font_text = RESOURCES.get_font(SETTINGS.FONTS['main'], SETTINGS.FONTS['size_medium'])
+        self._panel_surf = None # Стеклянная панель колонки, одна на все колонки
+        self.difficulties = list(SETTINGS.game_config['difficulty_levels'])
+        # Запросы к базе идут в потоке записи (там же база открывается и переносит старый json),
+        # чтобы кадр их не ждал; пока ответа нет, рисуются заглушки.
+        # Поток только присваивает готовый результат, сцена его читает
+        self.page = 0
+        self.page_count = 1
+        self._summary = None # {сложность: (сегодня (партий, побед), рост рекорда [мс, ...])}
+        self._rows = None # (страница, {сложность: строки})
+        SAVE_MANAGER.writer.call(self._load_summary)
+        self._load_page()
         self._create_ui()
         
     def _create_ui(self):
         cx = SETTINGS.WIDTH // 2
         cy = SETTINGS.HEIGHT - 100
         w, h = 200, 50
+        arrow_size = 50
         
+        self.buttons.append(Button(cx - w//2 - arrow_size - 10, cy, arrow_size, h, "<", self._prev_page, style='glass'))
         self.buttons.append(Button(cx - w//2, cy, w, h, "BACK", self._to_menu, style='danger'))
+        self.buttons.append(Button(cx + w//2 + 10, cy, arrow_size, h, ">", self._next_page, style='glass'))
+
+    def _load_summary(self):
+        # В потоке записи
+        store = SAVE_MANAGER.store
+        most = max(store.count_wins(diff) for diff in self.difficulties)
+        today = date.today().isoformat()
+        summary = {}
+        for diff in self.difficulties:
+            days = store.daily(diff, 1)
+            played_won = days[0][1:3] if days and days[0][0] == today else (0, 0)
+            trend = [time_ms for _, time_ms in store.best_trend(diff)[-TREND_SIZE:]]
+            summary[diff] = (played_won, trend)
+        self.page_count = max(1, -(-most // PAGE_SIZE))
+        self._summary = summary
+
+    def _load_page(self):
+        SAVE_MANAGER.writer.call(self._fetch_page, self.page)
+
+    def _fetch_page(self, page):
+        # В потоке записи; ответ на уже пролистанную страницу отбрасывается в draw()
+        offset = page * PAGE_SIZE
+        self._rows = (page, {diff: SAVE_MANAGER.store.top(diff, PAGE_SIZE, offset) for diff in self.difficulties})
+
+    def _prev_page(self):
+        if self.page > 0:
+            self.page -= 1
+            self._load_page()
+
+    def _next_page(self):
+        if self.page + 1 < self.page_count:
+            self.page += 1
+            self._load_page()
         
     def _to_menu(self):
         from src.scenes.menu_scene import MenuScene
@@ -30,51 +82,33 @@ class HighScoresScene(State):
             btn.update(mouse_pos)
             
     def _draw_background(self, screen):
-        # Повторно используем профессиональный фон из MenuScene
-        # В идеале это должно быть в общей утилите или базовом классе, но пока дублируем или импортируем
-        # Давайте продублируем логику для независимости и небольших вариаций, если потребуется
-        bg_color = (15, 17, 22) 
-        screen.fill(bg_color)
-        
-        # Сетка
-        grid_color = (255, 255, 255, 3)
-        cell_size = 50
-        grid_surf = pygame.Surface((SETTINGS.WIDTH, SETTINGS.HEIGHT), pygame.SRCALPHA)
-        for x in range(0, SETTINGS.WIDTH, cell_size):
-            pygame.draw.line(grid_surf, grid_color, (x, 0), (x, SETTINGS.HEIGHT), 1)
-        for y in range(0, SETTINGS.HEIGHT, cell_size):
-            pygame.draw.line(grid_surf, grid_color, (0, y), (SETTINGS.WIDTH, y), 1)
-        screen.blit(grid_surf, (0,0))
-        
-        # Виньетка/Свечение
-        center = (SETTINGS.WIDTH//2, SETTINGS.HEIGHT//2)
-        glow_surf = pygame.Surface((SETTINGS.WIDTH, SETTINGS.HEIGHT), pygame.SRCALPHA)
-        glow_color = (30, 35, 45, 20) 
-        pygame.draw.circle(glow_surf, glow_color, center, 500)
-        screen.blit(glow_surf, (0,0))
+        # Тот же стиль, что и у меню, из общего кэша фонов
+        screen.blit(BACKGROUNDS.get('highscores', SETTINGS.WIDTH, SETTINGS.HEIGHT), (0, 0))
 
     def draw(self, screen):
         self._draw_background(screen)
         
+        font_name = SETTINGS.FONTS['main']
+        title_size = SETTINGS.FONTS['size_large']
+        text_size = SETTINGS.FONTS['size_medium']
+        
         # Заголовок
         title_text = "HIGH SCORES"
         # Тень
-        shadow_surf = self.font_title.render(title_text, True, (0, 0, 0))
+        shadow_surf = RESOURCES.render_text(font_name, title_size, title_text, (0, 0, 0))
         shadow_rect = shadow_surf.get_rect(center=(SETTINGS.WIDTH // 2 + 4, 50 + 4))
         screen.blit(shadow_surf, shadow_rect)
         
-        title_surf = self.font_title.render(title_text, True, (255, 255, 255))
+        title_surf = RESOURCES.render_text(font_name, title_size, title_text, (255, 255, 255))
         title_rect = title_surf.get_rect(center=(SETTINGS.WIDTH // 2, 50))
         screen.blit(title_surf, title_rect)
         
         # Рисуем очки
-        scores = SAVE_MANAGER.scores
-        difficulties = ['easy', 'medium', 'hard']
-        
-        col_width = SETTINGS.WIDTH // 3
+        page_rows = self._rows # Поток записи может заменить ответ посреди кадра
+        col_width = SETTINGS.WIDTH // len(self.difficulties)
         start_y = 120
         
-        for i, diff in enumerate(difficulties):
+        for i, diff in enumerate(self.difficulties):
             x = i * col_width + col_width // 2
             
             # Панель колонки (Эффект стекла)
@@ -82,14 +116,15 @@ class HighScoresScene(State):
             panel_h = 400
             panel_rect = pygame.Rect(x - panel_w//2, start_y - 10, panel_w, panel_h)
             
-            panel_surf = pygame.Surface((panel_w, panel_h), pygame.SRCALPHA)
-            pygame.draw.rect(panel_surf, (30, 30, 30, 100), panel_surf.get_rect(), border_radius=15)
-            pygame.draw.rect(panel_surf, (100, 100, 100, 50), panel_surf.get_rect(), 1, border_radius=15)
-            screen.blit(panel_surf, panel_rect)
+            if self._panel_surf is None:
+                self._panel_surf = SURFACES.new(pygame.Surface((panel_w, panel_h), pygame.SRCALPHA))
+                pygame.draw.rect(self._panel_surf, (30, 30, 30, 100), self._panel_surf.get_rect(), border_radius=15)
+                pygame.draw.rect(self._panel_surf, (100, 100, 100, 50), self._panel_surf.get_rect(), 1, border_radius=15)
+            screen.blit(self._panel_surf, panel_rect)
             
             # Заголовок
             header_text = diff.upper()
-            header_surf = self.font_text.render(header_text, True, (0, 255, 255)) # Голубой
+            header_surf = RESOURCES.render_text(font_name, text_size, header_text, (0, 255, 255)) # Голубой
             header_rect = header_surf.get_rect(center=(x, start_y + 20))
             screen.blit(header_surf, header_rect)
             
@@ -97,17 +132,38 @@ class HighScoresScene(State):
             pygame.draw.line(screen, (0, 255, 255, 100), (x - 50, start_y + 45), (x + 50, start_y + 45), 2)
             
             # Время
-            diff_scores = scores.get(diff, [])
-            for j, score in enumerate(diff_scores):
-                if j >= 5: break # Показываем топ 5
-                time_str = f"{j+1}. {score}s"
+            rows = page_rows[1][diff] if page_rows is not None and page_rows[0] == self.page else None
+            if rows is None:
+                wait_surf = RESOURCES.render_text(font_name, text_size, "...", (150, 150, 150))
+                screen.blit(wait_surf, wait_surf.get_rect(center=(x, start_y + 70)))
+                rows = ()
+            for j, (time_ms, clicks, played_at) in enumerate(rows):
+                place = self.page * PAGE_SIZE + j + 1
+                time_str = f"{place}. {time_ms / 1000:.2f}s"
                 
                 # Подсветка топ 1
-                color = (255, 215, 0) if j == 0 else (200, 200, 200)
+                color = (255, 215, 0) if place == 1 else (200, 200, 200)
                 
-                score_surf = self.font_text.render(time_str, True, color)
+                score_surf = RESOURCES.render_text(font_name, text_size, time_str, color)
                 score_rect = score_surf.get_rect(center=(x, start_y + 70 + j * 40))
                 screen.blit(score_surf, score_rect)
+
+            if self._summary is None:
+                continue
+            # Рост личного рекорда: последние побитые рекорды, от старого к текущему
+            (played, won), trend = self._summary[diff]
+            if trend:
+                trend_str = "PB: " + " > ".join(f"{time_ms / 1000:.1f}" for time_ms in trend)
+                trend_surf = RESOURCES.render_text(font_name, SETTINGS.FONTS['size_small'], trend_str, (255, 215, 0))
+                screen.blit(trend_surf, trend_surf.get_rect(center=(x, start_y + panel_h - 60)))
+
+            # Сегодня: сыграно и выиграно
+            today_surf = RESOURCES.render_text(font_name, text_size, f"Today: {won}/{played}", (150, 150, 150))
+            screen.blit(today_surf, today_surf.get_rect(center=(x, start_y + panel_h - 30)))
+
+        # Номер страницы
+        page_surf = RESOURCES.render_text(font_name, text_size, f"{self.page + 1}/{self.page_count}", (200, 200, 200))
+        screen.blit(page_surf, page_surf.get_rect(center=(SETTINGS.WIDTH // 2, SETTINGS.HEIGHT - 130)))
         
         for btn in self.buttons:
             btn.draw(screen)
@@ -0,0 +1,75 @@
+import pygame
+import time
+from src.engine.state_manager import State
+from src.engine.asset_preloader import AssetPreloader
+from src.config.settings import SETTINGS
+from src.engine.resource_manager import RESOURCES
+from src.ui.backgrounds import BACKGROUNDS
+from src.engine.perf_monitor import SURFACES
+
+class LoadingScene(State):
+    # Короткий экран при старте: ресурсы из манифеста грузятся заранее,
+    # чтобы ни один игровой кадр не ждал диска
+    def __init__(self, game):
+        super().__init__(game)
+        self.preloader = AssetPreloader(audio_ready=game.audio_ready)
+        # Первый кадр - со встроенным шрифтом pygame: поиск системных шрифтов (SysFont) небыстрый
+        # и выполняется одним из шагов загрузки
+        self.font = pygame.font.Font(None, 32)
+        font_name = SETTINGS.FONTS['main']
+        sizes = [v for k, v in SETTINGS.FONTS.items() if k.startswith('size_')]
+        sizes += SETTINGS.asset_manifest.get('font_sizes', [])
+
+        # Работа только для главного потока: шрифты (SDL_ttf не потокобезопасен),
+        # заглушки для необязательных файлов и фоны сцен (нужна загруженная картинка фона)
+        self.main_steps = [lambda size=size: RESOURCES.get_font(font_name, size) for size in sizes]
+        self.main_steps += [lambda name=name: RESOURCES.get_image(name) for name in self.preloader.optional_missing]
+        self.main_steps += [lambda style=style: BACKGROUNDS.get(style, SETTINGS.WIDTH, SETTINGS.HEIGHT)
+                            for style in ('menu', 'highscores', 'game')]
+        self.steps_done = 0
+        self.preloader.start()
+        from src.engine.save_manager import SAVE_MANAGER
+        SAVE_MANAGER.open_store()
+
+    @property
+    def progress(self):
+        total = self.preloader.total + len(self.main_steps)
+        return (self.preloader.done + self.steps_done) / total if total else 1.0
+
+    def update(self):
+        if not self.preloader.poll():
+            return
+        if not self.game.audio_ready.is_set():
+            # Меню и сцены сразу обращаются к микшеру
+            return
+        if self.steps_done < len(self.main_steps):
+            # Шаги в пределах бюджета кадра, чтобы полоса прогресса двигалась
+            deadline = time.perf_counter() + 0.008
+            while self.steps_done < len(self.main_steps) and time.perf_counter() < deadline:
+                self.main_steps[self.steps_done]()
+                self.steps_done += 1
+            return
+        from src.scenes.menu_scene import MenuScene
+        self.game.state_manager.change_state(MenuScene(self.game))
+
+    def on_resize(self, width, height):
+        # Фоны собираются под текущий размер окна: уже собранные для старого размера не нужны
+        self.main_steps += [lambda style=style: BACKGROUNDS.get(style, width, height)
+                            for style in ('menu', 'highscores', 'game')]
+
+    def draw(self, screen):
+        screen.fill((15, 17, 22))
+        cx = SETTINGS.WIDTH // 2
+        cy = SETTINGS.HEIGHT // 2
+
+        text_surf = SURFACES.new(self.font.render("LOADING", True, (200, 200, 200)))
+        screen.blit(text_surf, text_surf.get_rect(center=(cx, cy - 40)))
+
+        # Полоса прогресса
+        bar = pygame.Rect(0, 0, 400, 12)
+        bar.center = (cx, cy)
+        pygame.draw.rect(screen, (40, 44, 52), bar, border_radius=6)
+        fill = bar.copy()
+        fill.width = int(bar.width * self.progress)
+        if fill.width > 0:
+            pygame.draw.rect(screen, (0, 200, 255), fill, border_radius=6)
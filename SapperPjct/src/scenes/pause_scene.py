@@ -3,6 +3,9 @@ from src.engine.state_manager import State
 from src.config.settings import SETTINGS
 from src.ui.ui_elements import Button, Slider
 from src.engine.resource_manager import RESOURCES
+from src.engine.save_manager import SAVE_MANAGER
+from src.engine.audio_bus import AUDIO
+from src.engine.perf_monitor import SURFACES
 
 class PauseScene(State):
     def __init__(self, game, previous_scene):
@@ -43,7 +46,7 @@ class PauseScene(State):
         SETTINGS.game_config['audio']['sfx_volume'] = val 
         
         # Применяем немедленно
-        pygame.mixer.music.set_volume(val)
+        AUDIO.music('set_volume', val)
         # Громкость SFX применяется при воспроизведении, но мы не можем легко обновить играющие звуки. 
         # Будущие звуки будут использовать новую громкость.
         
@@ -54,8 +57,11 @@ class PauseScene(State):
         
     def _to_menu(self):
         from src.scenes.menu_scene import MenuScene
+        # Незаконченная партия сохраняется, в меню ее можно продолжить
+        if self.previous_scene.can_save():
+            SAVE_MANAGER.save_game(self.previous_scene)
         # Останавливаем музыку если играет (хотя она может быть на паузе)
-        pygame.mixer.music.stop()
+        AUDIO.music('stop')
         self.game.state_manager.change_state(MenuScene(self.game))
         
     def update(self):
@@ -70,7 +76,7 @@ class PauseScene(State):
         self.previous_scene.draw(screen)
         
         # Темное наложение
-        overlay = pygame.Surface((SETTINGS.WIDTH, SETTINGS.HEIGHT))
+        overlay = SURFACES.new(pygame.Surface((SETTINGS.WIDTH, SETTINGS.HEIGHT)))
         overlay.set_alpha(200) # Более темное наложение
         overlay.fill((10, 12, 15))
         screen.blit(overlay, (0, 0))
@@ -79,27 +85,23 @@ class PauseScene(State):
         panel_w, panel_h = 400, 500
         panel_rect = pygame.Rect((SETTINGS.WIDTH - panel_w)//2, (SETTINGS.HEIGHT - panel_h)//2, panel_w, panel_h)
         
-        panel_surf = pygame.Surface((panel_w, panel_h), pygame.SRCALPHA)
+        panel_surf = SURFACES.new(pygame.Surface((panel_w, panel_h), pygame.SRCALPHA))
         pygame.draw.rect(panel_surf, (30, 30, 30, 150), panel_surf.get_rect(), border_radius=20)
         pygame.draw.rect(panel_surf, (255, 255, 255, 20), panel_surf.get_rect(), 1, border_radius=20)
         screen.blit(panel_surf, panel_rect)
         
         # Заголовок
         title_text = "PAUSED"
-        shadow_surf = self.font_title.render(title_text, True, (0, 0, 0))
+        shadow_surf = RESOURCES.render_text(SETTINGS.FONTS['main'], SETTINGS.FONTS['size_large'], title_text, (0, 0, 0))
         shadow_rect = shadow_surf.get_rect(center=(SETTINGS.WIDTH // 2 + 4, panel_rect.top + 80 + 4))
         screen.blit(shadow_surf, shadow_rect)
         
-        title_surf = self.font_title.render(title_text, True, (255, 255, 255))
+        title_surf = RESOURCES.render_text(SETTINGS.FONTS['main'], SETTINGS.FONTS['size_large'], title_text, (255, 255, 255))
         title_rect = title_surf.get_rect(center=(SETTINGS.WIDTH // 2, panel_rect.top + 80))
         screen.blit(title_surf, title_rect)
         
-        # Метка громкости
-        vol_label = self.font_title.render("Volume", True, (200, 200, 200)) # Повторное использование большого шрифта, но может слишком большой?
-        # Давайте используем меньший шрифт если доступен, или просто уменьшим? 
-        # На самом деле ui_elements использует size_medium, давайте возьмем его
-        font_med = RESOURCES.get_font(SETTINGS.FONTS['main'], SETTINGS.FONTS['size_medium'])
-        vol_surf = font_med.render("Master Volume", True, (200, 200, 200))
+        # Метка громкости (ui_elements использует size_medium, берем его же)
+        vol_surf = RESOURCES.render_text(SETTINGS.FONTS['main'], SETTINGS.FONTS['size_medium'], "Master Volume", (200, 200, 200))
         vol_rect = vol_surf.get_rect(center=(SETTINGS.WIDTH // 2, self.sliders[0].rect.top - 20))
         screen.blit(vol_surf, vol_rect)
         
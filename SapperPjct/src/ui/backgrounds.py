@@ -0,0 +1,98 @@
+import pygame
+import os
+from src.engine.resource_manager import RESOURCES
+from src.engine.perf_monitor import SURFACES
+
+class BackgroundCache:
+    # Кэш процедурных фонов: все статичные слои (сетка, свечение, сканлайны)
+    # собираются один раз на (стиль, ширина, высота) в одну поверхность,
+    # и каждый кадр фон стоит одного blit.
+    def __init__(self):
+        self.layers = {}
+        self.painters = {
+            'menu': self._paint_menu,
+            'highscores': self._paint_highscores,
+            'game': self._paint_game,
+        }
+
+    def get(self, style, width, height):
+        key = (style, width, height)
+        if key not in self.layers:
+            surf = SURFACES.new(pygame.Surface((width, height)))
+            if pygame.display.get_surface():
+                surf = SURFACES.new(surf.convert())
+            self.painters[style](surf, width, height)
+            self.layers[key] = surf
+        return self.layers[key]
+
+    def invalidate(self):
+        # Вызывается при изменении размера окна и переключении полноэкранного режима
+        self.layers = {}
+
+    def _paint_grid(self, screen, width, height):
+        # Тонкая сетка: очень слабые линии (альфа 3/255)
+        grid_color = (255, 255, 255, 3)
+        cell_size = 50
+        grid_surf = SURFACES.new(pygame.Surface((width, height), pygame.SRCALPHA))
+        for x in range(0, width, cell_size):
+            pygame.draw.line(grid_surf, grid_color, (x, 0), (x, height), 1)
+        for y in range(0, height, cell_size):
+            pygame.draw.line(grid_surf, grid_color, (0, y), (width, y), 1)
+        screen.blit(grid_surf, (0, 0))
+
+    def _paint_menu(self, screen, width, height):
+        # Профессиональный фон в темной теме
+        # Глубокая темно-сине-серая основа
+        screen.fill((15, 17, 22))
+
+        # 1. Тонкая сетка
+        self._paint_grid(screen, width, height)
+
+        # 2. Свечение в центре, немного светлее фона
+        center = (width // 2, height // 2)
+        glow_surf = SURFACES.new(pygame.Surface((width, height), pygame.SRCALPHA))
+        glow_color = (30, 35, 45, 20)
+        pygame.draw.circle(glow_surf, glow_color, center, 500)
+        pygame.draw.circle(glow_surf, glow_color, center, 300)
+        screen.blit(glow_surf, (0, 0))
+
+        # 3. Эффект сканлайна (очень тонкий), добавляет ощущение "монитора"
+        scan_surf = SURFACES.new(pygame.Surface((width, height), pygame.SRCALPHA))
+        for y in range(0, height, 4):
+            pygame.draw.line(scan_surf, (0, 0, 0, 20), (0, y), (width, y), 1)
+        screen.blit(scan_surf, (0, 0))
+
+    def _paint_highscores(self, screen, width, height):
+        screen.fill((15, 17, 22))
+        self._paint_grid(screen, width, height)
+
+        # Виньетка/Свечение
+        glow_surf = SURFACES.new(pygame.Surface((width, height), pygame.SRCALPHA))
+        pygame.draw.circle(glow_surf, (30, 35, 45, 20), (width // 2, height // 2), 500)
+        screen.blit(glow_surf, (0, 0))
+
+    def _paint_game(self, screen, width, height):
+        bg_name = None
+        for name in ('background.png', 'background.jpg'):
+            if os.path.exists(os.path.join(RESOURCES.assets_dir, 'images', name)):
+                bg_name = name
+                break
+
+        if bg_name:
+            # Рисуем фон полностью непрозрачным
+            bg_img = RESOURCES.get_image(bg_name)
+            screen.fill((20, 20, 20))
+            screen.blit(SURFACES.new(pygame.transform.scale(bg_img, (width, height))), (0, 0))
+
+            # Глобальное темное наложение (~40%), чтобы UI выделялся
+            overlay = SURFACES.new(pygame.Surface((width, height)))
+            overlay.set_alpha(100)
+            overlay.fill((0, 0, 0))
+            screen.blit(overlay, (0, 0))
+        else:
+            # Запасная сетка
+            screen.fill((15, 17, 22))
+            self._paint_grid(screen, width, height)
+
+# Глобальный экземпляр
+BACKGROUNDS = BackgroundCache()
@@ -1,7 +1,9 @@
 import pygame
+import os
 from src.config.settings import SETTINGS
 from src.ui.ui_elements import Button
 from src.engine.resource_manager import RESOURCES
+from src.engine.perf_monitor import SURFACES
 
 class DebugPanel:
     def __init__(self, game_scene):
@@ -12,6 +14,14 @@ class DebugPanel:
         self.height = 0 # Будет вычислено
         self.x = SETTINGS.WIDTH - self.width - 70 # Слева от кнопки отладки
         self.y = 70 # Под кнопкой отладки
+        self._bg_surf = None # Фон панели, пересоздается только при смене размера
+
+        # Страница производительности: FPS, график кадров, фазы, аллокации, кэши
+        self.show_perf = False
+        self.perf = game_scene.game.perf
+        self.profile_frames = 300
+        self.perf_height = 206
+        self.profile_btn = None
         
         self._create_buttons()
         
@@ -28,6 +38,14 @@ class DebugPanel:
             self.buttons.append(btn)
             current_y += btn_h + gap
             
+        add_btn("Dirty Rects", self.game_scene.game.toggle_dirty_debug)
+        add_btn("Performance", self._toggle_perf)
+        if self.show_perf:
+            add_btn(self._profile_label(), self._start_profile)
+            self.profile_btn = self.buttons[-1]
+        else:
+            self.profile_btn = None
+
         if self.game_scene.num_players == 1:
             add_btn("Force Win", self.game_scene.debug_force_win)
         else:
@@ -35,13 +53,34 @@ class DebugPanel:
             add_btn("P2 Win", lambda: self.game_scene.debug_force_win(player=2))
             add_btn("Both Win", lambda: self.game_scene.debug_force_win(player=3))
             
+        self.perf_y = current_y
+        if self.show_perf:
+            current_y += self.perf_height
         self.height = current_y - self.y
+
+    def _toggle_perf(self):
+        self.show_perf = not self.show_perf
+        self._create_buttons()
+        self.game_scene.invalidate()
+
+    def _start_profile(self):
+        self.perf.start_profile(self.profile_frames)
+
+    def _profile_label(self):
+        # Без счетчика кадров: иначе кнопка перерисовывалась бы каждый кадр и попадала в профиль
+        if self.perf.profiling:
+            return "Profiling..."
+        return f"Profile {self.profile_frames}"
         
     def toggle(self):
         self.visible = not self.visible
+        # После закрытия панели под ней нужно перерисовать сцену целиком
+        self.game_scene.invalidate()
         
     def update(self, mouse_pos):
         if not self.visible: return
+        if self.profile_btn:
+            self.profile_btn.text = self._profile_label()
         for btn in self.buttons:
             btn.update(mouse_pos)
             
@@ -58,15 +97,75 @@ class DebugPanel:
         # Рисуем стеклянную панель
         rect = pygame.Rect(self.x, self.y, self.width, self.height)
         
-        # Фон
-        bg_surf = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
-        pygame.draw.rect(bg_surf, (20, 20, 25, 230), bg_surf.get_rect(), border_radius=10)
-        
-        # Граница (Неоновый голубой)
-        pygame.draw.rect(bg_surf, (0, 255, 255, 100), bg_surf.get_rect(), 1, border_radius=10)
+        if self._bg_surf is None or self._bg_surf.get_size() != rect.size:
+            # Фон
+            bg_surf = SURFACES.new(pygame.Surface(rect.size, pygame.SRCALPHA))
+            pygame.draw.rect(bg_surf, (20, 20, 25, 230), bg_surf.get_rect(), border_radius=10)
+            
+            # Граница (Неоновый голубой)
+            pygame.draw.rect(bg_surf, (0, 255, 255, 100), bg_surf.get_rect(), 1, border_radius=10)
+            self._bg_surf = bg_surf
         
-        surface.blit(bg_surf, rect)
+        surface.blit(self._bg_surf, rect)
         
         # Рисуем кнопки
         for btn in self.buttons:
             btn.draw(surface)
+
+        if self.show_perf:
+            self._draw_perf(surface)
+
+    def _draw_perf(self, surface):
+        # Текст страницы меняется каждый кадр, поэтому рендерится напрямую шрифтом,
+        # мимо кэша текста (иначе он вытеснял бы полезные строки и портил статистику кэшей)
+        font = RESOURCES.get_font(SETTINGS.FONTS['main'], 14)
+        x = self.x + 10
+        y = self.perf_y
+        width = self.width - 20
+        budget = 1000 / SETTINGS.FPS
+
+        # График времени кадров (работа кадра без ожидания clock.tick)
+        graph = pygame.Rect(x, y, width, 50)
+        pygame.draw.rect(surface, (10, 10, 14), graph)
+        totals = [record['total'] for record in self.perf.history]
+        scale = max(budget * 2, max(totals, default=0))
+        bar_w = width / self.perf.history.maxlen
+        for i, total in enumerate(totals):
+            h = max(1, int(graph.height * min(total, scale) / scale))
+            if total > budget:
+                color = (255, 80, 80)
+            elif total > budget / 2:
+                color = (255, 200, 0)
+            else:
+                color = (0, 200, 120)
+            bx = graph.x + int(i * bar_w)
+            pygame.draw.rect(surface, color, (bx, graph.bottom - h, max(1, int(bar_w)), h))
+        # Линия бюджета кадра
+        budget_y = graph.bottom - int(graph.height * budget / scale)
+        pygame.draw.line(surface, (0, 255, 255), (graph.x, budget_y), (graph.right - 1, budget_y), 1)
+        y = graph.bottom + 6
+
+        fps = self.perf.fps_stats(self.game_scene.game.clock)
+        phases = self.perf.phase_averages()
+        rates = RESOURCES.hit_rates()
+
+        def rate(name):
+            value = rates[name]
+            return '--' if value is None else f"{value * 100:.0f}%"
+
+        lines = [
+            f"FPS {fps['fps']:.1f}   frame {fps['last']:.2f} ms",
+            f"worst {fps['worst']:.2f} ms / {budget:.1f} ms",
+            f"events {phases['events']:.2f}  update {phases['update']:.2f}",
+            f"draw {phases['draw']:.2f}  flip {phases['flip']:.2f}",
+            f"surfaces/frame {self.perf.allocations_per_frame():.1f}",
+            f"text {rate('texts')}  glyph {rate('glyphs')}",
+            f"font {rate('fonts')}  image {rate('images')}",
+            f"first frame {self.game_scene.game.first_frame_ms or 0:.0f} ms",
+        ]
+        if self.perf.last_profile:
+            lines.append(f"saved {os.path.basename(self.perf.last_profile)}")
+        for line in lines:
+            text_surf = SURFACES.new(font.render(line, True, (200, 220, 230)))
+            surface.blit(text_surf, (x, y))
+            y += 16
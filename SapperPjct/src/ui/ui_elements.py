@@ -1,6 +1,8 @@
 import pygame
 from src.config.settings import SETTINGS
 from src.engine.resource_manager import RESOURCES
+from src.engine.audio_bus import AUDIO, PRIORITY_UI
+from src.engine.perf_monitor import SURFACES
 
 class Button:
     def __init__(self, x, y, width, height, text, callback, style='glass', icon=None):
@@ -12,28 +14,73 @@ class Button:
         
         self.font = RESOURCES.get_font(SETTINGS.FONTS['main'], SETTINGS.FONTS['size_medium'])
         self.is_hovered = False
+        self.is_pressed = False
         self.alpha = 0
+        self.dirty = True # Внешний вид изменился с прошлой отрисовки
+
+        # Заранее отрисованные состояния кнопки ('normal', 'hovered', 'pressed').
+        # Сбрасываются, только если меняется текст, размер, стиль или иконка.
+        self._state_surfaces = {}
+        self._render_key = None
         
+    @property
+    def bounds(self):
+        # Область, которую занимает кнопка вместе с тенью
+        return self.rect.union(self.rect.move(0, 2))
+
     def update(self, mouse_pos):
         was_hovered = self.is_hovered
         self.is_hovered = self.rect.collidepoint(mouse_pos)
+        if not self.is_hovered:
+            self.is_pressed = False
+        if was_hovered != self.is_hovered:
+            self.dirty = True
         
     def handle_event(self, event):
         if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+            if self.is_hovered:
+                self.is_pressed = True
+                self.dirty = True
             if self.is_hovered and self.callback:
                 # проигываем звук клика
-                sound = RESOURCES.get_sound('click.wav')
-                if sound:
-                    volume = SETTINGS.game_config['audio']['sfx_volume']
-                    sound.set_volume(volume)
-                    sound.play()
+                AUDIO.post('click.wav', PRIORITY_UI)
                 self.callback()
                 return True
+        elif event.type == pygame.MOUSEBUTTONUP and event.button == 1:
+            if self.is_pressed:
+                self.is_pressed = False
+                self.dirty = True
         return False
+
+    def _visual_state(self):
+        if self.is_pressed:
+            return 'pressed'
+        if self.is_hovered:
+            return 'hovered'
+        return 'normal'
                 
     def draw(self, surface):
+        key = (self.text, self.rect.size, self.style, self.icon)
+        if key != self._render_key:
+            self._state_surfaces = {}
+            self._render_key = key
+
+        state = self._visual_state()
+        state_surf = self._state_surfaces.get(state)
+        if state_surf is None:
+            state_surf = self._render_state(state)
+            self._state_surfaces[state] = state_surf
+
+        surface.blit(state_surf, self.rect.topleft)
+        self.dirty = False
+
+    def _render_state(self, state):
         # Профессиональная дизайн-система
         # Стиль: "Кибер-минимализм"
+        w, h = self.rect.size
+        # Поверхность покрывает кнопку вместе с тенью (на 2px ниже)
+        out = SURFACES.new(pygame.Surface((w, h + 2), pygame.SRCALPHA))
+        highlighted = state != 'normal'
         
         # Цвета и градиенты
         if self.style == 'primary':
@@ -53,33 +100,30 @@ class Button:
             text_color = (200, 200, 200)
 
         # Логика состояния наведения
-        if self.is_hovered:
+        if highlighted:
             # Заливка становится немного светлее/цветной
             r, g, b = accent_color
             fill_color = (r, g, b, 50) # Легкий оттенок
             border_color = accent_color
             border_width = 2
-            shadow_alpha = 150
-            scale_offset = -1 # Небольшое уменьшение или просто изменение границы? Оставим размер стабильным
         else:
             fill_color = base_color
             border_color = (accent_color[0], accent_color[1], accent_color[2], 100) # Тусклая граница
             border_width = 1
-            shadow_alpha = 50
 
-        # 1. Рисуем тень (мягкое свечение позади)
-        shadow_rect = self.rect.copy()
-        shadow_rect.y += 2
-        shadow_surf = pygame.Surface((self.rect.width, self.rect.height), pygame.SRCALPHA)
-        # Если наведено, тень - цветное свечение
-        if self.is_hovered:
-            pygame.draw.rect(shadow_surf, (*accent_color, 30), shadow_surf.get_rect(), border_radius=8)
-        else:
-            pygame.draw.rect(shadow_surf, (0, 0, 0, 100), shadow_surf.get_rect(), border_radius=8)
-        surface.blit(shadow_surf, shadow_rect)
+        # 1. Рисуем тень (мягкое свечение позади); нажатая кнопка "опускается" на тень
+        body_y = 2 if state == 'pressed' else 0
+        if state != 'pressed':
+            shadow_surf = SURFACES.new(pygame.Surface((w, h), pygame.SRCALPHA))
+            # Если наведено, тень - цветное свечение
+            if highlighted:
+                pygame.draw.rect(shadow_surf, (*accent_color, 30), shadow_surf.get_rect(), border_radius=8)
+            else:
+                pygame.draw.rect(shadow_surf, (0, 0, 0, 100), shadow_surf.get_rect(), border_radius=8)
+            out.blit(shadow_surf, (0, 2))
 
         # 2. Рисуем тело кнопки
-        btn_surf = pygame.Surface((self.rect.width, self.rect.height), pygame.SRCALPHA)
+        btn_surf = SURFACES.new(pygame.Surface((w, h), pygame.SRCALPHA))
         
         # Заливка фона
         pygame.draw.rect(btn_surf, fill_color, btn_surf.get_rect(), border_radius=8)
@@ -94,29 +138,29 @@ class Button:
             pygame.draw.line(btn_surf, accent_color, (0, 0), (corner_len, 0), 2)
             pygame.draw.line(btn_surf, accent_color, (0, 0), (0, corner_len), 2)
             # Нижний правый
-            w, h = self.rect.width, self.rect.height
             pygame.draw.line(btn_surf, accent_color, (w, h), (w-corner_len, h), 2)
             pygame.draw.line(btn_surf, accent_color, (w, h), (w, h-corner_len), 2)
         
-        surface.blit(btn_surf, self.rect)
-        
         # 3. Рисуем содержимое
+        local_rect = btn_surf.get_rect()
+        icon_color = accent_color if highlighted else (200, 200, 200)
         if self.icon == 'wrench':
-            self._draw_wrench_icon(surface, accent_color if self.is_hovered else (200, 200, 200))
+            self._draw_wrench_icon(btn_surf, icon_color, local_rect)
         elif not self.text:
-            self._draw_pause_icon(surface, accent_color if self.is_hovered else (200, 200, 200))
+            self._draw_pause_icon(btn_surf, icon_color, local_rect)
         else:
-            # Текст с опциональным свечением
-            text_surf = self.font.render(self.text, True, text_color)
-            text_rect = text_surf.get_rect(center=self.rect.center)
-            surface.blit(text_surf, text_rect)
+            text_surf = SURFACES.new(self.font.render(self.text, True, text_color))
+            btn_surf.blit(text_surf, text_surf.get_rect(center=local_rect.center))
+
+        out.blit(btn_surf, (0, body_y))
+        return out
             
-    def _draw_pause_icon(self, surface, color):
+    def _draw_pause_icon(self, surface, color, rect):
         bar_width = 4
-        bar_height = self.rect.height // 2.5
+        bar_height = rect.height // 2.5
         bar_spacing = 5
-        center_x = self.rect.centerx
-        center_y = self.rect.centery
+        center_x = rect.centerx
+        center_y = rect.centery
         
         left_bar = pygame.Rect(center_x - bar_spacing - bar_width, center_y - bar_height // 2, bar_width, bar_height)
         right_bar = pygame.Rect(center_x + bar_spacing, center_y - bar_height // 2, bar_width, bar_height)
@@ -124,10 +168,10 @@ class Button:
         pygame.draw.rect(surface, color, left_bar, border_radius=2)
         pygame.draw.rect(surface, color, right_bar, border_radius=2)
 
-    def _draw_wrench_icon(self, surface, color):
+    def _draw_wrench_icon(self, surface, color, rect):
         # Рисуем простой гаечный ключ
-        cx, cy = self.rect.centerx, self.rect.centery
-        size = self.rect.width // 2.5
+        cx, cy = rect.centerx, rect.centery
+        size = rect.width // 2.5
         
         # Рукоятка (диагональная линия)
         start = (cx - size//2, cy + size//2)
@@ -159,6 +203,9 @@ class Slider:
         self._update_handle_pos()
         
         self.font = RESOURCES.get_font(SETTINGS.FONTS['main'], SETTINGS.FONTS['size_medium'])
+        # Подпись значения перерисовывается только при смене процента
+        self._label_key = None
+        self._label_surf = None
         
     def _update_handle_pos(self):
         # Преобразуем значение в позицию X
@@ -202,7 +249,9 @@ class Slider:
         pygame.draw.rect(surface, (200, 200, 200), self.handle_rect, border_radius=5)
         
         # Рисуем текст значения
-        val_text = f"{int(self.val * 100)}%"
-        text_surf = self.font.render(val_text, True, SETTINGS.COLORS['ui_text'])
-        text_rect = text_surf.get_rect(midleft=(self.rect.right + 10, self.rect.centery))
-        surface.blit(text_surf, text_rect)
+        label_key = int(self.val * 100)
+        if label_key != self._label_key:
+            self._label_surf = SURFACES.new(self.font.render(f"{label_key}%", True, SETTINGS.COLORS['ui_text']))
+            self._label_key = label_key
+        text_rect = self._label_surf.get_rect(midleft=(self.rect.right + 10, self.rect.centery))
+        surface.blit(self._label_surf, text_rect)
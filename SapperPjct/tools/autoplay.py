@@ -0,0 +1,108 @@
+# Массовый автопрогон партий решателем для оценки сложности.
+#
+# Запуск из папки SapperPjct:
+#   python tools/autoplay.py --games 1000
+#   python tools/autoplay.py --games 5000 --cases hard campaign-10 --workers 32 --output autoplay.json
+#
+# Наборы: пресеты easy/medium/hard из game_config.json и уровни кампании
+# campaign-1..campaign-10 (5 + level*2 клеток по стороне, 15% мин).
+# Пресеты больше DEFAULT_MAX_CELLS клеток (huge) прогоняются только явно: --cases huge.
+# Партии с зернами seed..seed+games-1 делятся на пачки и раздаются процессам
+# (по умолчанию - по одному на ядро). Решатель и ядро не используют pygame.
+import os
+import sys
+import json
+import time
+import argparse
+import statistics
+from concurrent.futures import ProcessPoolExecutor
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from src.config.settings import SETTINGS
+from src.core.minesweeper import MinesweeperCore, campaign_level, CAMPAIGN_MAX_LEVEL
+from src.core.solver import Solver
+
+# Самое большое поле в наборах по умолчанию: партия на huge (миллион клеток) решается минутами
+DEFAULT_MAX_CELLS = 10000
+
+def get_cases(only=None):
+    cases = {}
+    for name, cfg in SETTINGS.game_config['difficulty_levels'].items():
+        cases[name] = (cfg['rows'], cfg['cols'], cfg['mines'])
+    for level in range(1, CAMPAIGN_MAX_LEVEL + 1):
+        cases[f'campaign-{level}'] = campaign_level(level)
+    if only:
+        return {name: cases[name] for name in only}
+    return {name: case for name, case in cases.items() if case[0] * case[1] <= DEFAULT_MAX_CELLS}
+
+
+def play_batch(task):
+    # Выполняется в рабочем процессе: пачка партий одного набора
+    name, rows, cols, mines, seeds = task
+    results = []
+    for seed in seeds:
+        core = MinesweeperCore(rows, cols, mines, seed=seed)
+        result = Solver(core, seed=seed).solve()
+        result['seed'] = seed
+        results.append(result)
+    return name, results
+
+
+def summarize(results):
+    wins = sum(1 for r in results if r['win'])
+    times = [r['time_ms'] for r in results]
+    guesses = [r['guesses'] for r in results]
+    return {
+        'games': len(results),
+        'win_rate': wins / len(results),
+        'guesses_mean': statistics.mean(guesses),
+        'no_guess_rate': sum(1 for g in guesses if g == 0) / len(results),
+        'solve_ms_median': statistics.median(times),
+        'solve_ms_p95': sorted(times)[int(0.95 * (len(times) - 1))],
+        'solve_ms_max': max(times),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Автопрогон партий решателем по наборам сложности")
+    parser.add_argument('--games', type=int, default=500, help="партий на набор")
+    parser.add_argument('--seed', type=int, default=0, help="первое зерно")
+    parser.add_argument('--workers', type=int, default=os.cpu_count(), help="число процессов")
+    parser.add_argument('--batch', type=int, default=50, help="партий в одной задаче процесса")
+    parser.add_argument('--cases', nargs='*', help="только эти наборы (например, easy campaign-3)")
+    parser.add_argument('--output', help="куда записать сводку (JSON)")
+    args = parser.parse_args()
+
+    cases = get_cases(args.cases)
+    tasks = []
+    for name, (rows, cols, mines) in cases.items():
+        for start in range(args.seed, args.seed + args.games, args.batch):
+            seeds = list(range(start, min(start + args.batch, args.seed + args.games)))
+            tasks.append((name, rows, cols, mines, seeds))
+
+    started = time.perf_counter()
+    results = {name: [] for name in cases}
+    with ProcessPoolExecutor(max_workers=args.workers) as pool:
+        for name, batch in pool.map(play_batch, tasks):
+            results[name].extend(batch)
+    elapsed = time.perf_counter() - started
+
+    summary = {}
+    print(f"{'case':<14}{'size':>10}{'games':>7}{'win':>8}{'no-guess':>10}{'guesses':>9}{'median':>10}{'p95':>10}")
+    for name, (rows, cols, mines) in cases.items():
+        stats = summarize(results[name])
+        stats.update({'rows': rows, 'cols': cols, 'mines': mines})
+        summary[name] = stats
+        size = f"{rows}x{cols}/{mines}"
+        print(f"{name:<14}{size:>10}{stats['games']:>7}{stats['win_rate']:>8.1%}{stats['no_guess_rate']:>10.1%}"
+              f"{stats['guesses_mean']:>9.2f}{stats['solve_ms_median']:>8.2f}ms{stats['solve_ms_p95']:>8.2f}ms")
+    print(f"Всего: {sum(len(r) for r in results.values())} партий за {elapsed:.1f} с, процессов: {args.workers}")
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump({'games': args.games, 'seed': args.seed, 'elapsed_s': elapsed, 'results': summary}, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,201 @@
+# Микробенчмарки операций доски.
+#
+# Запуск из папки SapperPjct:
+#   python tools/bench_board.py --output bench.json
+#   python tools/bench_board.py --compare bench.json --threshold 0.2
+#
+# Пресеты easy/medium/hard/huge берутся из game_config.json, плюс синтетическая доска
+# 100x100 (15% мин). Окно не создается: используется видеодрайвер SDL dummy.
+import os
+import sys
+import json
+import time
+import argparse
+import platform
+import statistics
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+import pygame
+import numpy as np
+
+from src.config.settings import SETTINGS
+from src.objects.board import Board
+from src.objects.cell import Cell
+
+SEED = 12345
+
+
+def get_cases(only=None):
+    cases = {}
+    for name, cfg in SETTINGS.game_config['difficulty_levels'].items():
+        cases[name] = (cfg['rows'], cfg['cols'], cfg['mines'])
+    cases['100x100'] = (100, 100, 1500)
+    if only:
+        cases = {name: cases[name] for name in only}
+    return cases
+
+
+def measure(func, setup=None, repeat=5, number=None):
+    # Возвращает времена одного вызова в мс; подготовка (setup) в замер не входит.
+    # Без setup быстрые вызовы повторяются, пока замер не займет хотя бы ~5 мс.
+    if number is None:
+        number = 1
+        if setup is None:
+            start = time.perf_counter()
+            func(None)
+            once = time.perf_counter() - start
+            number = max(1, min(10000, int(0.005 / max(once, 1e-7))))
+    times = []
+    for _ in range(repeat):
+        arg = setup() if setup else None
+        start = time.perf_counter()
+        for _ in range(number):
+            func(arg)
+        times.append((time.perf_counter() - start) * 1000 / number)
+    return {
+        'median_ms': statistics.median(times),
+        'min_ms': min(times),
+        'max_ms': max(times),
+        'repeat': repeat,
+        'number': number,
+    }
+
+
+def placed_board(rows, cols, mines):
+    board = Board(rows, cols, mines, 0, 0, seed=SEED)
+    board._place_mines(rows // 2, cols // 2)
+    return board
+
+
+def bench_case(rows, cols, mines, surface):
+    area = rows * cols
+    repeat = 3 if area >= 10**6 else 7
+    # Замеры с подготовкой выполняются по одному вызову, поэтому их повторяем чаще
+    setup_repeat = 3 if area >= 10**6 else 25
+    results = {}
+
+    results['construct'] = measure(lambda _: Board(rows, cols, mines, 0, 0, seed=SEED), repeat=repeat)
+
+    results['place_mines'] = measure(
+        lambda board: board._place_mines(rows // 2, cols // 2),
+        setup=lambda: Board(rows, cols, mines, 0, 0, seed=SEED), repeat=setup_repeat)
+
+    # Подсчет соседей одной клетки, усредненный по выборке клеток
+    board = placed_board(rows, cols, mines)
+    rng = np.random.default_rng(SEED)
+    sample = list(zip(rng.integers(0, rows, 1000).tolist(), rng.integers(0, cols, 1000).tolist()))
+
+    def count_all(_):
+        for r, c in sample:
+            board._count_neighbors(r, c)
+    timing = measure(count_all, repeat=repeat)
+    for key in ('median_ms', 'min_ms', 'max_ms'):
+        timing[key] /= len(sample)
+    results['count_neighbors'] = timing
+
+    # Открытие одной клетки с цифрой (без заливки)
+    def numbered_board():
+        board = placed_board(rows, cols, mines)
+        candidates = np.argwhere((board.neighbor_mines > 0) & ~board.is_mine & ~board.is_open)
+        r, c = (int(v) for v in candidates[len(candidates) // 2])
+        return board, Cell(board, r, c)
+    results['reveal_single'] = measure(lambda arg: arg[0]._reveal(arg[1]), setup=numbered_board, repeat=setup_repeat)
+
+    # Худший случай заливки: доска без мин открывается целиком одним кликом
+    def empty_board():
+        board = Board(rows, cols, 0, 0, 0, seed=SEED)
+        return board, Cell(board, rows // 2, cols // 2)
+    results['flood_fill_empty'] = measure(lambda arg: arg[0]._reveal(arg[1]), setup=empty_board, repeat=setup_repeat)
+
+    results['check_win'] = measure(lambda _: board._check_win(), repeat=repeat)
+
+    # Полная отрисовка доски (все клетки, включая вышедшие за экран)
+    board.update_layout(0, 0, SETTINGS.LAYOUT['cell_size'])
+    board.is_open[:rows // 2] = True
+    results['draw'] = measure(lambda _: board.draw(surface), repeat=repeat)
+
+    # Отрисовка через камеру: видимая часть из кэша кусков, затем прокрутка туда-обратно
+    board.set_view(surface.get_rect(), SETTINGS.LAYOUT['cell_size'])
+    board.draw(surface)
+    results['draw_view'] = measure(lambda _: board.draw(surface), repeat=repeat)
+    step = [24]
+
+    def pan_and_draw(_):
+        step[0] = -step[0]
+        board.pan(step[0], step[0])
+        board.draw(surface)
+    results['pan_view'] = measure(pan_and_draw, repeat=repeat)
+
+    return results
+
+
+def compare(current, baseline, threshold, min_delta_ms):
+    regressions = []
+    print(f"{'case':<12}{'benchmark':<20}{'baseline':>12}{'current':>12}{'ratio':>9}")
+    for case, benches in current['results'].items():
+        for name, timing in benches.items():
+            base = baseline.get('results', {}).get(case, {}).get(name)
+            if not base:
+                continue
+            ratio = timing['median_ms'] / base['median_ms'] if base['median_ms'] else 1.0
+            flag = ''
+            # Совсем короткие замеры шумят: мелкие абсолютные разницы не считаем замедлением
+            if ratio > 1 + threshold and timing['median_ms'] - base['median_ms'] > min_delta_ms:
+                flag = '  REGRESSION'
+                regressions.append((case, name, ratio))
+            print(f"{case:<12}{name:<20}{base['median_ms']:>10.3f}ms{timing['median_ms']:>10.3f}ms{ratio:>8.2f}x{flag}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Бенчмарки операций Board")
+    parser.add_argument('--output', help="куда записать результаты (JSON)")
+    parser.add_argument('--compare', help="сохраненный JSON для сравнения")
+    parser.add_argument('--threshold', type=float, default=0.2, help="допустимое замедление (0.2 = +20%%)")
+    parser.add_argument('--min-delta-ms', type=float, default=0.05, help="минимальная разница в мс, чтобы считать замедлением")
+    parser.add_argument('--cases', nargs='*', help="только эти наборы (например, easy 100x100)")
+    args = parser.parse_args()
+
+    pygame.init()
+    surface = pygame.display.set_mode((SETTINGS.WIDTH, SETTINGS.HEIGHT))
+
+    current = {
+        'meta': {
+            'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'python': platform.python_version(),
+            'pygame': pygame.version.ver,
+            'numpy': np.__version__,
+            'machine': platform.machine(),
+        },
+        'results': {},
+    }
+    for name, (rows, cols, mines) in get_cases(args.cases).items():
+        print(f"{name}: {rows}x{cols}, {mines} мин...")
+        current['results'][name] = bench_case(rows, cols, mines, surface)
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(current, f, indent=2)
+
+    exit_code = 0
+    if args.compare:
+        with open(args.compare, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+        regressions = compare(current, baseline, args.threshold, args.min_delta_ms)
+        if regressions:
+            print(f"Замедлений: {len(regressions)}")
+            exit_code = 1
+    else:
+        for case, benches in current['results'].items():
+            for name, timing in benches.items():
+                print(f"{case:<12}{name:<20}{timing['median_ms']:>10.3f}ms")
+
+    pygame.quit()
+    sys.exit(exit_code)
+
+
+if __name__ == "__main__":
+    main()
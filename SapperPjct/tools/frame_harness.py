@@ -0,0 +1,226 @@
+# Сквозной замер времени кадра со скриптовым вводом.
+#
+# Запускает Game без окна (видеодрайвер SDL dummy), проходит по сценам
+# LoadingScene -> MenuScene -> GameScene -> PauseScene -> GameOverScene, подавая синтетические
+# события pygame, и для каждого кадра записывает время _handle_events, _update, _draw и вывода на экран.
+# В конце печатает p50/p95/p99 и худший кадр по каждой сцене.
+# Сохранения и история партий пишутся во временную папку, а не в data/ игрока.
+#
+# Запуск из папки SapperPjct:
+#   python tools/frame_harness.py
+#   python tools/frame_harness.py --script my_script.json --output frames.json --fps 0
+#
+# Скрипт - JSON-список шагов:
+#   {"frames": 30}                             - прогнать N кадров без ввода
+#   {"click": "SINGLE PLAYER"}                 - нажать кнопку сцены по тексту
+#   {"click_cell": [0, 4, 4], "button": 1}     - клик по клетке (доска, строка, столбец)
+#   {"click_mine": 0}                          - клик по мине на доске (проигрыш)
+#   {"key": "ESCAPE"}                          - нажать клавишу (имя из pygame.K_*)
+#   {"resize": [1024, 600]}                    - изменить размер окна
+#   {"wait_scene": "GameOverScene", "max_ms": 10000} - ждать смены сцены (не дольше max_ms по часам:
+#                                              эффекты сцен идут по pygame.time.get_ticks(), а не по кадрам)
+import os
+import sys
+import json
+import time
+import argparse
+import tempfile
+import statistics
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+import pygame
+import numpy as np
+
+from src.engine.game import Game
+from src.engine.perf_monitor import PHASES
+from src.engine.save_manager import SAVE_MANAGER
+
+DEFAULT_SCRIPT = [
+    {"wait_scene": "MenuScene"},
+    {"frames": 60},
+    {"click": "SINGLE PLAYER"},
+    {"frames": 30},
+    {"click_cell": [0, 4, 4], "button": 1},
+    {"frames": 30},
+    {"click_cell": [0, 0, 0], "button": 3},
+    {"frames": 30},
+    {"key": "ESCAPE"},
+    {"frames": 60},
+    {"key": "ESCAPE"},
+    {"frames": 30},
+    {"resize": [1024, 600]},
+    {"frames": 30},
+    {"key": "F11"},
+    {"frames": 30},
+    {"key": "F11"},
+    {"frames": 30},
+    {"click_mine": 0},
+    {"wait_scene": "GameOverScene"},
+    {"frames": 60},
+    {"click": "Menu"},
+    {"frames": 60},
+]
+
+
+class FrameHarness:
+    def __init__(self, fps):
+        self.fps = fps
+        # Сыгранные скриптом партии не должны попасть в scores.db игрока
+        self.data_dir = tempfile.TemporaryDirectory(prefix='frame_harness_')
+        SAVE_MANAGER.data_dir = self.data_dir.name
+        SAVE_MANAGER.game_file = os.path.join(self.data_dir.name, 'savegame.bin')
+        SAVE_MANAGER.scores_file = os.path.join(self.data_dir.name, 'highscores.json')
+        self.game = Game()
+        self.records = []
+        # У драйвера dummy нет настоящего курсора, поэтому сцены получают позицию
+        # виртуального курсора, которую двигает скрипт
+        self.cursor = (0, 0)
+        pygame.mouse.get_pos = lambda: self.cursor
+
+        # Как в main.py: сначала предзагрузка ресурсов
+        from src.scenes.loading_scene import LoadingScene
+        self.game.state_manager.change_state(LoadingScene(self.game))
+
+    @property
+    def scene(self):
+        return self.game.state_manager.state
+
+    def frame(self):
+        if self.fps:
+            self.game.clock.tick(self.fps)
+        name = type(self.scene).__name__
+        self.game.step()
+        self.records.append(dict(self.game.frame_times, scene=name))
+
+    def frames(self, n):
+        for _ in range(n):
+            self.frame()
+
+    def post(self, event_type, **attrs):
+        pygame.event.post(pygame.event.Event(event_type, **attrs))
+
+    def click_at(self, pos, button=1):
+        # Наведение обрабатывается в update, поэтому сначала кадр с курсором над целью
+        self.cursor = pos
+        self.post(pygame.MOUSEMOTION, pos=pos, rel=(0, 0), buttons=(0, 0, 0))
+        self.frame()
+        self.post(pygame.MOUSEBUTTONDOWN, pos=pos, button=button)
+        self.post(pygame.MOUSEBUTTONUP, pos=pos, button=button)
+        self.frame()
+
+    def run_step(self, step):
+        if 'frames' in step:
+            self.frames(step['frames'])
+        elif 'click' in step:
+            buttons = getattr(self.scene, 'buttons', [])
+            matches = [btn for btn in buttons if btn.text == step['click']]
+            if not matches:
+                raise RuntimeError(f"Кнопка {step['click']!r} не найдена в {type(self.scene).__name__}")
+            self.click_at(matches[0].rect.center)
+        elif 'click_cell' in step:
+            index, row, col = step['click_cell']
+            board = self.scene.boards[index]
+            self.click_at(board.cells[row][col].rect.center, step.get('button', 1))
+        elif 'click_mine' in step:
+            board = self.scene.boards[step['click_mine']]
+            row, col = (int(v) for v in np.argwhere(board.is_mine & ~board.is_flagged)[0])
+            self.click_at(board.cells[row][col].rect.center)
+        elif 'key' in step:
+            key = getattr(pygame, 'K_' + step['key'])
+            self.post(pygame.KEYDOWN, key=key, mod=0, unicode='', scancode=0)
+            self.post(pygame.KEYUP, key=key, mod=0, unicode='', scancode=0)
+            self.frame()
+        elif 'resize' in step:
+            w, h = step['resize']
+            self.post(pygame.VIDEORESIZE, w=w, h=h, size=(w, h))
+            self.frame()
+        elif 'wait_scene' in step:
+            deadline = time.perf_counter() + step.get('max_ms', 10000) / 1000
+            while type(self.scene).__name__ != step['wait_scene']:
+                if time.perf_counter() > deadline:
+                    raise RuntimeError(f"Сцена {step['wait_scene']} так и не появилась")
+                self.frame()
+        else:
+            raise ValueError(f"Неизвестный шаг: {step}")
+
+    def run(self, script):
+        for step in script:
+            self.run_step(step)
+        return self.records
+
+    def close(self):
+        # Дописываем фоновые записи и удаляем временную папку с данными
+        SAVE_MANAGER.flush()
+        self.data_dir.cleanup()
+
+
+def percentile(values, p):
+    ordered = sorted(values)
+    k = (len(ordered) - 1) * p / 100
+    lo = int(k)
+    hi = min(lo + 1, len(ordered) - 1)
+    return ordered[lo] + (ordered[hi] - ordered[lo]) * (k - lo)
+
+
+def summarize(records):
+    summary = {}
+    scenes = []
+    for record in records:
+        if record['scene'] not in scenes:
+            scenes.append(record['scene'])
+    for scene in scenes:
+        frames = [r for r in records if r['scene'] == scene]
+        stats = {'frames': len(frames)}
+        for phase in PHASES + ('total',):
+            if phase == 'total':
+                values = [sum(r[p] for p in PHASES) for r in frames]
+            else:
+                values = [r[phase] for r in frames]
+            stats[phase] = {
+                'p50': statistics.median(values),
+                'p95': percentile(values, 95),
+                'p99': percentile(values, 99),
+                'worst': max(values),
+            }
+        summary[scene] = stats
+    return summary
+
+
+def print_summary(summary):
+    print(f"{'scene':<18}{'phase':<8}{'frames':>7}{'p50':>9}{'p95':>9}{'p99':>9}{'worst':>9}  (мс)")
+    for scene, stats in summary.items():
+        for phase in PHASES + ('total',):
+            s = stats[phase]
+            print(f"{scene:<18}{phase:<8}{stats['frames']:>7}{s['p50']:>9.2f}{s['p95']:>9.2f}{s['p99']:>9.2f}{s['worst']:>9.2f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Замер времени кадра по сценам со скриптовым вводом")
+    parser.add_argument('--script', help="JSON-файл со сценарием (по умолчанию встроенный)")
+    parser.add_argument('--output', help="куда записать сводку и все кадры (JSON)")
+    parser.add_argument('--fps', type=int, default=60, help="ограничение кадров; 0 - без ограничения")
+    args = parser.parse_args()
+
+    script = DEFAULT_SCRIPT
+    if args.script:
+        with open(args.script, 'r', encoding='utf-8') as f:
+            script = json.load(f)
+
+    harness = FrameHarness(args.fps)
+    records = harness.run(script)
+    summary = summarize(records)
+    print_summary(summary)
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump({'summary': summary, 'frames': records}, f, indent=2)
+
+    harness.close()
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()